@@ -0,0 +1,564 @@
+#!/usr/bin/env python3
+"""Benchmark the submission render/validate/meta pipeline and an offline end-to-end run."""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+
+import create_submission_pr as submission
+
+DEFAULT_SIZES = (100, 1000, 10000)
+DEFAULT_E2E_MODES = ("default", "fast-checkout", "plumbing-commit", "mirror-cache")
+BENCH_LOGIN = "bench"
+
+# Stand-in for the gh CLI: answers the calls create_submission_pr.py makes, backed by bare
+# repositories under $BENCH_GH_ROOT (the same tree GitHub URLs are rewritten to). Every
+# ``pr create`` is logged to pr-calls.jsonl; $BENCH_GH_FAIL_PR makes it fail after logging.
+FAKE_GH_SCRIPT = r'''#!/usr/bin/env python3
+import json, os, subprocess, sys
+from pathlib import Path
+
+root = Path(os.environ["BENCH_GH_ROOT"])
+login = os.environ.get("BENCH_GH_LOGIN", "bench")
+args = sys.argv[1:]
+if args[:1] == ["--version"]:
+    print("gh version 0.0.0 (benchmark shim)")
+elif args[:2] == ["auth", "status"]:
+    print(f"Logged in to github.com account {login}")
+elif args[:2] == ["auth", "token"]:
+    sys.exit(1)
+elif args[:2] == ["api", "user"]:
+    print(login)
+elif args[:2] == ["repo", "view"]:
+    sys.exit(0 if (root / f"{args[2]}.git").exists() else 1)
+elif args[:2] == ["repo", "fork"]:
+    source = root / f"{args[2]}.git"
+    target = root / login / source.name
+    if not target.exists():
+        subprocess.run(["git", "clone", "--quiet", "--bare", str(source), str(target)], check=True)
+elif args[:2] == ["pr", "list"]:
+    print("")
+elif args[:2] == ["pr", "create"]:
+    with (root / "pr-calls.jsonl").open("a", encoding="utf-8") as log:
+        log.write(json.dumps(args[2:], ensure_ascii=False) + "\n")
+    if os.environ.get("BENCH_GH_FAIL_PR"):
+        print("pull request create failed: simulated outage", file=sys.stderr)
+        sys.exit(1)
+    counter = root / "pr-counter"
+    number = int(counter.read_text() or "0") + 1 if counter.exists() else 1
+    counter.write_text(str(number))
+    repo = args[args.index("--repo") + 1]
+    print(f"https://github.com/{repo}/pull/{number}")
+else:
+    print(f"benchmark gh shim: unsupported command {args}", file=sys.stderr)
+    sys.exit(1)
+'''
+
+HANGUL_FIRST = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+
+def korean_words(rng: random.Random, count: int) -> str:
+    words = []
+    for _ in range(count):
+        length = rng.randint(2, 4)
+        words.append("".join(chr(rng.randint(HANGUL_FIRST, HANGUL_LAST)) for _ in range(length)))
+    return " ".join(words)
+
+
+def korean_paragraphs(rng: random.Random, paragraphs: int, words_per_paragraph: int) -> str:
+    return "\n\n".join(
+        korean_words(rng, words_per_paragraph) + "." for _ in range(paragraphs)
+    )
+
+
+def synthetic_submission(rng: random.Random, index: int) -> Dict[str, str]:
+    """Return one submission with realistically long Korean free-text fields."""
+    team = f"팀 {korean_words(rng, 1)} {index}"
+    return {
+        "team_name": team,
+        "project_name": f"{korean_words(rng, 2)} Project {index}",
+        "repo_url": f"https://github.com/bench-team-{index}/project-{index}",
+        "demo_url_or_run_method": korean_paragraphs(rng, 2, 40),
+        "problem_definition": korean_paragraphs(rng, 4, 80),
+        "one_liner": korean_words(rng, 12),
+        "team_roles": "\n".join(f"- {korean_words(rng, 1)}: {korean_words(rng, 6)}" for _ in range(4)),
+        "solution": korean_paragraphs(rng, 4, 80),
+        "tech_stack": "Next.js, TypeScript, Python, OpenRouter, Supabase",
+        "run_verify": korean_paragraphs(rng, 2, 50),
+        "demo_summary": korean_paragraphs(rng, 3, 60),
+        "license_sources": korean_words(rng, 20),
+        "ai_used": submission.AI_USED_CHOICES[index % 2],
+        "ai_validation_notes": korean_paragraphs(rng, 2, 40),
+        "presentation_url": f"https://example.com/slides/{index}",
+        "extra_links": f"- https://example.com/{index}/a\n- https://example.com/{index}/b",
+    }
+
+
+def synthetic_cohort(size: int, seed: int) -> List[Dict[str, str]]:
+    rng = random.Random(seed)
+    return [synthetic_submission(rng, index) for index in range(size)]
+
+
+def best_of(repeat: int, func: Callable[[], None]) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def micro_result(name: str, size: int, seconds: float) -> Dict[str, object]:
+    return {
+        "name": name,
+        "size": size,
+        "seconds": round(seconds, 6),
+        "per_item_us": round(seconds / size * 1_000_000, 3),
+    }
+
+
+def run_micro_benchmarks(sizes: Sequence[int], *, seed: int, repeat: int) -> List[Dict[str, object]]:
+    skill_root = Path(submission.__file__).resolve().parents[1]
+    template = submission.load_template(skill_root)
+    results: List[Dict[str, object]] = []
+    for size in sizes:
+        cohort = synthetic_cohort(size, seed)
+        replacements = [submission.build_replacements(**fields) for fields in cohort]
+        documents = [submission.render_template(template, item) for item in replacements]
+
+        def bench_slugify() -> None:
+            for fields in cohort:
+                submission.slugify(fields["team_name"])
+                submission.slugify(fields["project_name"])
+
+        def bench_render() -> None:
+            for item in replacements:
+                submission.render_template(template, item)
+
+        def bench_parse() -> None:
+            for document in documents:
+                submission.parse_frontmatter(document)
+
+        def bench_validate() -> None:
+            for document in documents:
+                submission.validate_document(document)
+
+        results.append(micro_result("slugify", size, best_of(repeat, bench_slugify)))
+        results.append(micro_result("render_template", size, best_of(repeat, bench_render)))
+        results.append(micro_result("parse_frontmatter", size, best_of(repeat, bench_parse)))
+        results.append(micro_result("validate_document", size, best_of(repeat, bench_validate)))
+
+        # One meta.json per level like a real cohort: the shared vibe-coding/meta.json grows
+        # with every team. Updates are coalesced in a MetaTree and flushed once, as in a batch.
+        with tempfile.TemporaryDirectory(prefix="hackathon-submission-bench-meta-") as temp:
+            root = Path(temp)
+
+            def bench_meta() -> None:
+                shutil.rmtree(root / "contents", ignore_errors=True)
+                tree = submission.MetaTree.on_disk(root)
+                for fields in cohort:
+                    tree.add_submission(
+                        team_name=fields["team_name"],
+                        project_name=fields["project_name"],
+                        team_slug=submission.slugify(fields["team_name"]),
+                        project_slug=submission.slugify(fields["project_name"]),
+                    )
+                tree.flush(root)
+
+            results.append(micro_result("meta_tree", size, best_of(1, bench_meta)))
+        print(f"[OK] Micro benchmarks finished for {size} submissions.", file=sys.stderr)
+    return results
+
+
+def git(*args: str, cwd: Optional[Path] = None) -> None:
+    subprocess.run(["git", *args], cwd=str(cwd) if cwd else None, check=True, capture_output=True)
+
+
+def build_offline_github(root: Path) -> Dict[str, str]:
+    """Create a local upstream bare repo and gh shim; return the env that routes to them."""
+    owner, name = submission.DEFAULT_TARGET_REPO.split("/")
+    seed_tree = root / "seed"
+    docs = seed_tree / "contents" / "docs"
+    docs.mkdir(parents=True)
+    submission.write_json(docs / "meta.json", {"title": "해카톤 문서", "pages": ["overview"]})
+    (docs / "overview.mdx").write_text("---\ntitle: Overview\n---\n\n본문\n", encoding="utf-8")
+    (seed_tree / "README.md").write_text("# benchmark upstream\n", encoding="utf-8")
+    git("init", "--quiet", "--initial-branch", submission.DEFAULT_BASE_BRANCH, cwd=seed_tree)
+    git("add", "-A", cwd=seed_tree)
+    git("-c", "user.name=bench", "-c", "user.email=bench@example.com", "commit", "--quiet", "-m", "seed", cwd=seed_tree)
+
+    upstream = root / owner / f"{name}.git"
+    upstream.parent.mkdir(parents=True)
+    git("clone", "--quiet", "--bare", str(seed_tree), str(upstream))
+    git("config", "uploadpack.allowFilter", "true", cwd=upstream)
+
+    bin_dir = root / "bin"
+    bin_dir.mkdir()
+    shim = bin_dir / "gh"
+    shim.write_text(FAKE_GH_SCRIPT, encoding="utf-8")
+    shim.chmod(0o755)
+
+    git_config = {
+        f"url.{root.as_uri()}/.insteadOf": "https://github.com/",
+        "user.name": "Benchmark",
+        "user.email": "bench@example.com",
+        "protocol.file.allow": "always",
+    }
+    env = {
+        "PATH": f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}",
+        "BENCH_GH_ROOT": str(root),
+        "BENCH_GH_LOGIN": BENCH_LOGIN,
+        "GIT_CONFIG_COUNT": str(len(git_config)),
+        "GIT_TERMINAL_PROMPT": "0",
+    }
+    for index, (key, value) in enumerate(git_config.items()):
+        env[f"GIT_CONFIG_KEY_{index}"] = key
+        env[f"GIT_CONFIG_VALUE_{index}"] = value
+    return env
+
+
+@contextlib.contextmanager
+def patched_environ(values: Dict[str, str]) -> Iterator[None]:
+    previous = {key: os.environ.get(key) for key in values}
+    os.environ.update(values)
+    for key in ("GH_TOKEN", "GITHUB_TOKEN"):
+        previous.setdefault(key, os.environ.pop(key, None))
+    try:
+        yield
+    finally:
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def mode_flags(mode: str) -> List[str]:
+    return {
+        "default": [],
+        "fast-checkout": ["--fast-checkout"],
+        "plumbing-commit": ["--plumbing-commit"],
+        "mirror-cache": ["--mirror-cache"],
+    }[mode]
+
+
+def run_e2e_benchmarks(modes: Sequence[str], *, runs: int, seed: int) -> List[Dict[str, object]]:
+    results: List[Dict[str, object]] = []
+    with tempfile.TemporaryDirectory(prefix="hackathon-submission-bench-e2e-") as temp:
+        root = Path(temp)
+        env = build_offline_github(root / "github")
+        cohort = synthetic_cohort(runs * len(modes), seed)
+        with patched_environ(env):
+            for mode_index, mode in enumerate(modes):
+                durations: List[float] = []
+                phases: Dict[str, List[float]] = {}
+                for run_index in range(runs):
+                    fields = cohort[mode_index * runs + run_index]
+                    timings_path = root / f"timings-{mode}-{run_index}.json"
+                    argv = [f"--{name.replace('_', '-')}={value}" for name, value in fields.items()]
+                    argv += [
+                        "--use-gh-cli",
+                        f"--cache-dir={root / 'cache'}",
+                        f"--timings-json={timings_path}",
+                        *mode_flags(mode),
+                    ]
+                    started = time.perf_counter()
+                    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()) as err:
+                        exit_code = submission.main(argv)
+                    durations.append(time.perf_counter() - started)
+                    if exit_code != 0:
+                        raise RuntimeError(f"End-to-end run failed in mode {mode}:\n{err.getvalue()}")
+                    trace = json.loads(timings_path.read_text(encoding="utf-8"))
+                    for row in trace["summary"]:
+                        if row["kind"] == "phase":
+                            phases.setdefault(str(row["name"]), []).append(float(row["total_seconds"]))
+                results.append(
+                    {
+                        "mode": mode,
+                        "runs": runs,
+                        "median_seconds": round(statistics.median(durations), 6),
+                        "min_seconds": round(min(durations), 6),
+                        "max_seconds": round(max(durations), 6),
+                        "phase_median_seconds": {
+                            name: round(statistics.median(values), 6) for name, values in sorted(phases.items())
+                        },
+                    }
+                )
+                print(f"[OK] End-to-end benchmark finished for mode {mode}.", file=sys.stderr)
+    return results
+
+
+def expect(condition: bool, message: str) -> None:
+    if not condition:
+        raise AssertionError(message)
+
+
+def git_output(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=str(repo), check=True, capture_output=True, text=True, encoding="utf-8"
+    ).stdout
+
+
+def check_document_issues(seed: int) -> None:
+    """A rendered document is valid; each broken rule is reported, all of them at once."""
+    document = submission.render_submission(**synthetic_cohort(1, seed)[0])
+    expect(not submission.document_issues(document), "a freshly rendered document has issues")
+
+    def messages(text: str) -> List[str]:
+        return [issue.message for issue in submission.document_issues(text)]
+
+    stack, checklist = "## 기술 스택", "## 제출 체크리스트"
+    missing = messages(document.replace(f"{stack}\n", "\n").replace(f"{checklist}\n", "\n"))
+    expect(
+        f"Missing required section: {stack}" in missing and f"Missing required section: {checklist}" in missing,
+        f"two removed sections are not both reported: {missing}",
+    )
+    expect(not messages(document.replace(f"{stack}\n", f"{stack} (Tech)\n")), "a suffixed heading is rejected")
+    fenced = document.replace(f"{stack}\n", "```\n" + f"{stack}\n" + "```\n")
+    expect(f"Missing required section: {stack}" in messages(fenced), "a heading inside a code fence counts")
+    body = document.split("\n---\n", 1)[1]
+    expect(bool(messages(f"---\n---\n{body}")), "an empty frontmatter block is accepted")
+
+
+def check_meta_tree() -> None:
+    """Navigation entries are added once per level, and re-adding them changes nothing."""
+    files: Dict[str, Optional[str]] = {
+        "contents/docs/meta.json": submission.dump_json({"title": "해카톤 문서", "pages": ["overview"]})
+    }
+    tree = submission.MetaTree(lambda path: files.get(path))
+    for project_slug in ("p", "q", "p"):
+        tree.add_submission(team_name="팀 A", project_name=project_slug.upper(), team_slug="팀-a", project_slug=project_slug)
+    dirty = tree.dirty_files()
+    pages = {path: json.loads(content)["pages"] for path, content in dirty.items()}
+    expected = {
+        "contents/docs/meta.json": ["overview", "vibe-coding"],
+        "contents/docs/vibe-coding/meta.json": ["팀-a"],
+        "contents/docs/vibe-coding/팀-a/meta.json": ["p", "q"],
+        "contents/docs/vibe-coding/팀-a/p/meta.json": ["vibecoding-result"],
+        "contents/docs/vibe-coding/팀-a/q/meta.json": ["vibecoding-result"],
+    }
+    expect(pages == expected, f"unexpected navigation pages: {pages}")
+    expect(json.loads(dirty["contents/docs/vibe-coding/팀-a/meta.json"])["title"] == "팀 A", "team title not set")
+    files.update(dirty)
+    again = submission.MetaTree(lambda path: files.get(path))
+    again.add_submission(team_name="팀 A", project_name="P", team_slug="팀-a", project_slug="p")
+    expect(not again.dirty_files(), "re-adding an existing submission rewrites meta.json")
+
+
+def run_submission(argv: Sequence[str]) -> Dict[str, str]:
+    """Run create_submission_pr.main in-process; return its ``[OK] key: value`` lines."""
+    with contextlib.redirect_stdout(io.StringIO()) as out, contextlib.redirect_stderr(io.StringIO()) as err:
+        exit_code = submission.main(list(argv))
+    if exit_code != 0:
+        raise AssertionError(f"submission failed ({exit_code}):\n{err.getvalue()}")
+    values: Dict[str, str] = {}
+    for line in out.getvalue().splitlines():
+        key, separator, value = line.partition(": ")
+        if separator and key.startswith("[OK] "):
+            values[key[len("[OK] ") :]] = value
+    return values
+
+
+def pr_calls(github_root: Path) -> List[List[str]]:
+    log = github_root / "pr-calls.jsonl"
+    if not log.exists():
+        return []
+    return [json.loads(line) for line in log.read_text(encoding="utf-8").splitlines()]
+
+
+def check_e2e_modes(root: Path, github_root: Path, fields: Dict[str, str]) -> None:
+    """Every checkout mode pushes the same tree as the default one and opens one PR for it."""
+    fork = github_root / BENCH_LOGIN / f"{submission.DEFAULT_TARGET_REPO.split('/')[1]}.git"
+    upstream = github_root / f"{submission.DEFAULT_TARGET_REPO}.git"
+    base_commit = git_output(upstream, "rev-parse", submission.DEFAULT_BASE_BRANCH).strip()
+    doc_dir = submission.submission_doc_dir(
+        submission.slugify(fields["team_name"]), submission.slugify(fields["project_name"])
+    )
+    argv = [f"--{name.replace('_', '-')}={value}" for name, value in fields.items()]
+    argv += ["--use-gh-cli", f"--cache-dir={root / 'cache'}"]
+
+    trees: Dict[str, str] = {}
+    for mode in DEFAULT_E2E_MODES:
+        calls_before = len(pr_calls(github_root))
+        branch = run_submission([*argv, *mode_flags(mode)])["Branch"]
+        trees[mode] = git_output(fork, "rev-parse", f"{branch}^{{tree}}").strip()
+        parents = git_output(fork, "rev-list", "--parents", "-n", "1", branch).split()[1:]
+        expect(parents == [base_commit], f"{mode}: commit is not a single commit on the base branch")
+        calls = pr_calls(github_root)[calls_before:]
+        expect(len(calls) == 1, f"{mode}: expected one PR call, got {len(calls)}")
+        call = calls[0]
+        expect(
+            call[call.index("--head") + 1] == f"{BENCH_LOGIN}:{branch}"
+            and call[call.index("--base") + 1] == submission.DEFAULT_BASE_BRANCH
+            and call[call.index("--repo") + 1] == submission.DEFAULT_TARGET_REPO,
+            f"{mode}: unexpected PR call {call}",
+        )
+        if mode == "default":
+            document = git_output(fork, "show", f"{branch}:{doc_dir}/{submission.DEFAULT_DOC_FILENAME}")
+            expect(document == submission.render_submission(**fields), "pushed document differs from the render")
+            navigation = json.loads(git_output(fork, "show", f"{branch}:{doc_dir.rsplit('/', 1)[0]}/meta.json"))
+            expect(doc_dir.rsplit("/", 1)[1] in navigation["pages"], "team meta.json does not list the project")
+    different = {mode: tree for mode, tree in trees.items() if tree != trees["default"]}
+    expect(not different, f"modes pushed a different tree than the default checkout: {sorted(different)}")
+
+
+def check_checkpoint_resume(root: Path, github_root: Path, fields: Dict[str, str]) -> None:
+    """A run that fails at the PR step resumes with only the PR call, on the same branch."""
+    fork = github_root / BENCH_LOGIN / f"{submission.DEFAULT_TARGET_REPO.split('/')[1]}.git"
+    argv = [f"--{name.replace('_', '-')}={value}" for name, value in fields.items()]
+    argv += ["--use-gh-cli", f"--cache-dir={root / 'cache'}", "--resume"]
+
+    os.environ["BENCH_GH_FAIL_PR"] = "1"
+    try:
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            exit_code = submission.main(argv)
+    finally:
+        del os.environ["BENCH_GH_FAIL_PR"]
+    expect(exit_code == 1, "the run with a failing PR step did not fail")
+    pushed = git_output(fork, "for-each-ref", "--format=%(refname:short) %(objectname)", "refs/heads/submission/")
+    calls_before = len(pr_calls(github_root))
+
+    result = run_submission(argv)
+    calls = pr_calls(github_root)[calls_before:]
+    expect(len(calls) == 1, f"expected one PR call on resume, got {len(calls)}")
+    expect(calls[0][calls[0].index("--head") + 1] == f"{BENCH_LOGIN}:{result['Branch']}", "resume used a new branch")
+    after = git_output(fork, "for-each-ref", "--format=%(refname:short) %(objectname)", "refs/heads/submission/")
+    expect(after == pushed, "resume pushed again instead of reusing the pushed commit")
+    expect(f"{result['Branch']} {result['Commit SHA']}" in pushed.splitlines(), "resume reported another commit")
+
+    checkpoint = submission.SubmissionCheckpoint.open(
+        root / "cache", "team", "project", inputs="first", resume=False
+    )
+    checkpoint.record("fork", login=BENCH_LOGIN, fork_repo="bench/repo")
+    with contextlib.redirect_stdout(io.StringIO()):
+        same = submission.SubmissionCheckpoint.open(root / "cache", "team", "project", inputs="first", resume=True)
+        changed = submission.SubmissionCheckpoint.open(root / "cache", "team", "project", inputs="second", resume=True)
+    expect(same.done("fork") is not None and same.next_stage() == "checkout", "checkpoint was not resumed")
+    expect(not changed.stages, "a checkpoint was resumed although the inputs changed")
+
+
+def run_checks(*, seed: int) -> List[Dict[str, object]]:
+    """Behavior checks: validation, navigation, and the offline submit flow in every mode."""
+    results: List[Dict[str, object]] = []
+    with tempfile.TemporaryDirectory(prefix="hackathon-submission-bench-checks-") as temp:
+        root = Path(temp)
+        github_root = root / "github"
+        env = build_offline_github(github_root)
+        cohort = synthetic_cohort(2, seed + 1)
+        checks: List[tuple] = [
+            ("document_issues", lambda: check_document_issues(seed)),
+            ("meta_tree", check_meta_tree),
+            ("e2e_same_tree", lambda: check_e2e_modes(root, github_root, cohort[0])),
+            ("checkpoint_resume", lambda: check_checkpoint_resume(root, github_root, cohort[1])),
+        ]
+        with patched_environ(env):
+            for name, check in checks:
+                try:
+                    check()
+                except Exception as error:
+                    results.append({"name": name, "ok": False, "error": str(error)})
+                    print(f"[ERROR] Check failed: {name}: {error}", file=sys.stderr)
+                else:
+                    results.append({"name": name, "ok": True})
+                    print(f"[OK] Check passed: {name}.", file=sys.stderr)
+    return results
+
+
+def environment_info() -> Dict[str, object]:
+    git_version = subprocess.run(["git", "--version"], capture_output=True, text=True).stdout.strip()
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "git": git_version,
+    }
+
+
+def parse_sizes(value: str) -> List[int]:
+    sizes = [int(item) for item in value.split(",") if item.strip()]
+    if not sizes or any(size <= 0 for size in sizes):
+        raise argparse.ArgumentTypeError("sizes must be positive integers, e.g. 100,1000")
+    return sizes
+
+
+def parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description="Benchmark create_submission_pr.py without network access.")
+    p.add_argument(
+        "--sizes",
+        type=parse_sizes,
+        default=list(DEFAULT_SIZES),
+        help="Comma-separated cohort sizes for the micro benchmarks (default: 100,1000,10000).",
+    )
+    p.add_argument("--repeat", type=int, default=3, help="Repetitions per micro benchmark; the best is kept.")
+    p.add_argument("--seed", type=int, default=20260221)
+    p.add_argument("--e2e-runs", type=int, default=3, help="End-to-end runs per mode (0 disables).")
+    p.add_argument(
+        "--e2e-modes",
+        default=",".join(DEFAULT_E2E_MODES),
+        help=f"Comma-separated end-to-end modes (default: {','.join(DEFAULT_E2E_MODES)}).",
+    )
+    p.add_argument("--skip-micro", action="store_true")
+    p.add_argument("--skip-checks", action="store_true", help="Do not run the behavior checks.")
+    p.add_argument("--output", help="Write the JSON results to this path instead of stdout.")
+    return p
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parser().parse_args(argv)
+    modes = [mode.strip() for mode in args.e2e_modes.split(",") if mode.strip()]
+    unknown = sorted(set(modes) - set(DEFAULT_E2E_MODES))
+    if unknown:
+        print(f"[ERROR] Unknown end-to-end mode(s): {', '.join(unknown)}", file=sys.stderr)
+        return 1
+
+    report: Dict[str, object] = {
+        "environment": environment_info(),
+        "parameters": {
+            "sizes": args.sizes,
+            "repeat": args.repeat,
+            "seed": args.seed,
+            "e2e_runs": args.e2e_runs,
+            "e2e_modes": modes,
+        },
+    }
+    try:
+        if not args.skip_checks:
+            report["checks"] = run_checks(seed=args.seed)
+        if not args.skip_micro:
+            report["micro"] = run_micro_benchmarks(args.sizes, seed=args.seed, repeat=max(1, args.repeat))
+        if args.e2e_runs > 0 and modes:
+            report["e2e"] = run_e2e_benchmarks(modes, runs=args.e2e_runs, seed=args.seed)
+    except Exception as error:
+        print(f"[ERROR] {error}", file=sys.stderr)
+        return 1
+
+    failed = [str(check["name"]) for check in report.get("checks", []) if not check["ok"]]
+    payload = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(payload + "\n", encoding="utf-8")
+        print(f"[OK] Benchmark results written: {args.output}", file=sys.stderr)
+    else:
+        print(payload)
+    if failed:
+        print(f"[ERROR] Behavior checks failed: {', '.join(failed)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,439 @@
+#!/usr/bin/env python3
+"""Build a sharded, Korean-aware search index over contents/docs for the docs site to lazy-load.
+
+Every ``.mdx`` page under ``contents/docs`` (guides and submission documents) is split into
+sections at its ``## `` headings. Hangul is indexed as character bigrams, everything else as
+lowercase words. The output directory holds:
+
+- ``manifest.json``: format version, tokenizer, shard count and the content hash of every file
+- ``lengths.json``: the term count of every section id (0 for retired ids), for ranking
+- ``shard-NNN.json``: ``{term: [id, tf, id delta, tf, ...]}`` postings for the terms whose
+  FNV-1a 32-bit hash (of the UTF-8 bytes) modulo the shard count is NNN
+- ``sections-NNN.json``: display entries ``[url, title, heading, anchor, kind, field,
+  snippet]`` for section ids ``NNN * 64`` up to the next block (``null`` for retired ids)
+
+A query loads the manifest and lengths, the shards of its own terms and the section blocks
+of the results it shows. Builds are incremental: unchanged files are not re-read, section
+ids stay stable, and only files whose bytes change are rewritten.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import hashlib
+import json
+import math
+import os
+import re
+import sys
+import time
+import unicodedata
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import create_submission_pr as submission
+
+INDEX_VERSION = 2
+DEFAULT_SHARDS = 64
+DEFAULT_OUTPUT_DIR = "public/search-index"
+SNIPPET_CHARS = 120
+SECTION_BLOCK = 64
+SKIP_DIRS = {"node_modules"}
+WORD_PATTERN = re.compile(r"\w+")
+SCRIPT_RUN_PATTERN = re.compile(r"([ㄱ-ㆎ가-힣]+)|([^ㄱ-ㆎ가-힣_]+)")
+MARKDOWN_PATTERNS = (
+    (re.compile(r"!\[([^\]]*)\]\([^)]*\)"), r"\1"),
+    (re.compile(r"\[([^\]]*)\]\([^)]*\)"), r"\1"),
+    (re.compile(r"<[^>\n]+>"), " "),
+    (re.compile(r"^\s*(?:[-*+]|\d+\.)\s+", re.MULTILINE), ""),
+    (re.compile(r"[`*_>#|]"), " "),
+)
+FENCE_LINE_PATTERN = re.compile(r"^\s*(?:```|~~~).*$", re.MULTILINE)
+ANCHOR_DROP_PATTERN = re.compile(r"[^\w\- ]")
+SECTION_FIELDS = ("url", "title", "heading", "anchor", "kind", "field", "snippet")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into index terms: Hangul runs as bigrams, other runs as whole words."""
+    terms: List[str] = []
+    for word in WORD_PATTERN.finditer(unicodedata.normalize("NFKC", text).lower()):
+        for hangul, other in SCRIPT_RUN_PATTERN.findall(word.group()):
+            if hangul:
+                if len(hangul) == 1:
+                    terms.append(hangul)
+                else:
+                    terms.extend(hangul[i : i + 2] for i in range(len(hangul) - 1))
+            elif other:
+                terms.append(other)
+    return terms
+
+
+@functools.lru_cache(maxsize=None)
+def shard_of(term: str, shards: int) -> int:
+    """FNV-1a 32-bit hash of the term's UTF-8 bytes, modulo ``shards`` (easy to mirror in JS)."""
+    value = 0x811C9DC5
+    for byte in term.encode("utf-8"):
+        value = ((value ^ byte) * 0x01000193) & 0xFFFFFFFF
+    return value % shards
+
+
+def plain_text(markdown: str) -> str:
+    text = FENCE_LINE_PATTERN.sub(" ", markdown)
+    for pattern, replacement in MARKDOWN_PATTERNS:
+        text = pattern.sub(replacement, text)
+    return " ".join(text.split())
+
+
+def heading_anchor(heading: str) -> str:
+    """Approximate the heading ids the docs site generates (github-slugger)."""
+    return ANCHOR_DROP_PATTERN.sub("", heading.strip().lower()).replace(" ", "-")
+
+
+def document_url(relative: Path) -> str:
+    parts = list(relative.with_suffix("").parts)
+    if parts and parts[-1] == "index":
+        parts.pop()
+    return "/".join(["/docs", *parts])
+
+
+def parse_sections(content: str) -> Tuple[str, List[Tuple[str, str]]]:
+    """Return the title and (heading, plain text) sections of a document; the first is the intro."""
+    try:
+        frontmatter = submission.parse_frontmatter(content)
+    except ValueError:
+        frontmatter = {}
+    frontmatter = {key: value.strip().strip("\"'") for key, value in frontmatter.items()}
+    index = submission.DocumentIndex()
+    body_start = submission.scan_frontmatter(content, index)
+    lines = content.split("\n")
+    first_body_line = content.count("\n", 0, body_start)
+    # Every heading line starts a section, repeated ones included; scan_document already skips
+    # headings inside code fences.
+    boundaries = submission.scan_document(content).heading_lines
+
+    intro_end = boundaries[0][0] - 1 if boundaries else len(lines)
+    intro = " ".join(
+        [
+            frontmatter.get("title", ""),
+            frontmatter.get("summary", ""),
+            frontmatter.get("description", ""),
+            plain_text("\n".join(lines[first_body_line:intro_end])),
+        ]
+    )
+    sections = [("", " ".join(intro.split()))]
+    for position, (line, heading) in enumerate(boundaries):
+        end = boundaries[position + 1][0] - 1 if position + 1 < len(boundaries) else len(lines)
+        sections.append((heading, plain_text("\n".join(lines[line:end]))))
+    return frontmatter.get("title", ""), sections
+
+
+def required_section_field(heading: str) -> int:
+    """Index of the required section this heading satisfies (it may add text), or -1."""
+    for position, required in enumerate(submission.REQUIRED_SECTION_HEADERS):
+        if heading.startswith(required):
+            return position
+    return -1
+
+
+def index_document(path: Path, docs_root: Path, content: str) -> Dict[str, object]:
+    """Return the state entry of one document: display fields and term counts per section."""
+    title, sections = parse_sections(content)
+    kind = "submission" if path.name == submission.DEFAULT_DOC_FILENAME else "guide"
+    entries = []
+    anchors: Counter = Counter()
+    for heading, text in sections:
+        label = heading[3:].strip() if heading.startswith("## ") else heading
+        anchor = heading_anchor(label) if label else ""
+        if anchor:
+            # Repeated headings get -1, -2, ... like the site's heading ids.
+            anchors[anchor] += 1
+            if anchors[anchor] > 1:
+                anchor = f"{anchor}-{anchors[anchor] - 1}"
+        terms = Counter(tokenize(f"{label} {text}"))
+        if not terms:
+            continue
+        entries.append(
+            {
+                "heading": label,
+                "anchor": anchor,
+                "field": required_section_field(heading) if kind == "submission" else -1,
+                "length": sum(terms.values()),
+                "snippet": text[:SNIPPET_CHARS],
+                "terms": dict(terms),
+            }
+        )
+    return {
+        "url": document_url(path.relative_to(docs_root)),
+        "title": title or path.stem,
+        "kind": kind,
+        "sections": entries,
+    }
+
+
+def find_documents(docs_root: Path) -> List[Path]:
+    documents: List[Path] = []
+    pending = [str(docs_root)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS and not submission.is_submission_assets_dir(docs_root, entry.path):
+                        pending.append(entry.path)
+                elif entry.name.endswith((".md", ".mdx")) and entry.is_file():
+                    documents.append(Path(entry.path))
+    return sorted(documents)
+
+
+class IndexState:
+    """Per-document stat, hash, section ids and term counts from the previous build."""
+
+    def __init__(self, path: Path, shards: int, *, full: bool) -> None:
+        self.path = path
+        self.shards = shards
+        self.documents: Dict[str, Dict[str, object]] = {}
+        self.next_id = 0
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            payload = {}
+        if not full and payload.get("version") == INDEX_VERSION and payload.get("shards") == shards:
+            self.documents = payload.get("documents", {})
+            self.next_id = int(payload.get("next_id", 0))
+
+    def assign_ids(self, key: str, entry: Dict[str, object]) -> None:
+        """Give the sections of ``entry`` ids, reusing the ids the document had before."""
+        previous = self.documents.get(key, {}).get("sections", [])
+        for position, section in enumerate(entry["sections"]):  # type: ignore[arg-type]
+            if position < len(previous):
+                section["id"] = previous[position]["id"]
+            else:
+                section["id"] = self.next_id
+                self.next_id += 1
+
+    def save(self) -> None:
+        payload = {"version": INDEX_VERSION, "shards": self.shards, "next_id": self.next_id, "documents": self.documents}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        submission.write_text_atomic(self.path, compact_json(payload))
+
+
+def state_path(cache_dir: Path, output_dir: Path) -> Path:
+    key = hashlib.sha256(str(output_dir).encode("utf-8")).hexdigest()[:16]
+    return cache_dir / "search-index" / f"{key}.json"
+
+
+def compact_json(payload: object) -> str:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+
+def encode_postings(postings: List[Tuple[int, int]]) -> List[int]:
+    encoded: List[int] = []
+    previous = 0
+    for section_id, count in sorted(postings):
+        encoded.extend((section_id - previous, count))
+        previous = section_id
+    return encoded
+
+
+def build_index(
+    repo_root: Path, output_dir: Path, *, shards: int, cache_dir: Path, full: bool = False
+) -> Dict[str, int]:
+    docs_root = repo_root / "contents" / "docs"
+    state = IndexState(state_path(cache_dir, output_dir), shards, full=full)
+    seen: Dict[str, Dict[str, object]] = {}
+    reparsed = 0
+    changed = False
+    for path in find_documents(docs_root):
+        key = path.relative_to(docs_root).as_posix()
+        stat = path.stat()
+        previous = state.documents.get(key)
+        if previous and previous.get("mtime_ns") == stat.st_mtime_ns and previous.get("size") == stat.st_size:
+            seen[key] = previous
+            continue
+        changed = True
+        raw = path.read_bytes()
+        sha256 = hashlib.sha256(raw).hexdigest()
+        if previous and previous.get("sha256") == sha256:
+            entry = previous
+        else:
+            entry = index_document(path, docs_root, raw.decode("utf-8"))
+            state.assign_ids(key, entry)
+            reparsed += 1
+        entry.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size, sha256=sha256)
+        seen[key] = entry
+    removed = len(set(state.documents) - set(seen))
+    state.documents = seen
+
+    sections: List[Optional[List[object]]] = [None] * state.next_id
+    lengths = [0] * state.next_id
+    shard_postings: List[Dict[str, List[Tuple[int, int]]]] = [{} for _ in range(shards)]
+    for entry in seen.values():
+        for section in entry["sections"]:  # type: ignore[union-attr]
+            section_id = int(section["id"])
+            sections[section_id] = [
+                entry["url"],
+                entry["title"],
+                section["heading"],
+                section["anchor"],
+                entry["kind"],
+                section["field"],
+                section["snippet"],
+            ]
+            lengths[section_id] = int(section["length"])
+            for term, count in section["terms"].items():
+                shard_postings[shard_of(term, shards)].setdefault(term, []).append((section_id, count))
+
+    files: Dict[str, str] = {"lengths.json": compact_json(lengths)}
+    for number, postings in enumerate(shard_postings):
+        files[f"shard-{number:03d}.json"] = compact_json(
+            {term: encode_postings(postings[term]) for term in sorted(postings)}
+        )
+    for start in range(0, len(sections), SECTION_BLOCK):
+        files[f"sections-{start // SECTION_BLOCK:03d}.json"] = compact_json(sections[start : start + SECTION_BLOCK])
+    live = [length for length in lengths if length]
+    manifest = {
+        "version": INDEX_VERSION,
+        "tokenizer": {"normalize": "NFKC+lower", "hangul": "bigram", "other": "word"},
+        "hash": "fnv1a32",
+        "shards": shards,
+        "section_block": SECTION_BLOCK,
+        "section_fields": list(SECTION_FIELDS),
+        "submission_sections": submission.REQUIRED_SECTION_HEADERS,
+        "documents": len(seen),
+        "sections": len(live),
+        "average_length": round(sum(live) / len(live), 2) if live else 0,
+        "files": {name: hashlib.sha256(text.encode("utf-8")).hexdigest()[:16] for name, text in files.items()},
+    }
+    files["manifest.json"] = submission.dump_json(manifest)
+    written = sum(1 for name, text in files.items() if submission.write_text_if_changed(output_dir / name, text))
+    for pattern in ("shard-*.json", "sections-*.json"):
+        for stale in output_dir.glob(pattern):
+            if stale.name not in files:
+                stale.unlink()
+    if changed or removed:
+        state.save()
+    return {
+        "documents": len(seen),
+        "reparsed": reparsed,
+        "removed": removed,
+        "sections": len(live),
+        "files_written": written,
+    }
+
+
+class SearchIndex:
+    """Query a built index the way the site does, loading only the files a query needs."""
+
+    def __init__(self, output_dir: Path) -> None:
+        self.output_dir = output_dir
+        self.manifest = self._load("manifest.json")
+        self.lengths: List[int] = self._load("lengths.json")
+        self.loaded: List[str] = ["manifest.json", "lengths.json"]
+        self._files: Dict[str, object] = {}
+
+    def _load(self, name: str) -> object:
+        return json.loads((self.output_dir / name).read_text(encoding="utf-8"))
+
+    def _cached(self, name: str) -> object:
+        if name not in self._files:
+            self._files[name] = self._load(name)
+            self.loaded.append(name)
+        return self._files[name]
+
+    def section(self, section_id: int) -> List[object]:
+        block = int(self.manifest["section_block"])
+        return self._cached(f"sections-{section_id // block:03d}.json")[section_id % block]  # type: ignore[index]
+
+    def postings(self, term: str) -> Iterator[Tuple[int, int]]:
+        number = shard_of(term, int(self.manifest["shards"]))  # type: ignore[index]
+        shard: Dict[str, List[int]] = self._cached(f"shard-{number:03d}.json")  # type: ignore[assignment]
+        section_id = 0
+        encoded = shard.get(term, [])
+        for position in range(0, len(encoded), 2):
+            section_id += encoded[position]
+            yield section_id, encoded[position + 1]
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[float, List[object]]]:
+        """Sections containing every query term, ranked by BM25."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+        total = max(1, int(self.manifest["sections"]))
+        average = float(self.manifest["average_length"]) or 1.0
+        scores: Optional[Dict[int, float]] = None
+        for term in terms:
+            matches = dict(self.postings(term))
+            idf = math.log(1 + (total - len(matches) + 0.5) / (len(matches) + 0.5))
+            term_scores = {}
+            for section_id, count in matches.items():
+                norm = 0.25 + 0.75 * self.lengths[section_id] / average
+                term_scores[section_id] = idf * count * 2.2 / (count + 1.2 * norm)
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {key: score + term_scores[key] for key, score in scores.items() if key in term_scores}
+        ranked = sorted((scores or {}).items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return [(score, self.section(section_id)) for section_id, score in ranked]
+
+
+def parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description="Build the sharded docs search index (Korean bigrams) for lazy loading.")
+    p.add_argument("root", nargs="?", default=".", help="Repository checkout. Defaults to the current directory.")
+    p.add_argument("--out", help=f"Output directory (default: <root>/{DEFAULT_OUTPUT_DIR}).")
+    p.add_argument("--shards", type=int, default=DEFAULT_SHARDS, help="Number of postings shards.")
+    p.add_argument("--cache-dir", default=str(submission.default_cache_dir()))
+    p.add_argument("--full", action="store_true", help="Ignore the previous build and renumber every section.")
+    p.add_argument("--query", help="Search the built index instead of building it, and print the top sections.")
+    p.add_argument("--limit", type=int, default=10, help="Results printed with --query.")
+    return p
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parser().parse_args(argv)
+    repo_root = Path(args.root).expanduser().resolve()
+    output_dir = Path(args.out).expanduser().resolve() if args.out else repo_root / DEFAULT_OUTPUT_DIR
+    if args.query is not None:
+        try:
+            index = SearchIndex(output_dir)
+        except (OSError, ValueError) as error:
+            print(f"[ERROR] Cannot read the index in {output_dir}: {error}", file=sys.stderr)
+            return 1
+        results = index.search(args.query, args.limit)
+        for score, section in results:
+            url, title, heading, anchor = section[:4]
+            location = f"{url}#{anchor}" if anchor else url
+            print(f"{score:7.2f}  {location}  {title}{' > ' + heading if heading else ''}")
+        print(f"[OK] {len(results)} result(s) for {args.query!r}; loaded {', '.join(index.loaded)}.")
+        return 0
+
+    if not (repo_root / "contents" / "docs").is_dir():
+        print(f"[ERROR] contents/docs not found under {repo_root}", file=sys.stderr)
+        return 1
+    if args.shards < 1:
+        print("[ERROR] --shards must be at least 1.", file=sys.stderr)
+        return 1
+    started = time.perf_counter()
+    try:
+        stats = build_index(
+            repo_root,
+            output_dir,
+            shards=args.shards,
+            cache_dir=Path(args.cache_dir).expanduser(),
+            full=args.full,
+        )
+    except (OSError, ValueError) as error:
+        print(f"[ERROR] {error}", file=sys.stderr)
+        return 1
+    print(
+        f"[OK] Indexed {stats['documents']} document(s), {stats['sections']} section(s) in "
+        f"{time.perf_counter() - started:.2f}s: {stats['reparsed']} re-parsed, {stats['removed']} removed, "
+        f"{stats['files_written']} file(s) written to {output_dir}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Check every URL in the submission documents under contents/docs of a local checkout.
+
+Uses the link checker of create_submission_pr.py (--verify-links): HEAD with a GET fallback,
+keep-alive connections and a per-host limit, with results cached in
+``<cache-dir>/link-cache.json``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import create_submission_pr as submission
+
+
+def parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        description="Check every URL in the submission documents under contents/docs of a local checkout."
+    )
+    p.add_argument(
+        "root",
+        nargs="?",
+        default=".",
+        help="Repository checkout (or a contents/docs directory). Defaults to the current directory.",
+    )
+    p.add_argument("--workers", type=int, default=submission.DEFAULT_LINK_WORKERS, help="Concurrent link checks.")
+    p.add_argument(
+        "--per-host", type=int, default=submission.DEFAULT_LINK_PER_HOST, help="Concurrent requests to any one host."
+    )
+    p.add_argument(
+        "--timeout", type=float, default=submission.DEFAULT_LINK_TIMEOUT_SECONDS, help="Per-request timeout."
+    )
+    p.add_argument("--cache-dir", default=str(submission.default_cache_dir()))
+    p.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=submission.DEFAULT_LINK_CACHE_TTL_SECONDS,
+        help="Seconds to trust a cached working link (default: 6 hours; broken links after 10 minutes).",
+    )
+    p.add_argument("--no-cache", action="store_true", help="Check every link and do not write the cache.")
+    p.add_argument("--json", dest="json_report", help="Write a JSON report to this path ('-' for stdout).")
+    return p
+
+
+def run_links(args: argparse.Namespace) -> int:
+    root = Path(args.root).expanduser().resolve()
+    docs_root = root / "contents" / "docs"
+    if not docs_root.is_dir() and root.name == "docs":
+        docs_root, root = root, root.parents[1]
+    if not docs_root.is_dir():
+        print(f"[ERROR] contents/docs not found under {root}", file=sys.stderr)
+        return 1
+
+    started = time.perf_counter()
+    cache = submission.LinkCache(
+        None if args.no_cache else Path(args.cache_dir).expanduser() / "link-cache.json", args.cache_ttl
+    )
+    checker = submission.LinkChecker(cache=cache, timeout=args.timeout, workers=args.workers, per_host=args.per_host)
+    documents = submission.find_submission_documents(docs_root)
+    document_urls = {document: submission.extract_urls(document.read_text(encoding="utf-8")) for document in documents}
+    cached = sum(1 for url in {url for urls in document_urls.values() for url in urls} if cache.get(url))
+    try:
+        results = checker.check_all(url for urls in document_urls.values() for url in urls)
+    finally:
+        checker.close()
+
+    broken_urls = {url for url, result in results.items() if not result.ok}
+    report_documents: List[Dict[str, object]] = []
+    for document, urls in document_urls.items():
+        relative = document.relative_to(root).as_posix()
+        report_documents.append({"path": relative, "links": [asdict(results[url]) for url in urls]})
+        if args.json_report != "-":
+            for url in urls:
+                if url in broken_urls:
+                    print(f"[ERROR] {relative}: {url} ({results[url].describe()})", file=sys.stderr)
+
+    elapsed = time.perf_counter() - started
+    if args.json_report:
+        payload = {
+            "root": str(root),
+            "documents": len(documents),
+            "links": len(results),
+            "broken": len(broken_urls),
+            "cached": cached,
+            "elapsed_seconds": round(elapsed, 3),
+            "results": report_documents,
+        }
+        if args.json_report == "-":
+            print(submission.dump_json(payload), end="")
+        else:
+            submission.write_json(Path(args.json_report).resolve(), payload)
+            print(f"[OK] Link report: {args.json_report}")
+    if args.json_report != "-":
+        label = "OK" if not broken_urls else "ERROR"
+        print(
+            f"[{label}] Checked {len(results)} link(s) in {len(documents)} document(s) in {elapsed:.2f}s: "
+            f"{len(broken_urls)} broken, {cached} from cache.",
+            file=sys.stdout if not broken_urls else sys.stderr,
+        )
+    return 0 if not broken_urls else 1
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    return run_links(parser().parse_args(argv))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,21 +4,66 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import base64
+import collections
+import contextvars
+import csv
 import datetime as dt
+import difflib
+import functools
 import hashlib
+import http.client
 import json
+import os
+import queue
+import random
 import re
 import secrets
 import shutil
+import signal
+import sqlite3
 import subprocess
 import sys
 import tempfile
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, Optional, Sequence
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    FrozenSet,
+    IO,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+F = TypeVar("F", bound=Callable[..., Any])
 
 DEFAULT_TARGET_REPO = "okky-lab/vibe-coding-hackathon"
 DEFAULT_TARGET_REPO_URL = "https://github.com/okky-lab/vibe-coding-hackathon"
 DEFAULT_BASE_BRANCH = "main"
+DEFAULT_GITHUB_API_URL = "https://api.github.com"
+GITHUB_API_VERSION = "2022-11-28"
+FORK_READY_TIMEOUT_SECONDS = 60
 DEFAULT_DOC_FILENAME = "vibecoding-result.mdx"
 ALLOWED_FRONTMATTER_KEYS = {"title", "summary", "description", "full"}
 REQUIRED_FRONTMATTER_KEYS = {"title", "summary", "description"}
@@ -35,38 +80,726 @@ REQUIRED_SECTION_HEADERS = [
     "## AI 사용 여부 및 검증 방식",
     "## 제출 체크리스트",
 ]
+REQUIRED_TEMPLATE_PLACEHOLDERS = (
+    "FRONTMATTER_TITLE",
+    "FRONTMATTER_SUMMARY",
+    "FRONTMATTER_DESCRIPTION",
+    "TEAM_NAME",
+    "PROJECT_NAME",
+    "REPO_URL",
+    "DEMO_URL_OR_RUN_METHOD",
+    "PROBLEM_DEFINITION",
+    "SOLUTION",
+    "ONE_LINER",
+    "DEMO_SUMMARY",
+    "TEAM_ROLES",
+    "TECH_STACK",
+    "RUN_VERIFY",
+    "LICENSE_SOURCES",
+    "AI_USED",
+    "AI_VALIDATION_NOTES",
+    "PRESENTATION_URL",
+    "EXTRA_LINKS",
+)
+SUBMISSION_FIELDS = (
+    "team_name",
+    "project_name",
+    "repo_url",
+    "demo_url_or_run_method",
+    "problem_definition",
+    "one_liner",
+    "team_roles",
+    "solution",
+    "tech_stack",
+    "run_verify",
+    "demo_summary",
+    "license_sources",
+    "ai_used",
+    "ai_validation_notes",
+    "presentation_url",
+    "extra_links",
+)
+REQUIRED_SUBMISSION_FIELDS = (
+    "team_name",
+    "project_name",
+    "repo_url",
+    "demo_url_or_run_method",
+    "problem_definition",
+    "one_liner",
+    "team_roles",
+)
+AI_USED_CHOICES = ("사용함", "사용하지 않음")
+DEFAULT_BATCH_WORKERS = 4
+FAST_CHECKOUT_DEPTH = 1
+SPARSE_CHECKOUT_PATHS = ("contents/docs",)
+DEFAULT_MIRROR_MAX_AGE_DAYS = 14
+DEFAULT_MIRROR_MAX_BYTES = 2 * 1024 * 1024 * 1024
+REMOTE_INDEX_TTL_SECONDS = 120
+DEFAULT_GITHUB_CACHE_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_BATCH_COMMAND_TIMEOUT_SECONDS = 900
+OUTPUT_TAIL_BYTES = 64 * 1024
+OUTPUT_CHUNK_BYTES = 64 * 1024
+OUTPUT_DRAIN_SECONDS = 5
+GIT_PROGRESS_COMMANDS = {"clone", "fetch", "push"}
+# (requests per second, burst, max in flight) per GitHub endpoint class. GitHub asks for
+# content-creating requests (forks, PRs) to be serialized and spaced at least a second apart.
+GITHUB_ENDPOINT_LIMITS: Dict[str, Tuple[float, int, int]] = {
+    "read": (10.0, 20, 8),
+    "write": (1.0, 1, 1),
+    "push": (2.0, 4, 4),
+}
+GITHUB_RATE_LIMIT_RETRIES = 5
+SECONDARY_RATE_LIMIT_BACKOFF_SECONDS = 60.0
+MAX_RATE_LIMIT_BACKOFF_SECONDS = 15 * 60.0
+# Total seconds one GitHub call may spend waiting on rate limits before it fails over.
+GITHUB_RATE_LIMIT_BUDGET_SECONDS = 5 * 60.0
+# Below this many remaining core requests, reads are spread evenly until the quota resets.
+GITHUB_QUOTA_RESERVE = 100
+RATE_LIMIT_PATTERN = re.compile(r"rate limit|abuse detection|HTTP 429", re.IGNORECASE)
 ASSET_READMES = {
     "demo": "# Demo Assets\n\n데모 영상, 스크린샷, GIF 파일을 저장합니다.\n",
     "evidence": "# Evidence Assets\n\n실행/검증 결과 스크린샷 및 로그 파일을 저장합니다.\n",
     "team": "# Team Assets\n\n팀 소개 이미지, 프로필 이미지, 발표용 팀 자료를 저장합니다.\n",
 }
+ASSET_MANIFEST_FILENAME = "manifest.json"
+# GitHub rejects pushes containing files over 100 MiB.
+DEFAULT_MAX_ASSET_BYTES = 100 * 1024 * 1024
+DEFAULT_MAX_ASSETS_TOTAL_BYTES = 500 * 1024 * 1024
+ASSET_COPY_CHUNK_BYTES = 1024 * 1024
+FICLONE = 0x40049409
+LINK_FIELDS = ("repo_url", "demo_url_or_run_method", "presentation_url", "extra_links")
+LINK_PATTERN = re.compile(r"https?://[^\s<>()\[\]{}\"'`]+")
+LINK_TRAILING_PUNCTUATION = ".,;:!?*_~"
+LINK_USER_AGENT = "hackathon-submission-link-check"
+DEFAULT_LINK_TIMEOUT_SECONDS = 10.0
+DEFAULT_LINK_WORKERS = 16
+DEFAULT_LINK_PER_HOST = 4
+DEFAULT_LINK_CACHE_TTL_SECONDS = 6 * 60 * 60
+LINK_FAILURE_CACHE_TTL_SECONDS = 10 * 60
+LINK_MAX_REDIRECTS = 5
+LINK_BODY_PEEK_BYTES = 64 * 1024
 
 
 class CommandError(RuntimeError):
     """Raised when a shell command fails."""
 
 
+class NoChangesError(RuntimeError):
+    """Raised when a submission would not change anything on the base branch."""
+
+
+@dataclass
+class Span:
+    id: int
+    parent: Optional[int]
+    kind: str
+    name: str
+    start: float
+    duration: float = 0.0
+    attributes: Dict[str, object] = field(default_factory=dict)
+
+
+class TimingRecorder:
+    """Collects wall-clock spans for pipeline phases and every run() subprocess."""
+
+    def __init__(self) -> None:
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self.spans: List[Span] = []
+
+    @contextmanager
+    def span(self, name: str, *, kind: str = "phase", **attributes: object) -> Iterator[Span]:
+        with self._lock:
+            self._next_id += 1
+            span = Span(
+                id=self._next_id,
+                parent=_CURRENT_SPAN.get(),
+                kind=kind,
+                name=name,
+                start=time.perf_counter() - self._origin,
+                attributes=dict(attributes),
+            )
+            self.spans.append(span)
+        token = _CURRENT_SPAN.set(span.id)
+        try:
+            yield span
+        except BaseException as error:
+            span.attributes["error"] = type(error).__name__
+            raise
+        finally:
+            _CURRENT_SPAN.reset(token)
+            span.duration = time.perf_counter() - self._origin - span.start
+
+    def summary(self) -> List[Dict[str, object]]:
+        groups: Dict[Tuple[str, str], List[float]] = {}
+        for span in self.spans:
+            groups.setdefault((span.kind, span.name), []).append(span.duration)
+        return [
+            {
+                "kind": kind,
+                "name": name,
+                "count": len(durations),
+                "total_seconds": round(sum(durations), 6),
+                "max_seconds": round(max(durations), 6),
+            }
+            for (kind, name), durations in sorted(groups.items(), key=lambda item: -sum(item[1]))
+        ]
+
+    def to_json(self) -> Dict[str, object]:
+        return {
+            "total_seconds": round(time.perf_counter() - self._origin, 6),
+            "spans": [asdict(span) for span in self.spans],
+            "summary": self.summary(),
+        }
+
+    def format_summary(self) -> str:
+        lines = [f"{'kind':<8} {'name':<24} {'count':>5} {'total(ms)':>10} {'max(ms)':>10}"]
+        for row in self.summary():
+            lines.append(
+                f"{row['kind']:<8} {str(row['name'])[:24]:<24} {row['count']:>5} "
+                f"{float(row['total_seconds']) * 1000:>10.1f} {float(row['max_seconds']) * 1000:>10.1f}"
+            )
+        return "\n".join(lines)
+
+
+_TIMINGS: Optional[TimingRecorder] = None
+_CURRENT_SPAN: contextvars.ContextVar[Optional[int]] = contextvars.ContextVar("current_span", default=None)
+
+
+def enable_timings() -> TimingRecorder:
+    global _TIMINGS
+    _TIMINGS = TimingRecorder()
+    return _TIMINGS
+
+
+def phase(name: str, **attributes: object) -> ContextManager[Optional[Span]]:
+    if _TIMINGS is None:
+        return nullcontext()
+    return _TIMINGS.span(name, **attributes)
+
+
+def timed_phase(name: str) -> Callable[[F], F]:
+    """Decorator recording each call of a pipeline step as a phase span."""
+
+    def decorate(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with phase(name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def command_label(cmd: Sequence[str]) -> str:
+    """Group commands by program and subcommand, e.g. ``git fetch`` or ``gh api``."""
+    if cmd[1:2] == ["-c"]:
+        cmd = [cmd[0], *cmd[3:]]
+    words = [part for part in cmd[:3] if not part.startswith("-")]
+    return " ".join(words[:2])
+
+
+class ProcessScope:
+    """Tracks child processes started by run() so a failing sibling step can cancel them.
+
+    A scope opened inside a step of another scope is cancelled together with its parent,
+    so nested concurrent steps are killed as well.
+    """
+
+    def __init__(self, parent: Optional["ProcessScope"] = None) -> None:
+        self._lock = threading.Lock()
+        self._processes: Set[subprocess.Popen] = set()
+        self._children: List["ProcessScope"] = []
+        self.cancelled = False
+        if parent is not None:
+            parent.adopt(self)
+
+    def adopt(self, child: "ProcessScope") -> None:
+        with self._lock:
+            self._children.append(child)
+            cancelled = self.cancelled
+        if cancelled:
+            child.cancel()
+
+    def register(self, process: subprocess.Popen) -> None:
+        with self._lock:
+            self._processes.add(process)
+            if self.cancelled:
+                kill_process_tree(process)
+
+    def unregister(self, process: subprocess.Popen) -> None:
+        with self._lock:
+            self._processes.discard(process)
+
+    def cancel(self) -> None:
+        with self._lock:
+            self.cancelled = True
+            for process in self._processes:
+                kill_process_tree(process)
+            children = list(self._children)
+        for child in children:
+            child.cancel()
+
+
+def kill_process_tree(process: subprocess.Popen, *, group: bool = True) -> None:
+    """Kill a process started in its own session together with its children (git helpers)."""
+    try:
+        if group and os.name == "posix":
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+_PROCESS_SCOPE: contextvars.ContextVar[Optional[ProcessScope]] = contextvars.ContextVar(
+    "process_scope", default=None
+)
+
+
+class CommandTimeoutError(CommandError):
+    """Raised when a command outlives its own timeout or the overall run deadline."""
+
+
+@dataclass
+class RunLimits:
+    """Time limits applied by run(): per command and for the whole invocation (monotonic)."""
+
+    command_timeout: Optional[float] = None
+    deadline: Optional[float] = None
+    progress: bool = False
+
+    @property
+    def active(self) -> bool:
+        return self.command_timeout is not None or self.deadline is not None
+
+    def expiry(self, started: float) -> Tuple[Optional[float], str]:
+        """Return (monotonic expiry, reason) for a command started at ``started``."""
+        candidates = []
+        if self.command_timeout is not None:
+            candidates.append((started + self.command_timeout, f"timed out after {self.command_timeout:g}s"))
+        if self.deadline is not None:
+            candidates.append((self.deadline, "exceeded the overall run deadline"))
+        return min(candidates) if candidates else (None, "")
+
+
+_RUN_LIMITS = RunLimits()
+
+
+def configure_run_limits(
+    *,
+    command_timeout: Optional[float] = None,
+    overall_timeout: Optional[float] = None,
+    progress: bool = False,
+) -> RunLimits:
+    global _RUN_LIMITS
+    deadline = time.monotonic() + overall_timeout if overall_timeout else None
+    _RUN_LIMITS = RunLimits(command_timeout=command_timeout or None, deadline=deadline, progress=progress)
+    return _RUN_LIMITS
+
+
+class OutputTail:
+    """Keeps only the last ``max_bytes`` of a stream, for error messages."""
+
+    def __init__(self, max_bytes: int = OUTPUT_TAIL_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._chunks: "collections.deque[bytes]" = collections.deque()
+        self._size = 0
+
+    def append(self, chunk: bytes) -> None:
+        self.total_bytes += len(chunk)
+        self._chunks.append(chunk)
+        self._size += len(chunk)
+        while self._size - len(self._chunks[0]) >= self.max_bytes:
+            self._size -= len(self._chunks.popleft())
+
+    def text(self) -> str:
+        data = b"".join(self._chunks)[-self.max_bytes :]
+        dropped = self.total_bytes - len(data)
+        text = decode_output(data)
+        return f"... ({dropped} bytes truncated)\n{text}" if dropped else text
+
+
+def decode_output(data: bytes) -> str:
+    return data.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def pump_stream(stream: IO[bytes], sinks: Sequence[Callable[[bytes], None]]) -> None:
+    with stream:
+        for chunk in iter(lambda: stream.read1(OUTPUT_CHUNK_BYTES), b""):  # type: ignore[attr-defined]
+            for sink in sinks:
+                sink(chunk)
+
+
+def forward_progress(chunk: bytes) -> None:
+    sys.stderr.write(chunk.decode("utf-8", errors="replace"))
+    sys.stderr.flush()
+
+
+def reports_progress(cmd: Sequence[str]) -> bool:
+    return len(cmd) > 1 and cmd[0] == "git" and cmd[1] in GIT_PROGRESS_COMMANDS
+
+
+class TokenBucket:
+    """Refills ``rate`` tokens per second up to ``capacity``; callers reserve one token each."""
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        self.default_rate = rate
+        self.rate = rate
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def reserve(self, now: float) -> float:
+        """Take a token and return how long to wait before using it (tokens may go negative)."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+@dataclass
+class EndpointStats:
+    calls: int = 0
+    retries: int = 0
+    wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    backoff_seconds: float = 0.0
+
+
+class GitHubScheduler:
+    """Paces GitHub calls per endpoint class and retries the ones that hit a rate limit.
+
+    Every class has a token bucket (rate and burst) and a cap on calls in flight. REST
+    responses feed the remaining quota back in: near the end of the quota reads slow down to
+    last until the reset, and at zero all API calls wait for it. Calls rejected by a primary
+    or secondary limit are retried after ``Retry-After``, the quota reset, or a jittered
+    exponential backoff, unless that would overrun ``budget`` seconds of rate-limit waiting
+    for the call or the --deadline; the call then fails so the run can fall back to the
+    manual compare URL. A rejected write may still have taken effect, so before it is retried
+    ``recover`` looks the result up and, if it exists, returns it instead.
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[str, Tuple[float, int, int]] = GITHUB_ENDPOINT_LIMITS,
+        *,
+        max_retries: int = GITHUB_RATE_LIMIT_RETRIES,
+        budget: float = GITHUB_RATE_LIMIT_BUDGET_SECONDS,
+    ) -> None:
+        self.max_retries = max_retries
+        self.budget = budget
+        self._buckets = {name: TokenBucket(rate, burst) for name, (rate, burst, _) in limits.items()}
+        self._slots = {name: threading.BoundedSemaphore(in_flight) for name, (_, _, in_flight) in limits.items()}
+        self._stats = {name: EndpointStats() for name in limits}
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def call(self, endpoint: str, func: Callable[[], Any], *, recover: Optional[Callable[[], Any]] = None) -> Any:
+        attempt = 0
+        waited = 0.0
+        while True:
+            with self._slots[endpoint]:
+                waited += self._wait_turn(endpoint, self.budget - waited)
+                try:
+                    return func()
+                except Exception as error:
+                    delay = self.retry_delay(error, attempt)
+                    if (
+                        delay is None
+                        or attempt >= self.max_retries
+                        or waited + delay > self.budget
+                        or self._past_deadline(delay)
+                    ):
+                        raise
+                    reason = str(error)
+            print(f"[WARN] GitHub rate limit hit ({endpoint}); retrying in {delay:.0f}s: {reason}", file=sys.stderr)
+            with self._lock:
+                self._stats[endpoint].retries += 1
+                self._stats[endpoint].backoff_seconds += delay
+                if endpoint != "push":
+                    # Secondary limits apply to the account, not to one endpoint.
+                    self._paused_until = max(self._paused_until, time.monotonic() + delay)
+            time.sleep(delay)
+            waited += delay
+            if recover is not None:
+                existing = recover()
+                if existing is not None:
+                    print(f"[INFO] The rate-limited GitHub {endpoint} call had already succeeded; not retrying it.")
+                    return existing
+            attempt += 1
+
+    def _wait_turn(self, endpoint: str, budget: float) -> float:
+        """Wait for the endpoint's turn and return the part of the wait spent on a rate-limit pause."""
+        with self._lock:
+            now = time.monotonic()
+            paused = max(0.0, self._paused_until - now) if endpoint != "push" else 0.0
+            if paused > budget:
+                raise GitHubAPIError(
+                    f"GitHub rate limit: API calls are paused for {paused:.0f}s, "
+                    f"longer than the {budget:.0f}s left to wait.",
+                    status=429,
+                )
+            wait = max(self._buckets[endpoint].reserve(now), paused)
+            stats = self._stats[endpoint]
+            stats.calls += 1
+            stats.wait_seconds += wait
+            stats.max_wait_seconds = max(stats.max_wait_seconds, wait)
+        if wait > 0:
+            with phase(f"github {endpoint}", kind="wait"):
+                time.sleep(wait)
+        return paused
+
+    @staticmethod
+    def _past_deadline(delay: float) -> bool:
+        deadline = _RUN_LIMITS.deadline
+        return deadline is not None and time.monotonic() + delay >= deadline
+
+    @staticmethod
+    def retry_delay(error: Exception, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying ``error``, or None when it is not a rate limit."""
+        reset: Optional[float] = None
+        if isinstance(error, GitHubAPIError):
+            headers = error.headers
+            limited = error.status == 429 or (
+                error.status == 403
+                and ("retry-after" in headers or headers.get("x-ratelimit-remaining") == "0"
+                     or bool(RATE_LIMIT_PATTERN.search(str(error))))
+            )
+            if not limited:
+                return None
+            if headers.get("retry-after", "").isdigit():
+                return float(headers["retry-after"])
+            if headers.get("x-ratelimit-reset", "").isdigit():
+                reset = max(1.0, float(headers["x-ratelimit-reset"]) - time.time() + 1)
+            if reset is not None and headers.get("x-ratelimit-remaining") == "0":
+                return reset
+        elif not (isinstance(error, CommandError) and RATE_LIMIT_PATTERN.search(str(error))):
+            return None
+        backoff = min(MAX_RATE_LIMIT_BACKOFF_SECONDS, SECONDARY_RATE_LIMIT_BACKOFF_SECONDS * 2**attempt)
+        backoff *= random.uniform(1.0, 1.25)
+        # A quota reset that comes sooner than the backoff is the better time to retry.
+        return min(backoff, reset) if reset is not None else backoff
+
+    def observe(self, headers: Mapping[str, str]) -> None:
+        """Adapt pacing to the ``x-ratelimit-*`` headers of a REST response."""
+        remaining, reset = headers.get("x-ratelimit-remaining", ""), headers.get("x-ratelimit-reset", "")
+        if not (remaining.isdigit() and reset.isdigit()):
+            return
+        seconds_left = max(1.0, float(reset) - time.time())
+        with self._lock:
+            read = self._buckets["read"]
+            if int(remaining) == 0:
+                self._paused_until = max(self._paused_until, time.monotonic() + seconds_left)
+            elif int(remaining) < GITHUB_QUOTA_RESERVE:
+                read.rate = min(read.default_rate, int(remaining) / seconds_left)
+            else:
+                read.rate = read.default_rate
+
+    def summary(self) -> Dict[str, Dict[str, object]]:
+        with self._lock:
+            return {
+                name: {
+                    "calls": stats.calls,
+                    "retries": stats.retries,
+                    "queue_wait_seconds": round(stats.wait_seconds, 3),
+                    "max_queue_wait_seconds": round(stats.max_wait_seconds, 3),
+                    "backoff_seconds": round(stats.backoff_seconds, 3),
+                }
+                for name, stats in self._stats.items()
+                if stats.calls
+            }
+
+    def format_summary(self) -> str:
+        parts = [
+            f"{name} {row['calls']} call(s), {row['queue_wait_seconds']}s queued, {row['retries']} retried"
+            for name, row in self.summary().items()
+        ]
+        return "GitHub calls: " + "; ".join(parts) if parts else ""
+
+
+_GITHUB_SCHEDULER = GitHubScheduler()
+
+
+def github_endpoint(cmd: Sequence[str]) -> Optional[str]:
+    """Endpoint class of a gh/git command that talks to GitHub, or None for local commands."""
+    words = [part for part in cmd[:3] if not part.startswith("-")]
+    if words[:2] == ["git", "push"]:
+        return "push"
+    if words[:1] != ["gh"] or words[1:2] in (["auth"], []):
+        return None
+    if words[1:3] in (["repo", "fork"], ["pr", "create"]):
+        return "write"
+    return "read"
+
+
 def run(
     cmd: Sequence[str],
     *,
     cwd: Optional[Path] = None,
     check: bool = True,
     capture_output: bool = True,
+    input: Optional[str] = None,
+    timeout: Optional[float] = None,
+    strip: bool = True,
+    recover: Optional[Callable[[], Optional[str]]] = None,
 ) -> str:
-    result = subprocess.run(
-        list(cmd),
-        cwd=str(cwd) if cwd else None,
-        text=True,
+    """Run a command via run_command(); GitHub-bound gh/git calls go through the scheduler.
+
+    ``recover`` is used for non-idempotent writes: see GitHubScheduler.call().
+    """
+    execute = functools.partial(
+        run_command,
+        cmd,
+        cwd=cwd,
+        check=check,
         capture_output=capture_output,
+        input=input,
+        timeout=timeout,
+        strip=strip,
     )
-    stdout = result.stdout.strip() if result.stdout else ""
-    stderr = result.stderr.strip() if result.stderr else ""
-    if check and result.returncode != 0:
-        pretty_cmd = " ".join(cmd)
-        raise CommandError(f"Command failed ({result.returncode}): {pretty_cmd}\n{stderr}")
+    endpoint = github_endpoint(cmd)
+    if endpoint is None:
+        return execute()
+    return _GITHUB_SCHEDULER.call(endpoint, execute, recover=recover)
+
+
+def run_command(
+    cmd: Sequence[str],
+    *,
+    cwd: Optional[Path] = None,
+    check: bool = True,
+    capture_output: bool = True,
+    input: Optional[str] = None,
+    timeout: Optional[float] = None,
+    strip: bool = True,
+) -> str:
+    """Run a command, streaming its output, and return its stripped stdout.
+
+    Stdout is collected in full (callers parse it); stderr is kept as a bounded tail for
+    error messages and, with --progress, forwarded live. The command is killed when it
+    outlives ``timeout`` (default: --command-timeout) or the overall --deadline. With
+    ``strip=False`` stdout is returned exactly as written (file contents such as blobs).
+    """
+    pretty_cmd = " ".join(cmd)
+    scope = _PROCESS_SCOPE.get()
+    if scope is not None and scope.cancelled:
+        raise CommandError(f"Command cancelled: {pretty_cmd}")
+    limits = _RUN_LIMITS
+    if timeout is not None:
+        limits = RunLimits(command_timeout=timeout, deadline=limits.deadline, progress=limits.progress)
+    expires_at, expiry_reason = limits.expiry(time.monotonic())
+    if expires_at is not None and expires_at <= time.monotonic():
+        raise CommandTimeoutError(f"Command {expiry_reason} before it started: {pretty_cmd}")
+    progress = limits.progress and capture_output and reports_progress(cmd)
+    if progress:
+        # git only reports progress to a terminal unless asked explicitly.
+        cmd = [*cmd[:2], "--progress", *cmd[2:]]
+
+    # Scoped or time-limited commands get their own process group so cancellation can kill
+    # the helpers they spawn; the others keep the terminal for interactive credential prompts.
+    isolated = (scope is not None or limits.active) and os.name == "posix"
+    stdout_chunks: List[bytes] = []
+    stderr_tail = OutputTail()
+    timed_out = False
+    with phase(command_label(cmd), kind="command", command=pretty_cmd) as span:
+        pipe = subprocess.PIPE if capture_output else None
+        process = subprocess.Popen(
+            list(cmd),
+            cwd=str(cwd) if cwd else None,
+            stdin=subprocess.PIPE if input is not None else None,
+            stdout=pipe,
+            stderr=pipe,
+            start_new_session=isolated,
+        )
+        if scope is not None:
+            scope.register(process)
+        threads = []
+        if capture_output:
+            stderr_sinks: List[Callable[[bytes], None]] = [stderr_tail.append]
+            if progress:
+                stderr_sinks.append(forward_progress)
+            threads = [
+                threading.Thread(target=pump_stream, args=(process.stdout, [stdout_chunks.append]), daemon=True),
+                threading.Thread(target=pump_stream, args=(process.stderr, stderr_sinks), daemon=True),
+            ]
+        if input is not None:
+            threads.append(threading.Thread(target=feed_stdin, args=(process.stdin, input), daemon=True))
+        for thread in threads:
+            thread.start()
+        try:
+            remaining = None if expires_at is None else max(0.0, expires_at - time.monotonic())
+            try:
+                process.wait(timeout=remaining)
+            except subprocess.TimeoutExpired:
+                timed_out = True
+                kill_process_tree(process, group=isolated)
+                process.wait()
+        finally:
+            if scope is not None:
+                scope.unregister(process)
+            for thread in threads:
+                # A helper that escaped the process group could hold the pipes open; never
+                # let that block the caller.
+                thread.join(timeout=OUTPUT_DRAIN_SECONDS)
+        stdout_bytes = b"".join(stdout_chunks)
+        if span is not None:
+            span.attributes.update(
+                returncode=process.returncode,
+                stdout_bytes=len(stdout_bytes),
+                stderr_bytes=stderr_tail.total_bytes,
+            )
+            if timed_out:
+                span.attributes["timed_out"] = True
+    stdout = decode_output(stdout_bytes).strip() if strip else stdout_bytes.decode("utf-8", errors="replace")
+    stderr = stderr_tail.text().strip()
+    if scope is not None and scope.cancelled and process.returncode != 0:
+        raise CommandError(f"Command cancelled: {pretty_cmd}")
+    if timed_out:
+        raise CommandTimeoutError(f"Command {expiry_reason}: {pretty_cmd}\n{stderr}".rstrip())
+    if check and process.returncode != 0:
+        raise CommandError(f"Command failed ({process.returncode}): {pretty_cmd}\n{stderr}")
     return stdout
 
 
+def feed_stdin(stream: IO[bytes], text: str) -> None:
+    try:
+        with stream:
+            stream.write(text.encode("utf-8"))
+    except BrokenPipeError:
+        pass
+
+
+async def _run_steps(steps: Mapping[str, Callable[[], Any]]) -> Dict[str, Any]:
+    scope = ProcessScope(_PROCESS_SCOPE.get())
+    _PROCESS_SCOPE.set(scope)
+    tasks = {asyncio.create_task(asyncio.to_thread(step)): name for name, step in steps.items()}
+    done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    failed = [task for task in done if task.exception() is not None]
+    if failed:
+        # Kill the sibling steps' subprocesses and wait for their threads to unwind so the
+        # caller can safely clean up shared temp directories.
+        scope.cancel()
+        if pending:
+            await asyncio.wait(pending)
+        for task in pending:
+            task.exception()
+        raise failed[0].exception()  # type: ignore[misc]
+    return {tasks[task]: task.result() for task in done}
+
+
+def run_concurrently(steps: Mapping[str, Callable[[], Any]]) -> Dict[str, Any]:
+    """Run independent blocking steps in threads and return their results by name.
+
+    The first failure cancels the remaining steps (their running commands are killed) and
+    is re-raised unchanged, so callers keep their existing error handling.
+    """
+    return asyncio.run(_run_steps(steps))
+
+
 def slugify(text: str) -> str:
     source = text.strip()
     value = source.lower()
@@ -90,61 +823,215 @@ def sanitize_frontmatter_value(value: str) -> str:
     return escaped
 
 
+TEMPLATE_PLACEHOLDER_PATTERN = re.compile(r"__([A-Z0-9_]+)__")
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """A template split once into alternating literal and placeholder segments.
+
+    ``literals`` always has one more entry than ``names``; rendering interleaves them in a
+    single join, so substituted values are never rescanned for placeholders.
+    """
+
+    literals: Tuple[str, ...]
+    names: Tuple[str, ...]
+    placeholders: FrozenSet[str]
+
+    @classmethod
+    def compile(cls, template: str) -> "CompiledTemplate":
+        pieces = TEMPLATE_PLACEHOLDER_PATTERN.split(template)
+        names = tuple(pieces[1::2])
+        return cls(literals=tuple(pieces[0::2]), names=names, placeholders=frozenset(names))
+
+    def ensure_placeholders(self, placeholders: Iterable[str]) -> None:
+        missing = [name for name in placeholders if name not in self.placeholders]
+        if missing:
+            joined = ", ".join(missing)
+            raise ValueError(f"Template missing placeholder(s): {joined}")
+
+    def render(self, replacements: Mapping[str, str]) -> str:
+        unresolved = self.placeholders.difference(replacements)
+        if unresolved:
+            joined = ", ".join(f"__{name}__" for name in sorted(unresolved))
+            raise ValueError(f"Unresolved template placeholder(s): {joined}")
+        parts = [self.literals[0]]
+        for name, literal in zip(self.names, self.literals[1:]):
+            parts.append(replacements[name])
+            parts.append(literal)
+        return "".join(parts)
+
+
+_TEMPLATE_CACHE: Dict[Path, Tuple[Tuple[int, int], CompiledTemplate]] = {}
+_TEMPLATE_CACHE_LOCK = threading.Lock()
+
+
+def template_path(skill_root: Path) -> Path:
+    return skill_root / "assets" / "templates" / DEFAULT_DOC_FILENAME
+
+
 def load_template(skill_root: Path) -> str:
-    template_path = skill_root / "assets" / "templates" / DEFAULT_DOC_FILENAME
-    if not template_path.exists():
-        raise FileNotFoundError(f"Template not found: {template_path}")
-    return template_path.read_text(encoding="utf-8")
+    path = template_path(skill_root)
+    if not path.exists():
+        raise FileNotFoundError(f"Template not found: {path}")
+    return path.read_text(encoding="utf-8")
+
+
+def load_compiled_template(skill_root: Path) -> CompiledTemplate:
+    """Return the compiled submission template, recompiling only when the file changes."""
+    path = template_path(skill_root)
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Template not found: {path}") from None
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    with _TEMPLATE_CACHE_LOCK:
+        cached = _TEMPLATE_CACHE.get(path)
+        if cached and cached[0] == stamp:
+            return cached[1]
+    compiled = CompiledTemplate.compile(load_template(skill_root))
+    compiled.ensure_placeholders(REQUIRED_TEMPLATE_PLACEHOLDERS)
+    with _TEMPLATE_CACHE_LOCK:
+        _TEMPLATE_CACHE[path] = (stamp, compiled)
+    return compiled
+
+
+@functools.lru_cache(maxsize=8)
+def compile_template(template: str) -> CompiledTemplate:
+    return CompiledTemplate.compile(template)
 
 
 def ensure_required_placeholders(template: str, placeholders: Iterable[str]) -> None:
-    missing = [name for name in placeholders if f"__{name}__" not in template]
-    if missing:
-        joined = ", ".join(missing)
-        raise ValueError(f"Template missing placeholder(s): {joined}")
+    compile_template(template).ensure_placeholders(placeholders)
 
 
 def render_template(template: str, replacements: Dict[str, str]) -> str:
-    rendered = template
-    for key, value in replacements.items():
-        rendered = rendered.replace(f"__{key}__", value)
-    leftovers = sorted(set(re.findall(r"__[A-Z0-9_]+__", rendered)))
-    if leftovers:
-        joined = ", ".join(leftovers)
-        raise ValueError(f"Unresolved template placeholder(s): {joined}")
-    return rendered
+    return compile_template(template).render(replacements)
 
 
-def parse_frontmatter(content: str) -> Dict[str, str]:
-    match = re.match(r"^---\n(.*?)\n---\n", content, re.DOTALL)
-    if not match:
-        raise ValueError("Document does not include valid YAML frontmatter.")
-    frontmatter_lines = match.group(1).splitlines()
-    data: Dict[str, str] = {}
-    for line in frontmatter_lines:
+FRONTMATTER_DELIMITER = "---"
+# Body lines that matter for validation: ``##`` headings and code fence delimiters.
+DOCUMENT_STRUCTURE_PATTERN = re.compile(r"\n(?:(## [^\n]*)|[ \t]*(`{3,}|~{3,})([^\n]*))")
+
+
+@dataclass(frozen=True)
+class DocumentIssue:
+    """One validation problem; ``line`` is 1-based, or 0 for document-level issues."""
+
+    line: int
+    message: str
+
+    def __str__(self) -> str:
+        return f"line {self.line}: {self.message}" if self.line else self.message
+
+
+class DocumentValidationError(ValueError):
+    def __init__(self, issues: Sequence[DocumentIssue]) -> None:
+        self.issues = list(issues)
+        if len(self.issues) == 1:
+            message = str(self.issues[0])
+        else:
+            details = "\n".join(f"  - {issue}" for issue in self.issues)
+            message = f"Document has {len(self.issues)} validation issue(s):\n{details}"
+        super().__init__(message)
+
+
+@dataclass
+class DocumentIndex:
+    """Frontmatter keys and top-level ``##`` headings of a document, with line numbers.
+
+    ``headings`` maps each heading to its first line; ``heading_lines`` lists every heading line
+    in order, repeats included.
+    """
+
+    has_frontmatter: bool = False
+    frontmatter: Dict[str, str] = field(default_factory=dict)
+    frontmatter_lines: Dict[str, int] = field(default_factory=dict)
+    headings: Dict[str, int] = field(default_factory=dict)
+    heading_lines: List[Tuple[int, str]] = field(default_factory=list)
+
+
+def scan_frontmatter(content: str, index: DocumentIndex) -> int:
+    """Fill frontmatter fields of ``index``; return the offset where the body starts."""
+    opening = FRONTMATTER_DELIMITER + "\n"
+    if not content.startswith(opening):
+        return 0
+    # The closing delimiter must be on a line of its own after the opening one, so an
+    # empty ``---\n---\n`` block is not frontmatter.
+    closing = content.find("\n" + FRONTMATTER_DELIMITER + "\n", len(opening))
+    if closing < 0:
+        return 0
+    for number, line in enumerate(content[len(opening) : closing].split("\n"), start=2):
         if ":" not in line:
             continue
         key, raw_value = line.split(":", 1)
-        data[key.strip()] = raw_value.strip()
-    return data
+        key = key.strip()
+        index.frontmatter[key] = raw_value.strip()
+        index.frontmatter_lines[key] = number
+    index.has_frontmatter = True
+    return closing + len(FRONTMATTER_DELIMITER) + 2
 
 
-def validate_document(content: str) -> None:
-    frontmatter = parse_frontmatter(content)
-    keys = set(frontmatter.keys())
-    unexpected = sorted(keys - ALLOWED_FRONTMATTER_KEYS)
-    if unexpected:
-        joined = ", ".join(unexpected)
-        raise ValueError(f"Unexpected frontmatter keys: {joined}")
-
-    missing = sorted(REQUIRED_FRONTMATTER_KEYS - keys)
-    if missing:
-        joined = ", ".join(missing)
-        raise ValueError(f"Missing required frontmatter keys: {joined}")
+def scan_document(content: str) -> DocumentIndex:
+    """Index frontmatter and headings in one pass; headings inside code fences are ignored."""
+    index = DocumentIndex()
+    body_start = scan_frontmatter(content, index)
+    # Every structural line is matched by the newline that precedes it; ``line`` is the
+    # number of the line that starts right after ``text[position]``.
+    text, position = (content, body_start - 1) if body_start else ("\n" + content, 0)
+    line = content.count("\n", 0, body_start) + 1
+    fence = ""
+    for match in DOCUMENT_STRUCTURE_PATTERN.finditer(text, position):
+        line += text.count("\n", position + 1, match.start() + 1)
+        position = match.start()
+        heading, marker, rest = match.groups()
+        if fence:
+            if marker and marker[0] == fence[0] and len(marker) >= len(fence) and not rest.strip():
+                fence = ""
+        elif marker:
+            fence = marker
+        elif heading:
+            index.headings.setdefault(heading.rstrip(), line)
+            index.heading_lines.append((line, heading.rstrip()))
+    return index
+
+
+def parse_frontmatter(content: str) -> Dict[str, str]:
+    index = DocumentIndex()
+    scan_frontmatter(content, index)
+    if not index.has_frontmatter:
+        raise ValueError("Document does not include valid YAML frontmatter.")
+    return index.frontmatter
+
+
+def document_issues(content: str) -> List[DocumentIssue]:
+    """Return every validation problem of a submission document, in line order."""
+    index = scan_document(content)
+    if not index.has_frontmatter:
+        issues = [DocumentIssue(1, "Document does not include valid YAML frontmatter.")]
+    else:
+        issues = [
+            DocumentIssue(index.frontmatter_lines[key], f"Unexpected frontmatter key: {key}")
+            for key in index.frontmatter
+            if key not in ALLOWED_FRONTMATTER_KEYS
+        ]
+        missing = sorted(REQUIRED_FRONTMATTER_KEYS - index.frontmatter.keys())
+        if missing:
+            joined = ", ".join(missing)
+            issues.append(DocumentIssue(1, f"Missing required frontmatter keys: {joined}"))
+    issues.extend(
+        DocumentIssue(0, f"Missing required section: {header}")
+        for header in REQUIRED_SECTION_HEADERS
+        if not any(heading.startswith(header) for heading in index.headings)
+    )
+    return sorted(issues, key=lambda issue: issue.line or sys.maxsize)
 
-    for required_header in REQUIRED_SECTION_HEADERS:
-        if required_header not in content:
-            raise ValueError(f"Missing required section: {required_header}")
+
+@timed_phase("validate")
+def validate_document(content: str) -> None:
+    issues = document_issues(content)
+    if issues:
+        raise DocumentValidationError(issues)
 
 
 def load_json(path: Path) -> Dict[str, object]:
@@ -157,36 +1044,383 @@ def load_json(path: Path) -> Dict[str, object]:
     return raw
 
 
-def write_json(path: Path, payload: Dict[str, object]) -> None:
+def dump_json(payload: Dict[str, object]) -> str:
+    return json.dumps(payload, ensure_ascii=False, indent=2) + "\n"
+
+
+def write_text_atomic(path: Path, text: str) -> None:
+    """Write through a sibling temp file and rename, so readers never see a partial file."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as file:
-        json.dump(payload, file, ensure_ascii=False, indent=2)
-        file.write("\n")
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        temp_path.write_text(text, encoding="utf-8")
+        os.replace(temp_path, path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def write_text_if_changed(path: Path, text: str) -> bool:
+    """Atomically write ``text`` unless the file already holds exactly these bytes."""
+    data = text.encode("utf-8")
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    write_text_atomic(path, text)
+    return True
+
+
+def write_json(path: Path, payload: Dict[str, object]) -> None:
+    write_text_atomic(path, dump_json(payload))
+
+
+@dataclass
+class MetaNode:
+    payload: Dict[str, object]
+    pages: List[str]
+    members: Set[str]
+    dirty: bool = False
+
+
+class MetaTree:
+    """The meta.json navigation files of one tree, each loaded once and written once.
+
+    ``read_file`` returns the current content of a repo-relative path (or None), so the same
+    tree can sit on a working directory or on git objects. Page insertions happen in memory;
+    ``dirty_files`` and ``flush`` emit only the files that actually changed.
+    """
+
+    def __init__(self, read_file: Callable[[str], Optional[str]]) -> None:
+        self._read_file = read_file
+        self._nodes: Dict[str, MetaNode] = {}
+
+    @classmethod
+    def on_disk(cls, root: Path) -> "MetaTree":
+        def read_file(relative_path: str) -> Optional[str]:
+            try:
+                return (root / relative_path).read_text(encoding="utf-8")
+            except FileNotFoundError:
+                return None
+
+        return cls(read_file)
+
+    def node(self, meta_path: str, title: str) -> MetaNode:
+        node = self._nodes.get(meta_path)
+        if node is not None:
+            return node
+        current = self._read_file(meta_path)
+        payload = json.loads(current) if current else {}
+        if not isinstance(payload, dict):
+            raise ValueError(f"Invalid JSON object at {meta_path}")
+        raw_pages = payload.get("pages")
+        pages = [item for item in raw_pages if isinstance(item, str)] if isinstance(raw_pages, list) else []
+        node = MetaNode(payload=payload, pages=pages, members=set(pages))
+        node.dirty = current is None or pages != raw_pages
+        if not payload.get("title"):
+            payload["title"] = title
+            node.dirty = True
+        self._nodes[meta_path] = node
+        return node
+
+    def add_page(self, meta_path: str, title: str, page: str) -> None:
+        node = self.node(meta_path, title)
+        if page not in node.members:
+            node.members.add(page)
+            node.pages.append(page)
+            node.dirty = True
+
+    def prune_pages(self, meta_path: str, title: str, keep: Callable[[str], bool]) -> None:
+        node = self.node(meta_path, title)
+        kept = [page for page in node.pages if keep(page)]
+        if len(kept) != len(node.pages):
+            node.pages[:] = kept
+            node.members = set(kept)
+            node.dirty = True
+
+    def add_submission(self, *, team_name: str, project_name: str, team_slug: str, project_slug: str) -> None:
+        for meta_path, title, page in submission_meta_entries(
+            team_name=team_name,
+            project_name=project_name,
+            team_slug=team_slug,
+            project_slug=project_slug,
+        ):
+            self.add_page(meta_path, title, page)
+
+    def dirty_files(self) -> Dict[str, str]:
+        files: Dict[str, str] = {}
+        for meta_path, node in self._nodes.items():
+            if node.dirty:
+                node.payload["pages"] = list(node.pages)
+                files[meta_path] = dump_json(node.payload)
+        return files
+
+    def flush(self, root: Path) -> List[str]:
+        """Write every changed meta.json under ``root`` atomically; return their paths."""
+        written = self.dirty_files()
+        for meta_path, content in written.items():
+            write_text_if_changed(root / meta_path, content)
+            self._nodes[meta_path].dirty = False
+        return sorted(written)
 
 
 def ensure_meta_page(meta_path: Path, title: str, page: str) -> None:
-    payload = load_json(meta_path)
-    payload["title"] = payload.get("title", title) or title
-    pages = payload.get("pages")
-    if not isinstance(pages, list):
-        pages = []
-    normalized_pages = [item for item in pages if isinstance(item, str)]
-    if page not in normalized_pages:
-        normalized_pages.append(page)
-    payload["pages"] = normalized_pages
-    write_json(meta_path, payload)
-
-
-def create_assets(doc_dir: Path) -> None:
+    tree = MetaTree.on_disk(meta_path.parent)
+    tree.add_page(meta_path.name, title, page)
+    tree.flush(meta_path.parent)
+
+
+@dataclass(frozen=True)
+class AssetSource:
+    """One file found under ``--assets-dir``; ``path`` is relative to the submission's assets/."""
+
+    path: str
+    source: Path
+    size: int
+    mtime_ns: int
+    device: int
+    inode: int
+
+
+@dataclass(frozen=True)
+class StoredAsset:
+    path: str
+    size: int
+    sha256: str
+    git_sha: str
+    object_path: Path
+
+
+def scan_assets_dir(
+    assets_dir: Path,
+    *,
+    max_file_bytes: int = DEFAULT_MAX_ASSET_BYTES,
+    max_total_bytes: int = DEFAULT_MAX_ASSETS_TOTAL_BYTES,
+) -> List[AssetSource]:
+    """List the files to ingest and enforce the size limits before anything is copied.
+
+    Files must live under one of the asset folders (``demo``, ``evidence``, ``team``); every
+    problem is reported at once.
+    """
+    if not assets_dir.is_dir():
+        raise FileNotFoundError(f"Assets directory not found: {assets_dir}")
+    sources: List[AssetSource] = []
+    problems: List[str] = []
+    for entry in sorted(os.scandir(assets_dir), key=lambda item: item.name):
+        if entry.name.startswith("."):
+            continue
+        if entry.name not in ASSET_READMES or not entry.is_dir():
+            problems.append(f"{entry.name}: expected only the folders {', '.join(ASSET_READMES)}")
+            continue
+        for directory, dirnames, filenames in os.walk(entry.path):
+            dirnames[:] = sorted(name for name in dirnames if not name.startswith("."))
+            for filename in sorted(filenames):
+                if filename.startswith("."):
+                    continue
+                source = Path(directory) / filename
+                path = source.relative_to(assets_dir).as_posix()
+                try:
+                    stat = source.stat()
+                except OSError as error:
+                    problems.append(f"{path}: {error.strerror}")
+                    continue
+                if not os.path.isfile(source):
+                    problems.append(f"{path}: not a regular file")
+                elif path == f"{entry.name}/README.md":
+                    problems.append(f"{path}: reserved for the generated folder guide")
+                elif stat.st_size > max_file_bytes:
+                    problems.append(f"{path}: {stat.st_size} bytes exceeds the {max_file_bytes}-byte file limit")
+                else:
+                    sources.append(
+                        AssetSource(path, source, stat.st_size, stat.st_mtime_ns, stat.st_dev, stat.st_ino)
+                    )
+    total = sum(source.size for source in sources)
+    if total > max_total_bytes:
+        problems.append(f"assets total {total} bytes exceeds the {max_total_bytes}-byte limit")
+    if problems:
+        raise ValueError("Invalid assets:\n- " + "\n- ".join(problems))
+    return sources
+
+
+def clone_file(source: Path, target: Path) -> str:
+    """Materialize ``source`` at ``target`` without moving bytes through Python when possible.
+
+    Tries a hard link, then a reflink (FICLONE), then ``copy_file_range``, and only then a
+    streamed copy. Returns the method used.
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        if os.path.samefile(source, target):
+            return "existing"
+        target.unlink()
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(source, target)
+        return "hardlink"
+    except OSError:
+        pass
+    temp_path = target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with source.open("rb") as src, temp_path.open("wb") as dst:
+            method = copy_file_contents(src, dst, os.fstat(src.fileno()).st_size)
+        os.replace(temp_path, target)
+    finally:
+        temp_path.unlink(missing_ok=True)
+    return method
+
+
+def copy_file_contents(src: IO[bytes], dst: IO[bytes], size: int) -> str:
+    if fcntl is not None:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            return "reflink"
+        except OSError:
+            pass
+    if hasattr(os, "copy_file_range"):
+        copied = 0
+        try:
+            while copied < size:
+                sent = os.copy_file_range(src.fileno(), dst.fileno(), size - copied)
+                if not sent:
+                    break
+                copied += sent
+            return "copy_file_range"
+        except OSError:
+            if copied:
+                raise
+    shutil.copyfileobj(src, dst, ASSET_COPY_CHUNK_BYTES)
+    return "stream"
+
+
+class AssetStore:
+    """Content-addressed asset objects under ``<cache-dir>/assets``, shared by all submissions.
+
+    Each source file is streamed into the store once while it is hashed (sha256 for the
+    object name, the git blob id for change detection). An index keyed by device, inode,
+    size and mtime lets unchanged sources skip re-reading on later runs. Submissions then
+    get hard links (or reflink/kernel copies) of the stored objects.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.root = cache_dir.expanduser().resolve() / "assets"
+        self.index_path = self.root / "index.json"
+        self._index: Dict[str, Dict[str, object]] = {}
+        self._dirty = False
+        try:
+            self._index = json.loads(self.index_path.read_text(encoding="utf-8")).get("files", {})
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def object_path(self, sha256: str) -> Path:
+        return self.root / "objects" / sha256[:2] / sha256
+
+    def ingest(self, source: AssetSource) -> StoredAsset:
+        key = f"{source.device}:{source.inode}"
+        known = self._index.get(key)
+        if known and known.get("size") == source.size and known.get("mtime_ns") == source.mtime_ns:
+            object_path = self.object_path(str(known["sha256"]))
+            if object_path.exists():
+                return StoredAsset(source.path, source.size, str(known["sha256"]), str(known["git_sha"]), object_path)
+
+        sha256 = hashlib.sha256()
+        git_sha = hashlib.sha1(b"blob %d\0" % source.size)
+        staging = self.root / "objects" / f".ingest.{os.getpid()}.{threading.get_ident()}.tmp"
+        staging.parent.mkdir(parents=True, exist_ok=True)
+        copied = 0
+        try:
+            buffer = bytearray(ASSET_COPY_CHUNK_BYTES)
+            view = memoryview(buffer)
+            with source.source.open("rb") as src, staging.open("wb") as dst:
+                while True:
+                    count = src.readinto(buffer)
+                    if not count:
+                        break
+                    sha256.update(view[:count])
+                    git_sha.update(view[:count])
+                    dst.write(view[:count])
+                    copied += count
+            if copied != source.size:
+                raise RuntimeError(f"Asset changed while it was being copied: {source.source}")
+            object_path = self.object_path(sha256.hexdigest())
+            if object_path.exists():
+                staging.unlink()
+            else:
+                object_path.parent.mkdir(parents=True, exist_ok=True)
+                # Objects are shared through hard links, so keep them read-only.
+                os.chmod(staging, 0o444)
+                os.replace(staging, object_path)
+        finally:
+            staging.unlink(missing_ok=True)
+        self._index[key] = {
+            "size": source.size,
+            "mtime_ns": source.mtime_ns,
+            "sha256": sha256.hexdigest(),
+            "git_sha": git_sha.hexdigest(),
+        }
+        self._dirty = True
+        return StoredAsset(source.path, source.size, sha256.hexdigest(), git_sha.hexdigest(), object_path)
+
+    def save(self) -> None:
+        if self._dirty:
+            write_json(self.index_path, {"version": 1, "files": self._index})
+            self._dirty = False
+
+
+@timed_phase("assets")
+def ingest_assets(
+    assets_dir: Path,
+    cache_dir: Path,
+    *,
+    max_file_bytes: int = DEFAULT_MAX_ASSET_BYTES,
+    max_total_bytes: int = DEFAULT_MAX_ASSETS_TOTAL_BYTES,
+    store: Optional[AssetStore] = None,
+) -> List[StoredAsset]:
+    """Check ``assets_dir`` against the limits, then stream its files into the asset store."""
+    sources = scan_assets_dir(assets_dir, max_file_bytes=max_file_bytes, max_total_bytes=max_total_bytes)
+    asset_store = store or AssetStore(cache_dir)
+    assets = [asset_store.ingest(source) for source in sources]
+    if store is None:
+        asset_store.save()
+    return assets
+
+
+def asset_manifest(assets: Sequence[StoredAsset]) -> str:
+    return dump_json(
+        {
+            "version": 1,
+            "files": [{"path": asset.path, "size": asset.size, "sha256": asset.sha256} for asset in assets],
+        }
+    )
+
+
+def create_assets(doc_dir: Path, assets: Sequence[StoredAsset] = ()) -> None:
     assets_root = doc_dir / "assets"
     for folder, content in ASSET_READMES.items():
-        readme_path = assets_root / folder / "README.md"
-        readme_path.parent.mkdir(parents=True, exist_ok=True)
-        readme_path.write_text(content, encoding="utf-8")
+        write_text_if_changed(assets_root / folder / "README.md", content)
+    if assets:
+        for asset in assets:
+            clone_file(asset.object_path, assets_root / asset.path)
+        write_text_if_changed(assets_root / ASSET_MANIFEST_FILENAME, asset_manifest(assets))
 
 
-def create_submission_artifacts(
-    repo_root: Path,
+def submission_doc_dir(team_slug: str, project_slug: str) -> str:
+    return f"contents/docs/vibe-coding/{team_slug}/{project_slug}"
+
+
+def submission_meta_entries(
+    *, team_name: str, project_name: str, team_slug: str, project_slug: str
+) -> List[Tuple[str, str, str]]:
+    """Return (meta.json path, default title, page) for every navigation level of a submission."""
+    return [
+        ("contents/docs/meta.json", "해카톤 문서", "vibe-coding"),
+        ("contents/docs/vibe-coding/meta.json", "바이브 코딩 결과", team_slug),
+        (f"contents/docs/vibe-coding/{team_slug}/meta.json", team_name, project_slug),
+        (f"{submission_doc_dir(team_slug, project_slug)}/meta.json", project_name, "vibecoding-result"),
+    ]
+
+
+def build_replacements(
     *,
     team_name: str,
     project_name: str,
@@ -204,46 +1438,8 @@ def create_submission_artifacts(
     ai_validation_notes: str,
     presentation_url: str,
     extra_links: str,
-    update_existing: bool,
-) -> Path:
-    skill_root = Path(__file__).resolve().parents[1]
-    template = load_template(skill_root)
-
-    required_placeholders = {
-        "FRONTMATTER_TITLE",
-        "FRONTMATTER_SUMMARY",
-        "FRONTMATTER_DESCRIPTION",
-        "TEAM_NAME",
-        "PROJECT_NAME",
-        "REPO_URL",
-        "DEMO_URL_OR_RUN_METHOD",
-        "PROBLEM_DEFINITION",
-        "SOLUTION",
-        "ONE_LINER",
-        "DEMO_SUMMARY",
-        "TEAM_ROLES",
-        "TECH_STACK",
-        "RUN_VERIFY",
-        "LICENSE_SOURCES",
-        "AI_USED",
-        "AI_VALIDATION_NOTES",
-        "PRESENTATION_URL",
-        "EXTRA_LINKS",
-    }
-    ensure_required_placeholders(template, required_placeholders)
-
-    team_slug = slugify(team_name)
-    project_slug = slugify(project_name)
-
-    docs_root = repo_root / "contents" / "docs"
-    doc_dir = docs_root / "vibe-coding" / team_slug / project_slug
-    doc_file = doc_dir / DEFAULT_DOC_FILENAME
-    if doc_file.exists() and not update_existing:
-        raise FileExistsError(
-            f"Document already exists at {doc_file}. Re-run with --update to overwrite."
-        )
-
-    replacements = {
+) -> Dict[str, str]:
+    return {
         "FRONTMATTER_TITLE": sanitize_frontmatter_value(f"{project_name} 결과 문서"),
         "FRONTMATTER_SUMMARY": sanitize_frontmatter_value(one_liner),
         "FRONTMATTER_DESCRIPTION": sanitize_frontmatter_value(
@@ -267,68 +1463,1272 @@ def create_submission_artifacts(
         "EXTRA_LINKS": normalize_text(extra_links, "미기재"),
     }
 
-    rendered = render_template(template, replacements)
-    validate_document(rendered)
-
-    doc_dir.mkdir(parents=True, exist_ok=True)
-    doc_file.write_text(rendered, encoding="utf-8")
-    create_assets(doc_dir)
 
-    ensure_meta_page(docs_root / "meta.json", "해카톤 문서", "vibe-coding")
-    ensure_meta_page(docs_root / "vibe-coding" / "meta.json", "바이브 코딩 결과", team_slug)
-    ensure_meta_page(docs_root / "vibe-coding" / team_slug / "meta.json", team_name, project_slug)
-    ensure_meta_page(
-        docs_root / "vibe-coding" / team_slug / project_slug / "meta.json",
-        project_name,
-        "vibecoding-result",
+@timed_phase("render")
+def render_submission(**fields: str) -> str:
+    skill_root = Path(__file__).resolve().parents[1]
+    template = load_compiled_template(skill_root)
+    rendered = template.render(build_replacements(**fields))
+    validate_document(rendered)
+    return rendered
+
+
+def build_submission_files(
+    read_file: Callable[[str], Optional[str]],
+    *,
+    update_existing: bool,
+    assets: Sequence[StoredAsset] = (),
+    meta_tree: Optional[MetaTree] = None,
+    document: Optional[str] = None,
+    **fields: str,
+) -> Dict[str, Union[str, Path]]:
+    """Render a submission into {repo-relative path: content} without touching disk.
+
+    ``read_file`` returns the current content of a repo-relative path (or None), so the same
+    plan can be computed against a working tree or directly against git objects. Ingested
+    assets map to their stored object path instead of text. With a shared ``meta_tree`` the
+    navigation entries are only added to it, and the caller collects its dirty files once.
+    ``document`` is the already rendered document, when the caller has one.
+    """
+    team_slug = slugify(fields["team_name"])
+    project_slug = slugify(fields["project_name"])
+    doc_dir = submission_doc_dir(team_slug, project_slug)
+    doc_path = f"{doc_dir}/{DEFAULT_DOC_FILENAME}"
+    if not update_existing and read_file(doc_path) is not None:
+        raise FileExistsError(
+            f"Document already exists at {doc_path}. Re-run with --update to overwrite."
+        )
+
+    files: Dict[str, Union[str, Path]] = {doc_path: render_submission(**fields) if document is None else document}
+    for folder, content in ASSET_READMES.items():
+        files[f"{doc_dir}/assets/{folder}/README.md"] = content
+    if assets:
+        for asset in assets:
+            files[f"{doc_dir}/assets/{asset.path}"] = asset.object_path
+        files[f"{doc_dir}/assets/{ASSET_MANIFEST_FILENAME}"] = asset_manifest(assets)
+    with phase("meta"):
+        tree = meta_tree or MetaTree(read_file)
+        tree.add_submission(
+            team_name=fields["team_name"],
+            project_name=fields["project_name"],
+            team_slug=team_slug,
+            project_slug=project_slug,
+        )
+        if meta_tree is None:
+            files.update(tree.dirty_files())
+    return files
+
+
+def git_blob_sha(content: str) -> str:
+    """Return the object id git assigns to ``content`` as a blob."""
+    data = content.encode("utf-8")
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def submission_blobs(
+    fields: Mapping[str, str], assets: Sequence[StoredAsset] = (), *, document: Optional[str] = None
+) -> Dict[str, str]:
+    """Return {repo-relative path: git blob sha} for the document, asset READMEs and assets."""
+    doc_dir = submission_doc_dir(slugify(fields["team_name"]), slugify(fields["project_name"]))
+    if document is None:
+        document = render_submission(**fields)
+    blobs = {f"{doc_dir}/{DEFAULT_DOC_FILENAME}": git_blob_sha(document)}
+    for folder, content in ASSET_READMES.items():
+        blobs[f"{doc_dir}/assets/{folder}/README.md"] = git_blob_sha(content)
+    if assets:
+        for asset in assets:
+            blobs[f"{doc_dir}/assets/{asset.path}"] = asset.git_sha
+        blobs[f"{doc_dir}/assets/{ASSET_MANIFEST_FILENAME}"] = git_blob_sha(asset_manifest(assets))
+    return blobs
+
+
+def submission_fingerprint(blobs: Mapping[str, str]) -> str:
+    """Short, stable fingerprint of a rendered submission (normalized inputs included)."""
+    digest = hashlib.sha256()
+    for path in sorted(blobs):
+        digest.update(f"{path}\0{blobs[path]}\n".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def submission_matches_remote(blobs: Mapping[str, str], remote: Mapping[str, str], doc_dir: str) -> bool:
+    """True when every rendered file and the project meta.json already exist with these bytes."""
+    return f"{doc_dir}/meta.json" in remote and all(remote.get(path) == sha for path, sha in blobs.items())
+
+
+def create_submission_artifacts(
+    repo_root: Path,
+    *,
+    team_name: str,
+    project_name: str,
+    repo_url: str,
+    demo_url_or_run_method: str,
+    problem_definition: str,
+    one_liner: str,
+    team_roles: str,
+    solution: str,
+    tech_stack: str,
+    run_verify: str,
+    demo_summary: str,
+    license_sources: str,
+    ai_used: str,
+    ai_validation_notes: str,
+    presentation_url: str,
+    extra_links: str,
+    update_existing: bool,
+    meta_tree: Optional[MetaTree] = None,
+    assets: Sequence[StoredAsset] = (),
+    document: Optional[str] = None,
+) -> Path:
+    """Write the document, assets and navigation entries of one submission under ``repo_root``.
+
+    Pass a shared ``meta_tree`` to coalesce meta.json updates across submissions; the caller
+    then flushes it once. Without one, the meta files are flushed before returning.
+    ``document`` is the already rendered document, when the caller has one.
+    """
+    team_slug = slugify(team_name)
+    project_slug = slugify(project_name)
+
+    docs_root = repo_root / "contents" / "docs"
+    doc_dir = docs_root / "vibe-coding" / team_slug / project_slug
+    doc_file = doc_dir / DEFAULT_DOC_FILENAME
+    if doc_file.exists() and not update_existing:
+        raise FileExistsError(
+            f"Document already exists at {doc_file}. Re-run with --update to overwrite."
+        )
+
+    rendered = document or render_submission(
+        team_name=team_name,
+        project_name=project_name,
+        repo_url=repo_url,
+        demo_url_or_run_method=demo_url_or_run_method,
+        problem_definition=problem_definition,
+        one_liner=one_liner,
+        team_roles=team_roles,
+        solution=solution,
+        tech_stack=tech_stack,
+        run_verify=run_verify,
+        demo_summary=demo_summary,
+        license_sources=license_sources,
+        ai_used=ai_used,
+        ai_validation_notes=ai_validation_notes,
+        presentation_url=presentation_url,
+        extra_links=extra_links,
     )
 
+    write_text_if_changed(doc_file, rendered)
+    create_assets(doc_dir, assets)
+
+    with phase("meta"):
+        tree = meta_tree or MetaTree.on_disk(repo_root)
+        tree.add_submission(
+            team_name=team_name,
+            project_name=project_name,
+            team_slug=team_slug,
+            project_slug=project_slug,
+        )
+        if meta_tree is None:
+            tree.flush(repo_root)
+
     return doc_file
 
 
+class GitHubAPIError(CommandError):
+    """Raised when a GitHub REST API request fails."""
+
+    def __init__(self, message: str, *, status: int = 0, headers: Optional[Mapping[str, str]] = None) -> None:
+        super().__init__(message)
+        self.status = status
+        self.headers = dict(headers or {})
+
+
+class GitHubClient:
+    """Minimal GitHub REST client that reuses keep-alive connections across calls and threads."""
+
+    def __init__(self, token: str, *, base_url: str = DEFAULT_GITHUB_API_URL, timeout: float = 30.0) -> None:
+        parsed = urllib.parse.urlsplit(base_url)
+        if parsed.scheme not in {"http", "https"} or not parsed.netloc:
+            raise ValueError(f"Invalid GitHub API URL: {base_url}")
+        self.token = token
+        self.base_url = base_url
+        self.timeout = timeout
+        self._scheme = parsed.scheme
+        self._netloc = parsed.netloc
+        self._path_prefix = parsed.path.rstrip("/")
+        self._pool: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue()
+
+    def _connect(self) -> http.client.HTTPConnection:
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            connection_class = (
+                http.client.HTTPSConnection if self._scheme == "https" else http.client.HTTPConnection
+            )
+            return connection_class(self._netloc, timeout=self.timeout)
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Mapping[str, str]] = None,
+        payload: Optional[Mapping[str, object]] = None,
+        allow_statuses: Iterable[int] = (),
+        recover: Optional[Callable[[], Optional[Tuple[int, object]]]] = None,
+    ) -> Tuple[int, object]:
+        endpoint = "read" if method == "GET" else "write"
+        return _GITHUB_SCHEDULER.call(
+            endpoint,
+            functools.partial(
+                self._request, method, path, params=params, payload=payload, allow_statuses=allow_statuses
+            ),
+            recover=recover,
+        )
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Mapping[str, str]] = None,
+        payload: Optional[Mapping[str, object]] = None,
+        allow_statuses: Iterable[int] = (),
+    ) -> Tuple[int, object]:
+        url = self._path_prefix + path
+        if params:
+            url = f"{url}?{urllib.parse.urlencode(params)}"
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        headers = {
+            "Accept": "application/vnd.github+json",
+            "Authorization": f"Bearer {self.token}",
+            "User-Agent": "hackathon-submission",
+            "X-GitHub-Api-Version": GITHUB_API_VERSION,
+        }
+        if body is not None:
+            headers["Content-Type"] = "application/json"
+
+        # A pooled connection may have been closed by the server while idle; retry once on a
+        # fresh connection in that case.
+        for attempt in range(2):
+            connection = self._connect()
+            try:
+                connection.request(method, url, body=body, headers=headers)
+                response = connection.getresponse()
+                raw = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                connection.close()
+                if attempt:
+                    raise
+                continue
+            except Exception:
+                connection.close()
+                raise
+            if response.will_close:
+                connection.close()
+            else:
+                self._pool.put(connection)
+            break
+
+        response_headers = {key.lower(): value for key, value in response.getheaders()}
+        _GITHUB_SCHEDULER.observe(response_headers)
+        data: object = None
+        if raw:
+            try:
+                data = json.loads(raw.decode("utf-8"))
+            except ValueError:
+                data = raw.decode("utf-8", errors="replace")
+        if response.status >= 400 and response.status not in allow_statuses:
+            message = data.get("message", "") if isinstance(data, dict) else str(data or "")
+            raise GitHubAPIError(
+                f"GitHub API {method} {path} failed ({response.status}): {message}",
+                status=response.status,
+                headers=response_headers,
+            )
+        return response.status, data
+
+    def get_login(self) -> str:
+        _, data = self.request("GET", "/user")
+        if not isinstance(data, dict) or not data.get("login"):
+            raise GitHubAPIError("GitHub API did not return the authenticated login.")
+        return str(data["login"])
+
+    def repo_exists(self, repo: str) -> bool:
+        status, _ = self.request("GET", f"/repos/{repo}", allow_statuses=(404,))
+        return status != 404
+
+    def create_fork(self, repo: str, fork_repo: str) -> None:
+        self.request(
+            "POST",
+            f"/repos/{repo}/forks",
+            payload={"default_branch_only": True},
+            recover=lambda: (200, {}) if self.repo_exists(fork_repo) else None,
+        )
+
+    def find_open_pr(self, repo: str, head: str) -> str:
+        _, data = self.request("GET", f"/repos/{repo}/pulls", params={"state": "open", "head": head})
+        if isinstance(data, list) and data and isinstance(data[0], dict):
+            return str(data[0].get("html_url") or "")
+        return ""
+
+    def tree_entries(self, repo: str, tree_ish: str) -> Optional[Dict[str, Tuple[str, str]]]:
+        """Return {path: (type, sha)} below ``tree_ish`` (e.g. ``main:dir``), or None if missing."""
+        quoted = urllib.parse.quote(tree_ish, safe="/:")
+        status, data = self.request(
+            "GET",
+            f"/repos/{repo}/git/trees/{quoted}",
+            params={"recursive": "1"},
+            allow_statuses=(404, 422),
+        )
+        if status >= 400 or not isinstance(data, dict):
+            return None
+        if data.get("truncated"):
+            raise GitHubAPIError(f"GitHub API returned a truncated tree for {tree_ish}.")
+        return {
+            str(entry["path"]): (str(entry["type"]), str(entry["sha"]))
+            for entry in data.get("tree", [])
+            if isinstance(entry, dict)
+        }
+
+    def file_content(self, repo: str, path: str, ref: str) -> Optional[str]:
+        status, data = self.request(
+            "GET",
+            f"/repos/{repo}/contents/{urllib.parse.quote(path)}",
+            params={"ref": ref},
+            allow_statuses=(404,),
+        )
+        if status == 404 or not isinstance(data, dict) or data.get("type") != "file":
+            return None
+        return base64.b64decode(str(data.get("content", ""))).decode("utf-8")
+
+    def create_pr(self, repo: str, *, base: str, head: str, title: str, body: str) -> str:
+        def recover() -> Optional[Tuple[int, object]]:
+            existing = self.find_open_pr(repo, head)
+            return (200, {"html_url": existing}) if existing else None
+
+        _, data = self.request(
+            "POST",
+            f"/repos/{repo}/pulls",
+            payload={"base": base, "head": head, "title": title, "body": body},
+            recover=recover,
+        )
+        if not isinstance(data, dict) or not data.get("html_url"):
+            raise GitHubAPIError("GitHub API did not return the created pull request URL.")
+        return str(data["html_url"])
+
+
+def discover_github_token() -> str:
+    for name in ("GH_TOKEN", "GITHUB_TOKEN"):
+        value = os.environ.get(name, "").strip()
+        if value:
+            return value
+    try:
+        return run(["gh", "auth", "token"], check=False)
+    except OSError:
+        return ""
+
+
+def open_github_client(args: argparse.Namespace) -> Optional[GitHubClient]:
+    """Return a REST client when a token is available, or None to fall back to the gh CLI."""
+    if args.use_gh_cli:
+        return None
+    token = discover_github_token()
+    if not token:
+        return None
+    return GitHubClient(token, base_url=args.github_api_url)
+
+
+class GitHubMetadataCache:
+    """Login, fork and repository checks for one token, kept in ``<cache-dir>/github``.
+
+    The file name is a fingerprint of the API URL and token, so switching accounts never
+    reuses another account's answers. Only successful lookups are stored, each for ``ttl``
+    seconds. Entries that were served during a run which then failed are dropped, so a
+    stale answer costs at most one failed run.
+    """
+
+    def __init__(self, cache_dir: Path, token: str, *, api_url: str, ttl: float, refresh: bool = False) -> None:
+        fingerprint = hashlib.sha256(f"{api_url}\0{token}".encode("utf-8")).hexdigest()[:16]
+        self.path = cache_dir / "github" / f"{fingerprint}.json"
+        self.ttl = ttl
+        self._entries: Dict[str, Dict[str, object]] = {}
+        self._served: Set[str] = set()
+        self._lock = threading.Lock()
+        if not refresh:
+            try:
+                self._entries = json.loads(self.path.read_text(encoding="utf-8")).get("entries", {})
+            except (OSError, ValueError, AttributeError):
+                pass
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if not entry or time.time() - float(entry.get("stored_at", 0)) > self.ttl:  # type: ignore[arg-type]
+                return None
+            self._served.add(key)
+            return str(entry["value"])
+
+    def put(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = {"value": value, "stored_at": time.time()}
+            self._served.discard(key)
+            self._save()
+
+    def invalidate_served(self) -> bool:
+        """Forget every entry answered from the cache in this run; True if there were any."""
+        with self._lock:
+            if not self._served:
+                return False
+            for key in self._served:
+                self._entries.pop(key, None)
+            self._served.clear()
+            self._save()
+            return True
+
+    def _save(self) -> None:
+        write_json(self.path, {"version": 1, "entries": self._entries})
+
+
+def open_github_metadata_cache(
+    args: argparse.Namespace, client: Optional[GitHubClient]
+) -> Optional[GitHubMetadataCache]:
+    if args.github_cache_ttl <= 0:
+        return None
+    token = client.token if client is not None else discover_github_token()
+    if not token:
+        return None
+    return GitHubMetadataCache(
+        Path(args.cache_dir).expanduser(),
+        token,
+        api_url=args.github_api_url,
+        ttl=args.github_cache_ttl,
+        refresh=args.refresh,
+    )
+
+
+def forget_github_metadata(cache: Optional[GitHubMetadataCache]) -> None:
+    if cache is not None and cache.invalidate_served():
+        print("[INFO] Cleared cached GitHub login/fork/repository data; the next run looks them up again.")
+
+
 def ensure_gh_cli_and_auth() -> None:
     run(["gh", "--version"])
     run(["gh", "auth", "status"])
 
 
-def ensure_fork(target_repo: str, login: str, *, create_if_missing: bool = True) -> str:
+@timed_phase("auth")
+def resolve_login(client: Optional[GitHubClient], cache: Optional[GitHubMetadataCache] = None) -> str:
+    login = cache.get("login") if cache else None
+    if login:
+        return login
+    if client is not None:
+        login = client.get_login()
+    else:
+        ensure_gh_cli_and_auth()
+        login = run(["gh", "api", "user", "--jq", ".login"])
+    if cache:
+        cache.put("login", login)
+    return login
+
+
+@timed_phase("repo-check")
+def ensure_repo_exists(
+    repo: str, client: Optional[GitHubClient], cache: Optional[GitHubMetadataCache] = None
+) -> None:
+    if cache and cache.get(f"repo:{repo}"):
+        return
+    if client is None:
+        run(["gh", "repo", "view", repo])
+    elif not client.repo_exists(repo):
+        raise RuntimeError(f"Repository not found or not accessible: {repo}")
+    if cache:
+        cache.put(f"repo:{repo}", "exists")
+
+
+@timed_phase("fork")
+def ensure_fork(
+    target_repo: str,
+    login: str,
+    *,
+    create_if_missing: bool = True,
+    client: Optional[GitHubClient] = None,
+    cache: Optional[GitHubMetadataCache] = None,
+) -> str:
     target_repo_name = target_repo.split("/")[-1]
     fork_repo = f"{login}/{target_repo_name}"
-    try:
-        run(["gh", "repo", "view", fork_repo])
-    except CommandError:
+    if cache and cache.get(f"fork:{fork_repo}"):
+        return fork_repo
+    fork_repo = find_or_create_fork(target_repo, fork_repo, create_if_missing=create_if_missing, client=client)
+    if cache:
+        cache.put(f"fork:{fork_repo}", "exists")
+    return fork_repo
+
+
+def find_or_create_fork(
+    target_repo: str,
+    fork_repo: str,
+    *,
+    create_if_missing: bool,
+    client: Optional[GitHubClient],
+) -> str:
+    if client is not None:
+        if client.repo_exists(fork_repo):
+            return fork_repo
         if not create_if_missing:
             raise RuntimeError(
                 f"Fork repository does not exist: {fork_repo}. "
                 f"Create it first with: gh repo fork {target_repo} --clone=false --remote=false"
             )
-        run(["gh", "repo", "fork", target_repo, "--clone=false", "--remote=false"])
+        client.create_fork(target_repo, fork_repo)
+        # Forking is asynchronous on GitHub's side; wait until the fork can receive a push.
+        deadline = time.monotonic() + FORK_READY_TIMEOUT_SECONDS
+        while not client.repo_exists(fork_repo):
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Fork repository was not ready in time: {fork_repo}")
+            time.sleep(1)
+        return fork_repo
+    if not gh_repo_exists(fork_repo):
+        if not create_if_missing:
+            raise RuntimeError(
+                f"Fork repository does not exist: {fork_repo}. "
+                f"Create it first with: gh repo fork {target_repo} --clone=false --remote=false"
+            )
+        run(
+            ["gh", "repo", "fork", target_repo, "--clone=false", "--remote=false"],
+            recover=lambda: fork_repo if gh_repo_exists(fork_repo) else None,
+        )
     return fork_repo
 
 
+def gh_repo_exists(repo: str) -> bool:
+    try:
+        run(["gh", "repo", "view", repo])
+    except CommandError:
+        return False
+    return True
+
+
+@timed_phase("remote-check")
+def remote_tree_entries(
+    target_repo: str,
+    base_branch: str,
+    directory: str,
+    *,
+    client: Optional[GitHubClient] = None,
+    mirror: Optional[Path] = None,
+) -> Dict[str, Tuple[str, str]]:
+    """Return {repo-relative path: (type, sha)} under ``directory`` on the base branch, without a clone.
+
+    Uses ``git ls-tree`` on a local mirror when there is one, otherwise a single REST (or
+    ``gh api``) tree call. An empty dict means the directory does not exist.
+    """
+    if mirror is not None:
+        listing = run(
+            ["git", "ls-tree", "-r", "-t", "-z", f"refs/heads/{base_branch}", "--", f"{directory}/"],
+            cwd=mirror,
+        )
+        entries: Dict[str, Tuple[str, str]] = {}
+        for record in filter(None, listing.split("\0")):
+            meta, path = record.split("\t", 1)
+            _, object_type, sha = meta.split()
+            # -t also lists the parent trees of ``directory``; keep what lies below it.
+            if path.startswith(f"{directory}/"):
+                entries[path] = (object_type, sha)
+        return entries
+    tree_ish = f"{base_branch}:{directory}"
+    if client is not None:
+        relative = client.tree_entries(target_repo, tree_ish)
+    else:
+        quoted = urllib.parse.quote(tree_ish, safe="/:")
+        try:
+            output = run(["gh", "api", f"repos/{target_repo}/git/trees/{quoted}?recursive=1"])
+        except CommandError as error:
+            if "HTTP 404" in str(error):
+                return {}
+            raise
+        data = json.loads(output)
+        relative = {str(entry["path"]): (str(entry["type"]), str(entry["sha"])) for entry in data.get("tree", [])}
+    return {f"{directory}/{path}": entry for path, entry in (relative or {}).items()}
+
+
+def remote_tree_blobs(
+    target_repo: str,
+    base_branch: str,
+    directory: str,
+    *,
+    client: Optional[GitHubClient] = None,
+    mirror: Optional[Path] = None,
+) -> Dict[str, str]:
+    entries = remote_tree_entries(target_repo, base_branch, directory, client=client, mirror=mirror)
+    return {path: sha for path, (object_type, sha) in entries.items() if object_type == "blob"}
+
+
+def read_remote_file(
+    target_repo: str,
+    base_branch: str,
+    path: str,
+    *,
+    client: Optional[GitHubClient] = None,
+    mirror: Optional[Path] = None,
+) -> Optional[str]:
+    """Return one file from the base branch without a clone, or None if it does not exist."""
+    if mirror is not None:
+        try:
+            return run(["git", "cat-file", "blob", f"refs/heads/{base_branch}:{path}"], cwd=mirror, strip=False)
+        except CommandError:
+            return None
+    if client is not None:
+        return client.file_content(target_repo, path, base_branch)
+    quoted = urllib.parse.quote(path)
+    try:
+        encoded = run(["gh", "api", f"repos/{target_repo}/contents/{quoted}?ref={base_branch}", "--jq", ".content"])
+    except CommandError as error:
+        if "HTTP 404" in str(error):
+            return None
+        raise
+    return base64.b64decode(encoded).decode("utf-8")
+
+
+@dataclass
+class RemoteSlugIndex:
+    """Submission folders (``team`` and ``team/project``) that exist under vibe-coding upstream.
+
+    ``titles`` holds known ``meta.json`` titles by folder; other folders are read on demand.
+    ``blobs`` holds every blob id under vibe-coding when the listing was fetched just now
+    (not read from a cache or the catalog), so the --update change check can reuse it.
+    """
+
+    folders: Set[str]
+    fetched_at: float
+    titles: Dict[str, str] = field(default_factory=dict)
+    blobs: Optional[Dict[str, str]] = None
+
+    def doc_blobs(self, doc_dir: str) -> Optional[Dict[str, str]]:
+        """Return {path: blob sha} under ``doc_dir``, or None when this index has no blobs."""
+        if self.blobs is None:
+            return None
+        prefix = f"{doc_dir}/"
+        return {path: sha for path, sha in self.blobs.items() if path.startswith(prefix)}
+
+
+def fetch_remote_slug_index(
+    target_repo: str,
+    base_branch: str,
+    *,
+    client: Optional[GitHubClient] = None,
+    mirror: Optional[Path] = None,
+    cache_dir: Optional[Path] = None,
+    ttl_seconds: float = REMOTE_INDEX_TTL_SECONDS,
+) -> RemoteSlugIndex:
+    """List existing submission folders, reusing a recent lookup from ``cache_dir``.
+
+    A mirror is already local and current, so it is read directly; network lookups are
+    cached for ``ttl_seconds`` so repeated runs during a submission rush stay cheap.
+    """
+    cache_path = (
+        cache_dir / "remote-index" / f"{target_repo.replace('/', '__')}@{slugify(base_branch)}.json"
+        if cache_dir is not None and mirror is None
+        else None
+    )
+    if cache_path is not None:
+        try:
+            cached = load_json(cache_path)
+        except (OSError, ValueError):
+            cached = {}
+        fetched_at = float(cached.get("fetched_at", 0) or 0)  # type: ignore[arg-type]
+        if cached.get("base_branch") == base_branch and time.time() - fetched_at < ttl_seconds:
+            return RemoteSlugIndex(folders=set(cached.get("folders", [])), fetched_at=fetched_at)  # type: ignore[arg-type]
+
+    vibe_root = "contents/docs/vibe-coding"
+    entries = remote_tree_entries(target_repo, base_branch, vibe_root, client=client, mirror=mirror)
+    folders = set()
+    blobs: Dict[str, str] = {}
+    for path, (object_type, sha) in entries.items():
+        relative = path[len(vibe_root) + 1 :]
+        if object_type == "tree" and relative.count("/") <= 1:
+            folders.add(relative)
+        elif object_type == "blob":
+            blobs[path] = sha
+    index = RemoteSlugIndex(folders=folders, fetched_at=time.time(), blobs=blobs)
+    if cache_path is not None:
+        write_json(
+            cache_path,
+            {"base_branch": base_branch, "fetched_at": index.fetched_at, "folders": sorted(folders)},
+        )
+    return index
+
+
+def catalog_slug_index(catalog_path: Path) -> RemoteSlugIndex:
+    """Read folders and their meta.json titles from a ``submission_catalog.py`` database."""
+    if not catalog_path.is_file():
+        raise FileNotFoundError(f"No submission catalog at {catalog_path}")
+    connection = sqlite3.connect(f"{catalog_path.resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        titles = {slug: title or "" for slug, title in connection.execute("SELECT slug, title FROM folders")}
+        built_at = connection.execute("SELECT value FROM catalog WHERE key = 'built_at'").fetchone()
+    finally:
+        connection.close()
+    return RemoteSlugIndex(folders=set(titles), fetched_at=float(built_at[0]) if built_at else 0.0, titles=titles)
+
+
+def load_slug_index(
+    target_repo: str,
+    base_branch: str,
+    *,
+    client: Optional[GitHubClient] = None,
+    mirror: Optional[Path] = None,
+    cache_dir: Optional[Path] = None,
+    catalog: Optional[Path] = None,
+) -> RemoteSlugIndex:
+    if catalog is not None:
+        return catalog_slug_index(catalog)
+    return fetch_remote_slug_index(target_repo, base_branch, client=client, mirror=mirror, cache_dir=cache_dir)
+
+
+def check_remote_slugs(
+    fields: Mapping[str, str],
+    *,
+    update_existing: bool,
+    index: RemoteSlugIndex,
+    read_file: Callable[[str], Optional[str]],
+) -> List[str]:
+    """Reject an existing submission folder (without --update) and describe slug collisions.
+
+    Returns warnings for folders that another team or project name already maps to.
+    """
+    team_slug = slugify(fields["team_name"])
+    project_slug = slugify(fields["project_name"])
+    doc_dir = submission_doc_dir(team_slug, project_slug)
+    if f"{team_slug}/{project_slug}" in index.folders and not update_existing:
+        raise FileExistsError(
+            f"Document already exists at {doc_dir}/{DEFAULT_DOC_FILENAME}. Re-run with --update to overwrite."
+        )
+
+    warnings: List[str] = []
+    checks = [(team_slug, f"contents/docs/vibe-coding/{team_slug}/meta.json", fields["team_name"], "team")]
+    if f"{team_slug}/{project_slug}" in index.folders:
+        checks.append((f"{team_slug}/{project_slug}", f"{doc_dir}/meta.json", fields["project_name"], "project"))
+    for slug, meta_path, name, kind in checks:
+        if slug not in index.folders:
+            continue
+        if slug in index.titles:
+            title = index.titles[slug].strip()
+        else:
+            content = read_file(meta_path)
+            payload = json.loads(content) if content else {}
+            title = str(payload.get("title", "")).strip() if isinstance(payload, dict) else ""
+        if title and title != name.strip():
+            warnings.append(
+                f"The {kind} slug '{slug}' is already used upstream by {kind} '{title}'; "
+                f"'{name.strip()}' would share that folder."
+            )
+    return warnings
+
+
+def precheck_remote_slugs(
+    fields: Mapping[str, str],
+    *,
+    update_existing: bool,
+    target_repo: str,
+    base_branch: str,
+    client: Optional[GitHubClient] = None,
+    mirror: Optional[Path] = None,
+    cache_dir: Optional[Path] = None,
+    index: Optional[RemoteSlugIndex] = None,
+    catalog: Optional[Path] = None,
+) -> Optional[RemoteSlugIndex]:
+    """Fail fast on a duplicate submission before cloning; lookup problems only skip the check.
+
+    Returns the slug index that was checked, or None when the lookup failed.
+    """
+    try:
+        if index is None:
+            index = load_slug_index(
+                target_repo, base_branch, client=client, mirror=mirror, cache_dir=cache_dir, catalog=catalog
+            )
+        warnings = check_remote_slugs(
+            fields,
+            update_existing=update_existing,
+            index=index,
+            read_file=functools.partial(read_remote_file, target_repo, base_branch, client=client, mirror=mirror),
+        )
+    except FileExistsError:
+        raise
+    except Exception as error:
+        print(f"[INFO] Remote duplicate check skipped: {error}", file=sys.stderr)
+        return None
+    for warning in warnings:
+        print(f"[WARN] {warning}", file=sys.stderr)
+    return index
+
+
+def submission_unchanged_upstream(
+    fields: Mapping[str, str],
+    *,
+    target_repo: str,
+    base_branch: str,
+    client: Optional[GitHubClient] = None,
+    mirror: Optional[Path] = None,
+    assets: Sequence[StoredAsset] = (),
+    document: Optional[str] = None,
+    remote: Optional[Mapping[str, str]] = None,
+) -> Tuple[bool, str]:
+    """Compare the rendered submission with the base branch. Returns (unchanged, fingerprint).
+
+    ``document`` is the already rendered document and ``remote`` the blob ids already listed
+    under the submission folder (e.g. by the duplicate check), when the caller has them.
+    Lookup failures are reported and treated as "changed" so the regular flow still runs.
+    """
+    blobs = submission_blobs(fields, assets, document=document)
+    fingerprint = submission_fingerprint(blobs)
+    doc_dir = submission_doc_dir(slugify(fields["team_name"]), slugify(fields["project_name"]))
+    try:
+        if remote is None:
+            remote = remote_tree_blobs(target_repo, base_branch, doc_dir, client=client, mirror=mirror)
+    except Exception as error:
+        print(f"[INFO] Remote change check skipped: {error}", file=sys.stderr)
+        return False, fingerprint
+    return submission_matches_remote(blobs, remote, doc_dir), fingerprint
+
+
+def default_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "hackathon-submission"
+
+
+class FileLock:
+    """Advisory lock on a file, shared or exclusive. A no-op where fcntl is unavailable."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._file = None
+
+    def acquire(self, *, shared: bool = False, blocking: bool = True) -> bool:
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = self.path.open("a+")
+        if fcntl is None:
+            return True
+        flags = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+        if not blocking:
+            flags |= fcntl.LOCK_NB
+        try:
+            fcntl.flock(self._file.fileno(), flags)
+        except BlockingIOError:
+            return False
+        return True
+
+    def release(self) -> None:
+        if self._file is None:
+            return
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        self._file.close()
+        self._file = None
+
+
+def directory_size(path: Path) -> int:
+    total = 0
+    for entry in path.rglob("*"):
+        try:
+            if entry.is_file() and not entry.is_symlink():
+                total += entry.stat().st_size
+        except OSError:
+            continue
+    return total
+
+
+class MirrorCache:
+    """Bare per-repository mirrors under the cache dir, shared by concurrent runs.
+
+    A mirror is refreshed under an exclusive lock and then held with a shared lock for as
+    long as checkouts borrow its objects, so eviction (which needs the exclusive lock)
+    never removes a mirror that is still in use. Each mirror's size is recorded in a
+    ``<name>.size`` file whenever a fetch moves its branch, so eviction never walks them.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        *,
+        max_age_days: float = DEFAULT_MIRROR_MAX_AGE_DAYS,
+        max_bytes: int = DEFAULT_MIRROR_MAX_BYTES,
+    ) -> None:
+        self.root = cache_dir / "mirrors"
+        self.max_age_seconds = max_age_days * 86400
+        self.max_bytes = max_bytes
+        self._locks: Dict[Path, FileLock] = {}
+
+    def mirror_path(self, repo: str) -> Path:
+        return self.root / (repo.replace("/", "__") + ".git")
+
+    @staticmethod
+    def recorded_size(mirror: Path) -> int:
+        """Return the size recorded for ``mirror``, measuring it once if it was never recorded."""
+        try:
+            return int(mirror.with_suffix(".size").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return MirrorCache.record_size(mirror)
+
+    @staticmethod
+    def record_size(mirror: Path) -> int:
+        size = directory_size(mirror)
+        write_text_atomic(mirror.with_suffix(".size"), str(size))
+        return size
+
+    @timed_phase("mirror")
+    def acquire(self, repo: str, branch: str) -> Path:
+        mirror = self.mirror_path(repo)
+        lock = self._locks.get(mirror)
+        if lock is None:
+            lock = FileLock(mirror.with_suffix(".lock"))
+            self._locks[mirror] = lock
+        lock.acquire()
+        try:
+            if not (mirror / "HEAD").exists():
+                shutil.rmtree(mirror, ignore_errors=True)
+                run(["git", "init", "--bare", "--quiet", str(mirror)])
+                run(["git", "remote", "add", "origin", f"https://github.com/{repo}.git"], cwd=mirror)
+            branch_ref = mirror / "refs" / "heads" / branch
+            head_before = branch_ref.read_bytes() if branch_ref.exists() else None
+            run(
+                ["git", "fetch", "--quiet", "--no-tags", "origin", f"+refs/heads/{branch}:refs/heads/{branch}"],
+                cwd=mirror,
+            )
+            # Only a fetch that brought new objects changes the mirror's size.
+            if head_before is None or not branch_ref.exists() or branch_ref.read_bytes() != head_before:
+                self.record_size(mirror)
+            lock.path.touch()
+        except Exception:
+            lock.release()
+            del self._locks[mirror]
+            raise
+        lock.acquire(shared=True)
+        self.evict(keep=mirror)
+        return mirror
+
+    def release(self) -> None:
+        for lock in self._locks.values():
+            lock.release()
+        self._locks.clear()
+
+    @staticmethod
+    def borrow(mirror: Path) -> FileLock:
+        """Hold a shared lock on ``mirror`` for one checkout, so no refresh runs under it."""
+        lock = FileLock(mirror.with_suffix(".lock"))
+        lock.acquire(shared=True)
+        return lock
+
+    def evict(self, *, keep: Optional[Path] = None) -> List[Path]:
+        if not self.root.exists():
+            return []
+        now = dt.datetime.now().timestamp()
+        candidates = []
+        for lock_path in self.root.glob("*.lock"):
+            mirror = lock_path.with_suffix(".git")
+            if mirror == keep or not mirror.exists():
+                continue
+            candidates.append((lock_path.stat().st_mtime, mirror, self.recorded_size(mirror)))
+        if not candidates:
+            return []
+        candidates.sort()
+        total = sum(size for _, _, size in candidates)
+        if keep is not None and keep.exists():
+            total += self.recorded_size(keep)
+
+        evicted: List[Path] = []
+        for last_used, mirror, size in candidates:
+            if now - last_used <= self.max_age_seconds and total <= self.max_bytes:
+                continue
+            lock = FileLock(mirror.with_suffix(".lock"))
+            if not lock.acquire(blocking=False):
+                continue
+            try:
+                shutil.rmtree(mirror, ignore_errors=True)
+                mirror.with_suffix(".size").unlink(missing_ok=True)
+            finally:
+                lock.release()
+            total -= size
+            evicted.append(mirror)
+        return evicted
+
+
+@timed_phase("checkout")
 def prepare_git_checkout(
     *,
     temp_root: Path,
     target_repo: str,
     base_branch: str,
-    fork_repo: str,
     branch_name: str,
+    fork_repo: Optional[str] = None,
+    fast: bool = False,
+    mirror: Optional[Path] = None,
 ) -> Path:
+    """Check out ``branch_name`` from ``upstream/<base>``.
+
+    When ``fork_repo`` is None the checkout is prepared from upstream only and the fork
+    remote is attached later with attach_fork_remote(), so it can overlap the fork lookup.
+    """
     repo_path = temp_root / "repo"
-    run(["git", "clone", f"https://github.com/{fork_repo}.git", str(repo_path)])
-    run(["git", "remote", "add", "upstream", f"https://github.com/{target_repo}.git"], cwd=repo_path)
-    run(["git", "fetch", "origin"], cwd=repo_path)
-    run(["git", "fetch", "upstream", base_branch], cwd=repo_path)
+    upstream_url = f"https://github.com/{target_repo}.git"
+    if mirror is not None:
+        # Borrow objects from the already-refreshed local mirror: no network, no copy.
+        run(["git", "clone", "--quiet", "--shared", "--no-checkout", str(mirror), str(repo_path)])
+        run(["git", "remote", "rename", "origin", "upstream"], cwd=repo_path)
+        run(["git", "remote", "set-url", "upstream", upstream_url], cwd=repo_path)
+        if fast:
+            run(["git", "sparse-checkout", "set", "--cone", *SPARSE_CHECKOUT_PATHS], cwd=repo_path)
+    elif fast:
+        # Only the submission paths are written, so skip the fork clone entirely: fetch a
+        # shallow, blob-less upstream base and materialize just contents/docs. Blobs outside
+        # the sparse cone are fetched lazily if the push ever needs them.
+        repo_path.mkdir(parents=True, exist_ok=True)
+        run(["git", "init", "--quiet", str(repo_path)])
+        run(["git", "remote", "add", "upstream", upstream_url], cwd=repo_path)
+        run(["git", "sparse-checkout", "set", "--cone", *SPARSE_CHECKOUT_PATHS], cwd=repo_path)
+        run(
+            [
+                "git",
+                "fetch",
+                "--no-tags",
+                f"--depth={FAST_CHECKOUT_DEPTH}",
+                "--filter=blob:none",
+                "upstream",
+                base_branch,
+            ],
+            cwd=repo_path,
+        )
+    else:
+        # The fork is only a push target, so clone the upstream directly: it already holds the
+        # base branch and does not need the fork to be resolved first.
+        run(["git", "clone", "--origin", "upstream", "--no-checkout", upstream_url, str(repo_path)])
+    if fork_repo is not None:
+        attach_fork_remote(repo_path, fork_repo)
     run(["git", "checkout", "-B", branch_name, f"upstream/{base_branch}"], cwd=repo_path)
     return repo_path
 
 
+def attach_fork_remote(repo_path: Path, fork_repo: str) -> None:
+    run(["git", "remote", "add", "origin", f"https://github.com/{fork_repo}.git"], cwd=repo_path)
+
+
+@timed_phase("checkout")
+def prepare_bare_repo(
+    *,
+    temp_root: Path,
+    target_repo: str,
+    base_branch: str,
+    fork_repo: Optional[str] = None,
+    mirror: Optional[Path] = None,
+) -> Path:
+    """Create an object store holding ``upstream/<base>`` without any working tree.
+
+    Without a mirror the base is fetched shallow and blob-less; the few blobs that are read
+    afterwards (the meta.json files) are fetched lazily from the promisor remote.
+    """
+    repo_path = temp_root / "repo.git"
+    run(["git", "init", "--bare", "--quiet", str(repo_path)])
+    if fork_repo is not None:
+        attach_fork_remote(repo_path, fork_repo)
+    run(["git", "remote", "add", "upstream", f"https://github.com/{target_repo}.git"], cwd=repo_path)
+    if mirror is not None:
+        (repo_path / "objects" / "info" / "alternates").write_text(
+            f"{mirror.resolve() / 'objects'}\n", encoding="utf-8"
+        )
+        refspec = f"+refs/heads/{base_branch}:refs/remotes/upstream/{base_branch}"
+        run(["git", "fetch", "--quiet", "--no-tags", str(mirror), refspec], cwd=repo_path)
+    else:
+        run(
+            [
+                "git",
+                "fetch",
+                "--no-tags",
+                f"--depth={FAST_CHECKOUT_DEPTH}",
+                "--filter=blob:none",
+                "upstream",
+                base_branch,
+            ],
+            cwd=repo_path,
+        )
+    return repo_path
+
+
+def read_tree_file(repo_path: Path, ref: str, path: str) -> Optional[str]:
+    listing = run(["git", "ls-tree", "-z", ref, "--", path], cwd=repo_path)
+    if not listing:
+        return None
+    meta, _, _ = listing.rstrip("\0").partition("\t")
+    _, object_type, sha = meta.split()
+    if object_type != "blob":
+        return None
+    return run(["git", "cat-file", "blob", sha], cwd=repo_path, strip=False)
+
+
+def write_tree_with_files(repo_path: Path, tree: Optional[str], files: Mapping[str, Union[str, Path]]) -> str:
+    """Return a new tree id equal to ``tree`` with ``files`` (relative path -> text or file) applied."""
+    entries: Dict[str, Tuple[str, str, str]] = {}
+    if tree:
+        listing = run(["git", "ls-tree", "-z", tree], cwd=repo_path)
+        for record in listing.split("\0"):
+            if not record:
+                continue
+            meta, _, name = record.partition("\t")
+            mode, object_type, sha = meta.split()
+            entries[name] = (mode, object_type, sha)
+
+    nested: Dict[str, Dict[str, Union[str, Path]]] = {}
+    for path, content in files.items():
+        head, _, rest = path.partition("/")
+        if rest:
+            nested.setdefault(head, {})[rest] = content
+        elif isinstance(content, Path):
+            # git streams the file into the object store; large assets never pass through here.
+            blob = run(["git", "hash-object", "-w", "--", str(content)], cwd=repo_path)
+            entries[head] = ("100644", "blob", blob)
+        else:
+            blob = run(["git", "hash-object", "-w", "--stdin"], cwd=repo_path, input=content)
+            entries[head] = ("100644", "blob", blob)
+    for name, subfiles in nested.items():
+        current = entries.get(name)
+        subtree = current[2] if current and current[1] == "tree" else None
+        entries[name] = ("040000", "tree", write_tree_with_files(repo_path, subtree, subfiles))
+
+    mktree_input = "".join(
+        f"{mode} {object_type} {sha}\t{name}\0" for name, (mode, object_type, sha) in entries.items()
+    )
+    # Blob-less stores do not hold the untouched blobs, so skip mktree's presence check.
+    return run(["git", "mktree", "-z", "--missing"], cwd=repo_path, input=mktree_input)
+
+
+@timed_phase("commit")
+def commit_files(
+    repo_path: Path,
+    *,
+    base_ref: str,
+    branch_name: str,
+    files: Mapping[str, Union[str, Path]],
+    message: str,
+) -> str:
+    base_commit = run(["git", "rev-parse", f"{base_ref}^{{commit}}"], cwd=repo_path)
+    base_tree = run(["git", "rev-parse", f"{base_ref}^{{tree}}"], cwd=repo_path)
+    tree = write_tree_with_files(repo_path, base_tree, files)
+    if tree == base_tree:
+        raise NoChangesError("No staged changes were found. Nothing to commit.")
+    commit_sha = run(["git", "commit-tree", tree, "-p", base_commit, "-F", "-"], cwd=repo_path, input=message)
+    run(["git", "update-ref", f"refs/heads/{branch_name}", commit_sha], cwd=repo_path)
+    return commit_sha
+
+
+def commit_submission_without_checkout(
+    repo_path: Path,
+    *,
+    base_branch: str,
+    branch_name: str,
+    update_existing: bool,
+    fields: Mapping[str, str],
+    assets: Sequence[StoredAsset] = (),
+    document: Optional[str] = None,
+) -> Tuple[str, str]:
+    """Render and commit a submission straight into git objects. Returns (document path, commit SHA)."""
+    base_ref = f"upstream/{base_branch}"
+    files = build_submission_files(
+        lambda path: read_tree_file(repo_path, base_ref, path),
+        update_existing=update_existing,
+        assets=assets,
+        document=document,
+        **fields,
+    )
+    team_slug = slugify(fields["team_name"])
+    project_slug = slugify(fields["project_name"])
+    commit_sha = commit_files(
+        repo_path,
+        base_ref=base_ref,
+        branch_name=branch_name,
+        files=files,
+        message=submission_commit_message(
+            team_slug=team_slug,
+            project_slug=project_slug,
+            project_name=fields["project_name"],
+            team_name=fields["team_name"],
+        ),
+    )
+    return f"{submission_doc_dir(team_slug, project_slug)}/{DEFAULT_DOC_FILENAME}", commit_sha
+
+
+def fast_import_data(text: str) -> str:
+    return f"data {len(text.encode('utf-8'))}\n{text}\n"
+
+
+def fast_import_path(path: str) -> str:
+    # fast-import takes unquoted paths unless they start with a quote or contain a newline.
+    return json.dumps(path, ensure_ascii=False) if path.startswith('"') or "\n" in path else path
+
+
+@timed_phase("commit")
+def fast_import_commit(
+    repo_path: Path,
+    *,
+    base_ref: str,
+    branch_name: str,
+    files: Mapping[str, Union[str, Path]],
+    message: str,
+) -> str:
+    """Stream ``files`` into one commit on top of ``base_ref`` with a single ``git fast-import``.
+
+    Text is sent inline; asset files are hashed into the object store with one
+    ``hash-object --stdin-paths`` call and referenced by id, so they are never read here.
+    """
+    base_commit = run(["git", "rev-parse", f"{base_ref}^{{commit}}"], cwd=repo_path)
+    committer = run(["git", "var", "GIT_COMMITTER_IDENT"], cwd=repo_path)
+    asset_paths = sorted({str(content) for content in files.values() if isinstance(content, Path)})
+    blob_ids: Dict[str, str] = {}
+    if asset_paths:
+        hashed = run(
+            ["git", "hash-object", "-w", "--stdin-paths"],
+            cwd=repo_path,
+            input="".join(f"{path}\n" for path in asset_paths),
+        )
+        blob_ids = dict(zip(asset_paths, hashed.splitlines()))
+
+    stream = [
+        f"commit refs/heads/{branch_name}\n",
+        f"committer {committer}\n",
+        fast_import_data(message),
+        f"from {base_commit}\n",
+    ]
+    for path in sorted(files):
+        content = files[path]
+        if isinstance(content, Path):
+            stream.append(f"M 100644 {blob_ids[str(content)]} {fast_import_path(path)}\n")
+        else:
+            stream.append(f"M 100644 inline {fast_import_path(path)}\n")
+            stream.append(fast_import_data(content))
+    stream.append("done\n")
+    run(["git", "fast-import", "--quiet", "--done"], cwd=repo_path, input="".join(stream))
+
+    commit_sha = run(["git", "rev-parse", f"refs/heads/{branch_name}"], cwd=repo_path)
+    if run(["git", "rev-parse", f"{commit_sha}^{{tree}}"], cwd=repo_path) == run(
+        ["git", "rev-parse", f"{base_commit}^{{tree}}"], cwd=repo_path
+    ):
+        raise NoChangesError("No staged changes were found. Nothing to commit.")
+    return commit_sha
+
+
 def create_branch_name(team_slug: str, project_slug: str) -> str:
     ts = dt.datetime.now(dt.timezone.utc).strftime("%Y%m%d%H%M%S")
     suffix = secrets.token_hex(3)
     return f"submission/{team_slug}-{project_slug}-{ts}-{suffix}"
 
 
+def build_compare_url(target_repo: str, base_branch: str, login: str, branch_name: str) -> str:
+    return f"https://github.com/{target_repo}/compare/{base_branch}...{login}:{branch_name}?expand=1"
+
+
 def ensure_git_identity(repo_path: Path) -> None:
     name = run(["git", "config", "--get", "user.name"], cwd=repo_path, check=False)
     email = run(["git", "config", "--get", "user.email"], cwd=repo_path, check=False)
@@ -339,13 +2739,25 @@ def ensure_git_identity(repo_path: Path) -> None:
     )
 
 
+@timed_phase("commit")
 def commit_changes(repo_path: Path, *, team_slug: str, project_slug: str, project_name: str, team_name: str) -> str:
     run(["git", "add", "contents/docs/meta.json", "contents/docs/vibe-coding"], cwd=repo_path)
     staged = run(["git", "status", "--short"], cwd=repo_path)
     if not staged:
-        raise RuntimeError("No staged changes were found. Nothing to commit.")
+        raise NoChangesError("No staged changes were found. Nothing to commit.")
+
+    commit_message = submission_commit_message(
+        team_slug=team_slug,
+        project_slug=project_slug,
+        project_name=project_name,
+        team_name=team_name,
+    )
+    run(["git", "commit", "-m", commit_message], cwd=repo_path)
+    return run(["git", "rev-parse", "HEAD"], cwd=repo_path)
 
-    commit_message = "\n".join(
+
+def submission_commit_message(*, team_slug: str, project_slug: str, project_name: str, team_name: str) -> str:
+    return "\n".join(
         [
             f"docs(submission): add {project_name} result document",
             "",
@@ -364,8 +2776,57 @@ def commit_changes(repo_path: Path, *, team_slug: str, project_slug: str, projec
             f"- AI 도구를 사용해 초안을 생성하고, 최종 스크립트 동작은 {team_name} 팀 제출 흐름 기준으로 검증",
         ]
     )
-    run(["git", "commit", "-m", commit_message], cwd=repo_path)
-    return run(["git", "rev-parse", "HEAD"], cwd=repo_path)
+
+
+def import_commit_message(submissions: Sequence[Tuple[str, str, str]]) -> str:
+    """Commit message for an organizer import of (team name, project name, document path) rows."""
+    return "\n".join(
+        [
+            f"docs(submission): import {len(submissions)} result documents",
+            "",
+            "Why:",
+            "- 별도로 접수된 해카톤 제출 결과 문서를 한 번에 공개하기 위해",
+            "",
+            "What:",
+            *(f"- {team_name} / {project_name}: {doc_path}" for team_name, project_name, doc_path in submissions),
+            "- 제출용 assets 안내 파일 및 docs meta 네비게이션 일괄 갱신",
+            "",
+            "Verify:",
+            "- create_submission_pr.py frontmatter/섹션 검증 통과",
+            "- 중복 생성 방지 규칙과 경로 생성 규칙 점검",
+        ]
+    )
+
+
+def import_pr_body(submissions: Sequence[Tuple[str, str, str]]) -> str:
+    return "\n".join(
+        [
+            "Why:",
+            f"- 별도로 접수된 해카톤 제출 결과 문서 {len(submissions)}건을 일괄 등록합니다.",
+            "",
+            "What:",
+            *(f"- {team_name} / {project_name}" for team_name, project_name, _ in submissions),
+            "",
+            "Verify:",
+            "- frontmatter 필수 필드 검증",
+            "- 요구 섹션 존재 검증",
+            "- docs meta.json 네비게이션 반영 검증",
+        ]
+    )
+
+
+@timed_phase("push")
+def push_branch(repo_path: Path, branch_name: str) -> None:
+    try:
+        run(["git", "push", "--set-upstream", "origin", branch_name], cwd=repo_path)
+    except CommandError as error:
+        shallow = run(["git", "rev-parse", "--is-shallow-repository"], cwd=repo_path, check=False)
+        if shallow != "true" or "shallow update not allowed" not in str(error):
+            raise
+        # The fork is behind the shallow upstream base, so it needs the commits in between.
+        # Deepen the history (still without blobs) and push once more.
+        run(["git", "fetch", "--unshallow", "--filter=blob:none", "upstream"], cwd=repo_path)
+        run(["git", "push", "--set-upstream", "origin", branch_name], cwd=repo_path)
 
 
 def create_or_get_pr(
@@ -377,10 +2838,97 @@ def create_or_get_pr(
     branch_name: str,
     project_name: str,
     team_name: str,
+    client: Optional[GitHubClient] = None,
+) -> str:
+    push_branch(repo_path, branch_name)
+    return open_pull_request(
+        target_repo=target_repo,
+        base_branch=base_branch,
+        head=f"{login}:{branch_name}",
+        project_name=project_name,
+        team_name=team_name,
+        client=client,
+    )
+
+
+def open_pull_request(
+    *,
+    target_repo: str,
+    base_branch: str,
+    head: str,
+    project_name: str,
+    team_name: str,
+    client: Optional[GitHubClient] = None,
+) -> str:
+    pr_body = "\n".join(
+        [
+            f"Team: {team_name}",
+            f"Project: {project_name}",
+            "",
+            "Why:",
+            "- 해카톤 제출 결과 문서를 공개 저장소에 등록합니다.",
+            "",
+            "What:",
+            "- vibecoding-result.mdx 및 제출 assets 구조를 생성/갱신했습니다.",
+            "",
+            "Verify:",
+            "- frontmatter 필수 필드 검증",
+            "- 요구 섹션 존재 검증",
+            "- docs meta.json 네비게이션 반영 검증",
+        ]
+    )
+    return create_pull_request(
+        target_repo=target_repo,
+        base_branch=base_branch,
+        head=head,
+        title=f"[Submission] {project_name}",
+        body=pr_body,
+        client=client,
+    )
+
+
+@timed_phase("pr")
+def create_pull_request(
+    *,
+    target_repo: str,
+    base_branch: str,
+    head: str,
+    title: str,
+    body: str,
+    client: Optional[GitHubClient] = None,
 ) -> str:
-    run(["git", "push", "--set-upstream", "origin", branch_name], cwd=repo_path)
+    """Return the open PR for ``head``, creating it if there is none."""
+    existing_pr = find_open_pull_request(target_repo, head, client=client)
+    if existing_pr:
+        return existing_pr
+
+    if client is not None:
+        return client.create_pr(target_repo, base=base_branch, head=head, title=title, body=body)
+    pr_url = run(
+        [
+            "gh",
+            "pr",
+            "create",
+            "--repo",
+            target_repo,
+            "--base",
+            base_branch,
+            "--head",
+            head,
+            "--title",
+            title,
+            "--body",
+            body,
+        ],
+        recover=lambda: find_open_pull_request(target_repo, head) or None,
+    )
+    return pr_url.strip().splitlines()[-1]
 
-    existing_pr = run(
+
+def find_open_pull_request(target_repo: str, head: str, *, client: Optional[GitHubClient] = None) -> str:
+    if client is not None:
+        return client.find_open_pr(target_repo, head)
+    return run(
         [
             "gh",
             "pr",
@@ -390,52 +2938,960 @@ def create_or_get_pr(
             "--state",
             "open",
             "--head",
-            f"{login}:{branch_name}",
+            head,
             "--json",
             "url",
             "--jq",
             ".[0].url",
         ]
     )
-    if existing_pr:
-        return existing_pr
 
-    pr_title = f"[Submission] {project_name}"
-    pr_body = "\n".join(
-        [
-            f"Team: {team_name}",
-            f"Project: {project_name}",
-            "",
-            "Why:",
-            "- 해카톤 제출 결과 문서를 공개 저장소에 등록합니다.",
-            "",
-            "What:",
-            "- vibecoding-result.mdx 및 제출 assets 구조를 생성/갱신했습니다.",
-            "",
-            "Verify:",
-            "- frontmatter 필수 필드 검증",
-            "- 요구 섹션 존재 검증",
-            "- docs meta.json 네비게이션 반영 검증",
-        ]
-    )
-    pr_url = run(
-        [
-            "gh",
-            "pr",
-            "create",
-            "--repo",
-            target_repo,
-            "--base",
-            base_branch,
-            "--head",
-            f"{login}:{branch_name}",
-            "--title",
-            pr_title,
-            "--body",
-            pr_body,
-        ]
+
+def submission_fields_from_args(args: argparse.Namespace) -> Dict[str, str]:
+    return {name: getattr(args, name) or "" for name in SUBMISSION_FIELDS}
+
+
+def parse_bool(value: object) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in {"1", "true", "yes", "y", "on"}
+
+
+def normalize_manifest_row(raw: Mapping[str, object]) -> Dict[str, str]:
+    row: Dict[str, str] = {}
+    for key, value in raw.items():
+        if key is None:
+            continue
+        name = str(key).strip().lower().replace("-", "_")
+        row[name] = "" if value is None else str(value)
+    return row
+
+
+def load_manifest(path: Path) -> List[Dict[str, str]]:
+    if not path.exists():
+        raise FileNotFoundError(f"Manifest not found: {path}")
+    raw_rows: List[Mapping[str, object]] = []
+    if path.suffix.lower() == ".csv":
+        with path.open("r", encoding="utf-8-sig", newline="") as file:
+            raw_rows.extend(csv.DictReader(file))
+    else:
+        with path.open("r", encoding="utf-8") as file:
+            for line_number, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    item = json.loads(line)
+                except json.JSONDecodeError as error:
+                    raise ValueError(f"Invalid JSON at {path}:{line_number}: {error.msg}") from error
+                if not isinstance(item, dict):
+                    raise ValueError(f"Manifest row must be a JSON object at {path}:{line_number}")
+                raw_rows.append(item)
+    return [normalize_manifest_row(row) for row in raw_rows]
+
+
+@dataclass
+class BatchResult:
+    row: int
+    team_name: str
+    project_name: str
+    status: str = "pending"
+    team_slug: str = ""
+    project_slug: str = ""
+    document_path: str = ""
+    branch: str = ""
+    commit_sha: str = ""
+    pr_url: str = ""
+    compare_url: str = ""
+    error: str = ""
+
+
+def manifest_row_fields(row: Mapping[str, str]) -> Dict[str, str]:
+    missing = [name for name in REQUIRED_SUBMISSION_FIELDS if not row.get(name, "").strip()]
+    if missing:
+        raise ValueError(f"Missing required field(s): {', '.join(missing)}")
+    fields = {name: row.get(name, "") for name in SUBMISSION_FIELDS}
+    fields["ai_used"] = fields["ai_used"].strip() or AI_USED_CHOICES[0]
+    if fields["ai_used"] not in AI_USED_CHOICES:
+        raise ValueError(f"Invalid ai_used value: {fields['ai_used']}")
+    return fields
+
+
+def submit_batch_row(
+    result: BatchResult,
+    fields: Dict[str, str],
+    *,
+    update_existing: bool,
+    temp_root: Path,
+    target_repo: str,
+    base_branch: str,
+    login: str,
+    fork_repo: str,
+    fast_checkout: bool = False,
+    mirror: Optional[Path] = None,
+    plumbing_commit: bool = False,
+    client: Optional[GitHubClient] = None,
+    assets: Sequence[StoredAsset] = (),
+) -> BatchResult:
+    with phase("submission", row=result.row):
+        try:
+            document = render_submission(**fields)
+            if update_existing:
+                unchanged, _ = submission_unchanged_upstream(
+                    fields,
+                    target_repo=target_repo,
+                    base_branch=base_branch,
+                    client=client,
+                    mirror=mirror,
+                    assets=assets,
+                    document=document,
+                )
+                if unchanged:
+                    result.status = "unchanged"
+                    return result
+            result.branch = create_branch_name(result.team_slug, result.project_slug)
+            row_root = temp_root / f"row-{result.row}"
+            row_root.mkdir(parents=True, exist_ok=True)
+            if plumbing_commit:
+                repo_path = prepare_bare_repo(
+                    temp_root=row_root,
+                    target_repo=target_repo,
+                    base_branch=base_branch,
+                    fork_repo=fork_repo,
+                    mirror=mirror,
+                )
+                ensure_git_identity(repo_path)
+                result.document_path, result.commit_sha = commit_submission_without_checkout(
+                    repo_path,
+                    base_branch=base_branch,
+                    branch_name=result.branch,
+                    update_existing=update_existing,
+                    fields=fields,
+                    assets=assets,
+                    document=document,
+                )
+            else:
+                repo_path = prepare_git_checkout(
+                    temp_root=row_root,
+                    target_repo=target_repo,
+                    base_branch=base_branch,
+                    fork_repo=fork_repo,
+                    branch_name=result.branch,
+                    fast=fast_checkout,
+                    mirror=mirror,
+                )
+                ensure_git_identity(repo_path)
+                created_doc = create_submission_artifacts(
+                    repo_path,
+                    **fields,
+                    update_existing=update_existing,
+                    assets=assets,
+                    document=document,
+                )
+                result.document_path = str(created_doc.relative_to(repo_path))
+                result.commit_sha = commit_changes(
+                    repo_path,
+                    team_slug=result.team_slug,
+                    project_slug=result.project_slug,
+                    project_name=fields["project_name"],
+                    team_name=fields["team_name"],
+                )
+            result.pr_url = create_or_get_pr(
+                repo_path=repo_path,
+                target_repo=target_repo,
+                base_branch=base_branch,
+                login=login,
+                branch_name=result.branch,
+                project_name=fields["project_name"],
+                team_name=fields["team_name"],
+                client=client,
+            )
+            result.status = "submitted"
+        except NoChangesError:
+            result.status = "unchanged"
+        except Exception as error:
+            result.status = "failed"
+            result.error = str(error)
+            result.compare_url = build_compare_url(target_repo, base_branch, login, result.branch)
+    return result
+
+
+def reject_remote_duplicates(
+    pending: List[Tuple[BatchResult, Dict[str, str], bool]],
+    *,
+    target_repo: str,
+    base_branch: str,
+    client: Optional[GitHubClient],
+    mirror: Optional[Path],
+    cache_dir: Path,
+    catalog: Optional[Path] = None,
+) -> List[Tuple[BatchResult, Dict[str, str], bool]]:
+    """Mark rows whose submission folder already exists upstream as invalid, with one lookup."""
+    try:
+        index = load_slug_index(
+            target_repo, base_branch, client=client, mirror=mirror, cache_dir=cache_dir, catalog=catalog
+        )
+    except Exception as error:
+        print(f"[INFO] Remote duplicate check skipped: {error}", file=sys.stderr)
+        return pending
+    remaining = []
+    for result, fields, update_existing in pending:
+        try:
+            precheck_remote_slugs(
+                fields,
+                update_existing=update_existing,
+                target_repo=target_repo,
+                base_branch=base_branch,
+                client=client,
+                mirror=mirror,
+                index=index,
+            )
+        except FileExistsError as error:
+            result.status = "invalid"
+            result.error = str(error)
+            continue
+        remaining.append((result, fields, update_existing))
+    return remaining
+
+
+def reject_broken_links(
+    pending: List[Tuple[BatchResult, Dict[str, str], bool]], args: argparse.Namespace
+) -> List[Tuple[BatchResult, Dict[str, str], bool]]:
+    """Mark rows with a broken link as invalid, checking the links of all rows in one pass."""
+    checker = open_link_checker(args)
+    try:
+        broken = broken_submission_links(checker, [fields for _, fields, _ in pending])
+    finally:
+        checker.close()
+    remaining = []
+    for (result, fields, update_existing), row_broken in zip(pending, broken):
+        if row_broken:
+            result.status = "invalid"
+            result.error = describe_broken_links(row_broken)
+            continue
+        remaining.append((result, fields, update_existing))
+    return remaining
+
+
+def write_batch_report(path: Path, results: Sequence[BatchResult], **context: object) -> None:
+    payload: Dict[str, object] = dict(context)
+    payload["results"] = [asdict(result) for result in results]
+    write_json(path, payload)
+
+
+def batch_report_path(args: argparse.Namespace, manifest_path: Path) -> Path:
+    if args.report:
+        return Path(args.report).resolve()
+    return manifest_path.with_name(f"{manifest_path.stem}.report.json")
+
+
+def print_batch_results(results: Sequence[BatchResult], report_path: Path) -> int:
+    ok_statuses = {"rendered", "planned", "submitted", "unchanged"}
+    for result in results:
+        label = "OK" if result.status in ok_statuses else "ERROR"
+        detail = result.pr_url or result.compare_url or result.document_path
+        line = f"[{label}] row {result.row} {result.team_slug or result.team_name}: {result.status}"
+        if detail:
+            line = f"{line} {detail}"
+        if result.error:
+            line = f"{line} ({result.error})"
+        print(line, file=sys.stdout if label == "OK" else sys.stderr)
+    succeeded = sum(1 for result in results if result.status in ok_statuses)
+    if _GITHUB_SCHEDULER.summary():
+        print(f"[INFO] {_GITHUB_SCHEDULER.format_summary()}")
+    print(f"[OK] Batch finished: {succeeded}/{len(results)} succeeded.")
+    print(f"[OK] Report: {report_path}")
+    return 0 if succeeded == len(results) else 1
+
+
+def run_batch(args: argparse.Namespace, *, target_repo: str) -> int:
+    manifest_path = Path(args.manifest).resolve()
+    report_path = batch_report_path(args, manifest_path)
+    try:
+        rows = load_manifest(manifest_path)
+    except Exception as error:
+        print(f"[ERROR] {error}", file=sys.stderr)
+        return 1
+    if not rows:
+        print(f"[ERROR] Manifest has no submissions: {manifest_path}", file=sys.stderr)
+        return 1
+
+    temp_dir = Path(tempfile.mkdtemp(prefix="hackathon-submission-batch-"))
+    mirror_cache = open_mirror_cache(args)
+    client: Optional[GitHubClient] = None
+    github_cache: Optional[GitHubMetadataCache] = None
+    render_root = Path(args.render_only_dir).resolve() if args.render_only_dir else temp_dir / "render"
+    results: List[BatchResult] = []
+    pending: List[Tuple[BatchResult, Dict[str, str], bool]] = []
+    row_assets: Dict[int, List[StoredAsset]] = {}
+    asset_store = AssetStore(Path(args.cache_dir))
+    meta_tree = MetaTree.on_disk(render_root)
+    try:
+        # Render and validate the whole cohort before touching GitHub. Rendering into one
+        # shared root also rejects two rows that resolve to the same document path.
+        for index, row in enumerate(rows, start=1):
+            result = BatchResult(
+                row=index,
+                team_name=row.get("team_name", ""),
+                project_name=row.get("project_name", ""),
+            )
+            results.append(result)
+            try:
+                fields = manifest_row_fields(row)
+                update_existing = args.update or parse_bool(row.get("update", ""))
+                result.team_slug = slugify(fields["team_name"])
+                result.project_slug = slugify(fields["project_name"])
+                assets_dir = row.get("assets_dir", "").strip()
+                if assets_dir:
+                    # Identical files across rows are stored once and hard-linked into each submission.
+                    row_assets[index] = ingest_assets(
+                        manifest_path.parent / Path(assets_dir).expanduser(),
+                        Path(args.cache_dir),
+                        max_file_bytes=mib_to_bytes(args.max_asset_mib),
+                        max_total_bytes=mib_to_bytes(args.max_assets_total_mib),
+                        store=asset_store,
+                    )
+                created_doc = create_submission_artifacts(
+                    render_root,
+                    **fields,
+                    update_existing=update_existing,
+                    meta_tree=meta_tree,
+                    assets=row_assets.get(index, ()),
+                )
+                result.document_path = str(created_doc.relative_to(render_root))
+                result.status = "rendered"
+                pending.append((result, fields, update_existing))
+            except Exception as error:
+                result.status = "invalid"
+                result.error = str(error)
+        with phase("meta"):
+            meta_tree.flush(render_root)
+        asset_store.save()
+        if args.verify_links and pending:
+            pending = reject_broken_links(pending, args)
+
+        if pending and not args.render_only_dir:
+            client = open_github_client(args)
+            github_cache = open_github_metadata_cache(args, client)
+            mirror = mirror_cache.acquire(target_repo, args.base_branch) if mirror_cache else None
+            pending = reject_remote_duplicates(
+                pending,
+                target_repo=target_repo,
+                base_branch=args.base_branch,
+                client=client,
+                mirror=mirror,
+                cache_dir=Path(args.cache_dir).expanduser(),
+                catalog=catalog_from_args(args),
+            )
+        if pending and not args.render_only_dir:
+            login = resolve_login(client, github_cache)
+            fork_repo = ensure_fork(target_repo, login, create_if_missing=True, client=client, cache=github_cache)
+            with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+                futures = [
+                    pool.submit(
+                        submit_batch_row,
+                        result,
+                        fields,
+                        update_existing=update_existing,
+                        temp_root=temp_dir / "checkouts",
+                        target_repo=target_repo,
+                        base_branch=args.base_branch,
+                        login=login,
+                        fork_repo=fork_repo,
+                        fast_checkout=args.fast_checkout,
+                        mirror=mirror,
+                        plumbing_commit=args.plumbing_commit,
+                        client=client,
+                        assets=row_assets.get(result.row, ()),
+                    )
+                    for result, fields, update_existing in pending
+                ]
+                for future in futures:
+                    future.result()
+    except Exception as error:
+        print(f"[ERROR] {error}", file=sys.stderr)
+        for result in results:
+            if result.status == "rendered" and not args.render_only_dir:
+                result.status = "failed"
+                result.error = str(error)
+    finally:
+        write_batch_report(
+            report_path,
+            results,
+            manifest=str(manifest_path),
+            target_repo=target_repo,
+            base_branch=args.base_branch,
+            github_calls=_GITHUB_SCHEDULER.summary(),
+        )
+        if any(result.status == "failed" for result in results):
+            forget_github_metadata(github_cache)
+        if client:
+            client.close()
+        if mirror_cache:
+            mirror_cache.release()
+        if args.keep_temp:
+            print(f"[INFO] Temporary directory kept: {temp_dir}")
+        else:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return print_batch_results(results, report_path)
+
+
+def plan_import(
+    repo_path: Path,
+    *,
+    base_ref: str,
+    submissions: Sequence[Tuple[BatchResult, Dict[str, str], bool]],
+    row_assets: Mapping[int, Sequence[StoredAsset]],
+    row_documents: Mapping[int, str],
+    prefetch: bool,
+) -> Tuple[Dict[str, Union[str, Path]], List[BatchResult]]:
+    """Render every submission against ``base_ref`` into one file map with merged navigation.
+
+    The base tree is listed once and the few blobs that get read (existing meta.json files and
+    documents) are fetched in one request when ``prefetch`` is set (blob-less stores). Rows
+    that fail are marked invalid and left out; --update rows that already match upstream are
+    marked unchanged. ``row_documents`` holds each row's document from validation, so no row
+    is rendered again. Returns the files and the rows they include.
+    """
+    listing: Dict[str, str] = {}
+    tree_listing = run(["git", "ls-tree", "-r", "-z", base_ref, "--", "contents/docs/"], cwd=repo_path)
+    for record in filter(None, tree_listing.split("\0")):
+        meta, path = record.split("\t", 1)
+        _, object_type, sha = meta.split()
+        if object_type == "blob":
+            listing[path] = sha
+    needed = set()
+    for result, fields, _ in submissions:
+        for meta_path, _, _ in submission_meta_entries(
+            team_name=fields["team_name"],
+            project_name=fields["project_name"],
+            team_slug=result.team_slug,
+            project_slug=result.project_slug,
+        ):
+            needed.add(meta_path)
+        needed.add(result.document_path)
+    wanted = sorted({listing[path] for path in needed if path in listing})
+    if prefetch and wanted:
+        # The same request git makes for a lazy fetch, but for all the blobs at once.
+        run(
+            [
+                "git",
+                "-c",
+                "fetch.negotiationAlgorithm=noop",
+                "fetch",
+                "--quiet",
+                "--no-tags",
+                "--no-write-fetch-head",
+                "--recurse-submodules=no",
+                "--filter=blob:none",
+                "upstream",
+                *wanted,
+            ],
+            cwd=repo_path,
+        )
+
+    contents: Dict[str, Optional[str]] = {}
+
+    def read_file(path: str) -> Optional[str]:
+        if path not in contents:
+            sha = listing.get(path)
+            contents[path] = run(["git", "cat-file", "blob", sha], cwd=repo_path, strip=False) if sha else None
+        return contents[path]
+
+    meta_tree = MetaTree(read_file)
+    files: Dict[str, Union[str, Path]] = {}
+    included: List[BatchResult] = []
+    for result, fields, update_existing in submissions:
+        assets = row_assets.get(result.row, ())
+        doc_dir = submission_doc_dir(result.team_slug, result.project_slug)
+        try:
+            document = row_documents[result.row]
+            blobs = submission_blobs(fields, assets, document=document) if update_existing else {}
+            if blobs and submission_matches_remote(blobs, listing, doc_dir):
+                result.status = "unchanged"
+                continue
+            files.update(
+                build_submission_files(
+                    read_file,
+                    update_existing=update_existing,
+                    assets=assets,
+                    meta_tree=meta_tree,
+                    document=document,
+                    **fields,
+                )
+            )
+        except Exception as error:
+            result.status = "invalid"
+            result.error = str(error)
+            continue
+        included.append(result)
+    with phase("meta"):
+        files.update(meta_tree.dirty_files())
+    return files, included
+
+
+def run_import(args: argparse.Namespace, *, target_repo: str) -> int:
+    """Land every manifest row in one commit built with git fast-import and open one PR."""
+    manifest_path = Path(args.manifest).resolve()
+    report_path = batch_report_path(args, manifest_path)
+    try:
+        rows = load_manifest(manifest_path)
+    except Exception as error:
+        print(f"[ERROR] {error}", file=sys.stderr)
+        return 1
+    if not rows:
+        print(f"[ERROR] Manifest has no submissions: {manifest_path}", file=sys.stderr)
+        return 1
+
+    temp_dir = Path(tempfile.mkdtemp(prefix="hackathon-submission-import-"))
+    mirror_cache = open_mirror_cache(args)
+    client: Optional[GitHubClient] = None
+    github_cache: Optional[GitHubMetadataCache] = None
+    results: List[BatchResult] = []
+    pending: List[Tuple[BatchResult, Dict[str, str], bool]] = []
+    row_assets: Dict[int, List[StoredAsset]] = {}
+    row_documents: Dict[int, str] = {}
+    asset_store = AssetStore(Path(args.cache_dir))
+    seen_documents: Dict[str, int] = {}
+    included: List[BatchResult] = []
+    login: Optional[str] = None
+    branch_name: Optional[str] = None
+    try:
+        # Every row is validated before any GitHub step; a bad row never blocks the others.
+        for index, row in enumerate(rows, start=1):
+            result = BatchResult(
+                row=index,
+                team_name=row.get("team_name", ""),
+                project_name=row.get("project_name", ""),
+            )
+            results.append(result)
+            try:
+                fields = manifest_row_fields(row)
+                update_existing = args.update or parse_bool(row.get("update", ""))
+                result.team_slug = slugify(fields["team_name"])
+                result.project_slug = slugify(fields["project_name"])
+                result.document_path = (
+                    f"{submission_doc_dir(result.team_slug, result.project_slug)}/{DEFAULT_DOC_FILENAME}"
+                )
+                if result.document_path in seen_documents:
+                    raise FileExistsError(
+                        f"Row {seen_documents[result.document_path]} already imports {result.document_path}"
+                    )
+                seen_documents[result.document_path] = index
+                assets_dir = row.get("assets_dir", "").strip()
+                if assets_dir:
+                    row_assets[index] = ingest_assets(
+                        manifest_path.parent / Path(assets_dir).expanduser(),
+                        Path(args.cache_dir),
+                        max_file_bytes=mib_to_bytes(args.max_asset_mib),
+                        max_total_bytes=mib_to_bytes(args.max_assets_total_mib),
+                        store=asset_store,
+                    )
+                row_documents[index] = render_submission(**fields)
+                result.status = "rendered"
+                pending.append((result, fields, update_existing))
+            except Exception as error:
+                result.status = "invalid"
+                result.error = str(error)
+        asset_store.save()
+        if args.verify_links and pending:
+            pending = reject_broken_links(pending, args)
+
+        if pending:
+            client = open_github_client(args)
+            github_cache = open_github_metadata_cache(args, client)
+            mirror = mirror_cache.acquire(target_repo, args.base_branch) if mirror_cache else None
+            pending = reject_remote_duplicates(
+                pending,
+                target_repo=target_repo,
+                base_branch=args.base_branch,
+                client=client,
+                mirror=mirror,
+                cache_dir=Path(args.cache_dir).expanduser(),
+                catalog=catalog_from_args(args),
+            )
+        if pending:
+            login = resolve_login(client, github_cache)
+            fork_repo = ensure_fork(target_repo, login, create_if_missing=True, client=client, cache=github_cache)
+            repo_path = prepare_bare_repo(
+                temp_root=temp_dir,
+                target_repo=target_repo,
+                base_branch=args.base_branch,
+                fork_repo=fork_repo,
+                mirror=mirror,
+            )
+            ensure_git_identity(repo_path)
+            base_ref = f"upstream/{args.base_branch}"
+            files, included = plan_import(
+                repo_path,
+                base_ref=base_ref,
+                submissions=pending,
+                row_assets=row_assets,
+                row_documents=row_documents,
+                prefetch=mirror is None,
+            )
+        if included:
+            branch_name = create_branch_name("import", f"{len(included)}-teams")
+            submissions = [(result.team_name, result.project_name, result.document_path) for result in included]
+            try:
+                commit_sha = fast_import_commit(
+                    repo_path,
+                    base_ref=base_ref,
+                    branch_name=branch_name,
+                    files=files,
+                    message=import_commit_message(submissions),
+                )
+            except NoChangesError:
+                for result in included:
+                    result.status = "unchanged"
+                included = []
+            for result in included:
+                result.status = "planned"
+                result.branch = branch_name
+                result.commit_sha = commit_sha
+            if included:
+                print(f"[OK] Import commit {commit_sha}: {len(included)} submission(s), {len(files)} file(s).")
+        if included and not args.github_dry_run:
+            push_branch(repo_path, branch_name)
+            pr_url = create_pull_request(
+                target_repo=target_repo,
+                base_branch=args.base_branch,
+                head=f"{login}:{branch_name}",
+                title=f"[Submission] Import {len(included)} submissions",
+                body=import_pr_body(submissions),
+                client=client,
+            )
+            for result in included:
+                result.status = "submitted"
+                result.pr_url = pr_url
+    except Exception as error:
+        print(f"[ERROR] {error}", file=sys.stderr)
+        for result in results:
+            if result.status in {"rendered", "planned"}:
+                result.status = "failed"
+                result.error = str(error)
+                if login and result.branch:
+                    result.compare_url = build_compare_url(target_repo, args.base_branch, login, result.branch)
+    finally:
+        write_batch_report(
+            report_path,
+            results,
+            manifest=str(manifest_path),
+            target_repo=target_repo,
+            base_branch=args.base_branch,
+            single_pr=True,
+            github_calls=_GITHUB_SCHEDULER.summary(),
+        )
+        if any(result.status == "failed" for result in results):
+            forget_github_metadata(github_cache)
+        if client:
+            client.close()
+        if mirror_cache:
+            mirror_cache.release()
+        if args.keep_temp:
+            print(f"[INFO] Temporary directory kept: {temp_dir}")
+        else:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return print_batch_results(results, report_path)
+
+
+def mib_to_bytes(value: float) -> int:
+    return int(value * 1024 * 1024)
+
+
+def assets_from_args(args: argparse.Namespace) -> List[StoredAsset]:
+    if not args.assets_dir:
+        return []
+    return ingest_assets(
+        Path(args.assets_dir).expanduser(),
+        Path(args.cache_dir),
+        max_file_bytes=mib_to_bytes(args.max_asset_mib),
+        max_total_bytes=mib_to_bytes(args.max_assets_total_mib),
+    )
+
+
+def catalog_from_args(args: argparse.Namespace) -> Optional[Path]:
+    return Path(args.catalog).expanduser() if args.catalog else None
+
+
+def open_mirror_cache(args: argparse.Namespace) -> Optional[MirrorCache]:
+    if not args.mirror_cache:
+        return None
+    return MirrorCache(Path(args.cache_dir).expanduser())
+
+
+DOCS_SKIP_DIRS = {"node_modules"}
+
+
+def is_submission_assets_dir(docs_root: Path, directory: str) -> bool:
+    """True for ``vibe-coding/<team>/<project>/assets`` under ``docs_root``, and nothing else.
+
+    A team or project may itself be slugged ``assets``, so the folder is matched by its
+    position relative to the docs root rather than by name.
+    """
+    parts = Path(directory).relative_to(docs_root).parts
+    return len(parts) == 4 and parts[0] == "vibe-coding" and parts[3] == "assets"
+
+
+def find_submission_documents(docs_root: Path) -> List[Path]:
+    """Walk ``docs_root`` with os.scandir and return every submission document, sorted."""
+    documents: List[Path] = []
+    pending = [str(docs_root)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in DOCS_SKIP_DIRS and not is_submission_assets_dir(docs_root, entry.path):
+                        pending.append(entry.path)
+                elif entry.name == DEFAULT_DOC_FILENAME and entry.is_file():
+                    documents.append(Path(entry.path))
+    return sorted(documents)
+
+
+def extract_urls(*texts: str) -> List[str]:
+    """Return the distinct http(s) URLs in ``texts``, in order of first appearance."""
+    urls: Dict[str, None] = {}
+    for text in texts:
+        for match in LINK_PATTERN.finditer(text or ""):
+            urls.setdefault(match.group(0).rstrip(LINK_TRAILING_PUNCTUATION), None)
+    return list(urls)
+
+
+@dataclass
+class LinkResult:
+    url: str
+    ok: bool
+    status: int = 0
+    error: str = ""
+    final_url: str = ""
+    checked_at: float = 0.0
+
+    def describe(self) -> str:
+        return f"HTTP {self.status}" if self.status else self.error
+
+
+class HostPool:
+    """Keep-alive connections to one scheme://host:port; at most ``limit`` requests in flight."""
+
+    def __init__(self, scheme: str, host: str, port: Optional[int], *, limit: int, timeout: float) -> None:
+        self.slots = threading.BoundedSemaphore(limit)
+        self._scheme = scheme
+        self._host = host
+        self._port = port
+        self._timeout = timeout
+        self._idle: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue()
+
+    def take(self) -> http.client.HTTPConnection:
+        """Return the most recently idle connection, or a new one."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self.connect()
+
+    def connect(self) -> http.client.HTTPConnection:
+        connection_class = http.client.HTTPSConnection if self._scheme == "https" else http.client.HTTPConnection
+        return connection_class(self._host, self._port, timeout=self._timeout)
+
+    def give(self, connection: http.client.HTTPConnection) -> None:
+        self._idle.put(connection)
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class LinkCache:
+    """Link check results in ``<cache-dir>/link-cache.json``, keyed by URL.
+
+    Working links are trusted for ``ttl`` seconds; broken ones are re-checked after at most
+    ten minutes so a fixed link is noticed quickly. Rate-limited answers are never stored.
+    """
+
+    def __init__(self, path: Optional[Path], ttl: float) -> None:
+        self.path = path
+        self.ttl = ttl
+        self.entries: Dict[str, Dict[str, object]] = {}
+        self._lock = threading.Lock()
+        if path is not None:
+            try:
+                payload = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                payload = {}
+            if isinstance(payload, dict) and payload.get("version") == 1:
+                self.entries = dict(payload.get("entries", {}))
+
+    def _fresh(self, entry: Mapping[str, object], now: float) -> bool:
+        ttl = self.ttl if entry.get("ok") else min(self.ttl, LINK_FAILURE_CACHE_TTL_SECONDS)
+        return now - float(entry.get("checked_at", 0)) <= ttl  # type: ignore[arg-type]
+
+    def get(self, url: str) -> Optional[LinkResult]:
+        entry = self.entries.get(url)
+        if not entry or not self._fresh(entry, time.time()):
+            return None
+        return LinkResult(**entry)  # type: ignore[arg-type]
+
+    def put(self, result: LinkResult) -> None:
+        if result.status == 429:
+            return
+        with self._lock:
+            self.entries[result.url] = asdict(result)
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        now = time.time()
+        entries = {url: entry for url, entry in self.entries.items() if self._fresh(entry, now)}
+        write_json(self.path, {"version": 1, "entries": entries})
+
+
+class LinkChecker:
+    """Check many URLs concurrently without hammering any single host.
+
+    An asyncio loop fans the URLs out to a thread pool, admitting at most ``per_host``
+    checks per host at once; every request (redirect hops included) also takes a slot of
+    its host's keep-alive pool. Each URL is tried with HEAD first and with GET when the
+    server rejects HEAD, following up to five redirects.
+    """
+
+    def __init__(
+        self,
+        *,
+        cache: Optional[LinkCache] = None,
+        timeout: float = DEFAULT_LINK_TIMEOUT_SECONDS,
+        workers: int = DEFAULT_LINK_WORKERS,
+        per_host: int = DEFAULT_LINK_PER_HOST,
+    ) -> None:
+        self.cache = cache
+        self.timeout = timeout
+        self.workers = max(1, workers)
+        self.per_host = max(1, per_host)
+        self._pools: Dict[Tuple[str, str, Optional[int]], HostPool] = {}
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        for pool in self._pools.values():
+            pool.close()
+
+    def _pool(self, scheme: str, host: str, port: Optional[int]) -> HostPool:
+        key = (scheme, host, port)
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = self._pools[key] = HostPool(scheme, host, port, limit=self.per_host, timeout=self.timeout)
+            return pool
+
+    def _request(self, method: str, url: str) -> Tuple[int, str]:
+        """Send one request on a pooled connection and return (status, Location header)."""
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in {"http", "https"} or not parts.hostname:
+            raise ValueError(f"Unsupported URL: {url}")
+        host = parts.hostname.encode("idna").decode("ascii")
+        target = urllib.parse.quote(parts.path or "/", safe="/%:@!$&'()*+,;=-._~")
+        if parts.query:
+            target = f"{target}?{urllib.parse.quote(parts.query, safe='=&%:@!$/?+,;-._~')}"
+        headers = {"User-Agent": LINK_USER_AGENT, "Accept": "*/*"}
+        pool = self._pool(parts.scheme, host, parts.port)
+        with pool.slots:
+            try:
+                return self._send(pool.take(), pool, method, target, headers)
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # A pooled connection may have been closed by the server while idle; retry once
+                # on a fresh connection.
+                return self._send(pool.connect(), pool, method, target, headers)
+
+    @staticmethod
+    def _send(
+        connection: http.client.HTTPConnection, pool: HostPool, method: str, target: str, headers: Dict[str, str]
+    ) -> Tuple[int, str]:
+        try:
+            connection.request(method, target, headers=headers)
+            response = connection.getresponse()
+            # Only a peek of a GET body is read; a connection with unread body is dropped.
+            response.read(LINK_BODY_PEEK_BYTES if method == "GET" else None)
+        except Exception:
+            connection.close()
+            raise
+        if response.will_close or not response.isclosed():
+            connection.close()
+        else:
+            pool.give(connection)
+        return response.status, response.getheader("Location") or ""
+
+    def check(self, url: str) -> LinkResult:
+        current = url
+        try:
+            for _ in range(LINK_MAX_REDIRECTS + 1):
+                status, location = self._request("HEAD", current)
+                if status >= 400 and status != 429:
+                    status, location = self._request("GET", current)
+                if 300 <= status < 400 and location:
+                    current = urllib.parse.urljoin(current, location)
+                    continue
+                return LinkResult(
+                    url,
+                    ok=status < 400 or status == 429,
+                    status=status,
+                    final_url="" if current == url else current,
+                    checked_at=time.time(),
+                )
+            return LinkResult(url, ok=False, error="Too many redirects", final_url=current, checked_at=time.time())
+        except (OSError, http.client.HTTPException, ValueError, UnicodeError) as error:
+            return LinkResult(url, ok=False, error=str(error) or type(error).__name__, checked_at=time.time())
+
+    async def _check_many(self, urls: Sequence[str]) -> List[LinkResult]:
+        loop = asyncio.get_running_loop()
+        host_limits: Dict[str, asyncio.Semaphore] = collections.defaultdict(lambda: asyncio.Semaphore(self.per_host))
+
+        async def check_one(url: str, executor: ThreadPoolExecutor) -> LinkResult:
+            async with host_limits[urllib.parse.urlsplit(url).netloc.lower()]:
+                return await loop.run_in_executor(executor, self.check, url)
+
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(urls))) as executor:
+            return await asyncio.gather(*(check_one(url, executor) for url in urls))
+
+    def check_all(self, urls: Iterable[str]) -> Dict[str, LinkResult]:
+        """Return a result for every distinct URL, from the cache where it is still fresh."""
+        results: Dict[str, LinkResult] = {}
+        pending: List[str] = []
+        for url in dict.fromkeys(urls):
+            cached = self.cache.get(url) if self.cache else None
+            if cached is None:
+                pending.append(url)
+            else:
+                results[url] = cached
+        if pending:
+            with phase("links", urls=len(pending)):
+                checked = asyncio.run(self._check_many(pending))
+            for result in checked:
+                results[result.url] = result
+                if self.cache:
+                    self.cache.put(result)
+            if self.cache:
+                self.cache.save()
+        return results
+
+
+def open_link_checker(args: argparse.Namespace) -> LinkChecker:
+    return LinkChecker(
+        cache=LinkCache(Path(args.cache_dir).expanduser() / "link-cache.json", DEFAULT_LINK_CACHE_TTL_SECONDS)
     )
-    return pr_url.strip().splitlines()[-1]
+
+
+def broken_submission_links(checker: LinkChecker, rows: Sequence[Mapping[str, str]]) -> List[List[LinkResult]]:
+    """Check the URLs of every row's link fields in one pass; return each row's broken links."""
+    row_urls = [extract_urls(*(fields.get(name, "") for name in LINK_FIELDS)) for fields in rows]
+    results = checker.check_all(url for urls in row_urls for url in urls)
+    return [[results[url] for url in urls if not results[url].ok] for urls in row_urls]
+
+
+def describe_broken_links(broken: Sequence[LinkResult]) -> str:
+    return "Broken link(s): " + "; ".join(f"{result.url} ({result.describe()})" for result in broken)
 
 
 def parser() -> argparse.ArgumentParser:
@@ -445,39 +3901,370 @@ def parser() -> argparse.ArgumentParser:
             f"to fixed upstream {DEFAULT_TARGET_REPO_URL}."
         )
     )
-    p.add_argument("--team-name", required=True)
-    p.add_argument("--project-name", required=True)
-    p.add_argument("--repo-url", required=True)
-    p.add_argument("--demo-url-or-run-method", required=True)
-    p.add_argument("--problem-definition", required=True)
-    p.add_argument("--one-liner", required=True)
-    p.add_argument("--team-roles", required=True)
+    p.add_argument("--team-name")
+    p.add_argument("--project-name")
+    p.add_argument("--repo-url")
+    p.add_argument("--demo-url-or-run-method")
+    p.add_argument("--problem-definition")
+    p.add_argument("--one-liner")
+    p.add_argument("--team-roles")
 
     p.add_argument("--solution", default="")
     p.add_argument("--tech-stack", default="")
     p.add_argument("--run-verify", default="")
     p.add_argument("--demo-summary", default="")
     p.add_argument("--license-sources", default="")
-    p.add_argument("--ai-used", default="사용함", choices=["사용함", "사용하지 않음"])
+    p.add_argument("--ai-used", default="사용함", choices=AI_USED_CHOICES)
     p.add_argument("--ai-validation-notes", default="")
     p.add_argument("--presentation-url", default="")
     p.add_argument("--extra-links", default="")
 
+    p.add_argument(
+        "--assets-dir",
+        help=(
+            "Ingest files from demo/, evidence/ and team/ under this directory into the submission's "
+            "assets folders (content-addressed under --cache-dir, hard-linked where possible)."
+        ),
+    )
+    p.add_argument(
+        "--max-asset-mib",
+        type=float,
+        default=DEFAULT_MAX_ASSET_BYTES / (1024 * 1024),
+        help="Reject any asset file larger than this many MiB (default: 100, GitHub's file limit).",
+    )
+    p.add_argument(
+        "--max-assets-total-mib",
+        type=float,
+        default=DEFAULT_MAX_ASSETS_TOTAL_BYTES / (1024 * 1024),
+        help="Reject a submission whose assets add up to more than this many MiB (default: 500).",
+    )
+
     p.add_argument("--base-branch", default=DEFAULT_BASE_BRANCH)
     p.add_argument("--update", action="store_true")
     p.add_argument("--keep-temp", action="store_true")
+    p.add_argument(
+        "--resume",
+        action="store_true",
+        help=(
+            "Continue a failed submission from its first incomplete stage (fork, checkout, render, "
+            "commit, push, PR), reusing the kept checkout and commit. Other inputs must be unchanged."
+        ),
+    )
+    p.add_argument(
+        "--fast-checkout",
+        action="store_true",
+        help=(
+            "Use a shallow, blob-filtered, sparse (contents/docs only) checkout of the upstream "
+            "base instead of a full fork clone. The branch is still pushed to the fork."
+        ),
+    )
+    p.add_argument(
+        "--plumbing-commit",
+        action="store_true",
+        help=(
+            "Build the submission commit directly from git objects (hash-object/mktree/commit-tree) "
+            "on top of upstream/<base> without checking out a working tree."
+        ),
+    )
+    p.add_argument(
+        "--mirror-cache",
+        action="store_true",
+        help=(
+            "Keep a bare mirror of the upstream repository under --cache-dir, refresh it with an "
+            "incremental fetch and check out from it instead of cloning from GitHub."
+        ),
+    )
+    p.add_argument(
+        "--cache-dir",
+        default=str(default_cache_dir()),
+        help="Directory for persistent caches (default: $XDG_CACHE_HOME/hackathon-submission).",
+    )
+    p.add_argument(
+        "--github-api-url",
+        default=os.environ.get("GITHUB_API_URL", DEFAULT_GITHUB_API_URL),
+        help=(
+            "GitHub REST API base URL for the in-process client "
+            "(default: $GITHUB_API_URL or https://api.github.com)."
+        ),
+    )
+    p.add_argument(
+        "--use-gh-cli",
+        action="store_true",
+        help="Always use the gh CLI for GitHub calls instead of the in-process REST client.",
+    )
+    p.add_argument(
+        "--github-cache-ttl",
+        type=float,
+        default=DEFAULT_GITHUB_CACHE_TTL_SECONDS,
+        help=(
+            "Seconds to reuse the cached login, fork and target-repository checks for the current "
+            "token (default: one day, 0 disables the cache)."
+        ),
+    )
+    p.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached GitHub login/fork/repository data and look everything up again.",
+    )
+    p.add_argument(
+        "--catalog",
+        help=(
+            "SQLite catalog from submission_catalog.py (built on a current checkout) to answer the "
+            "duplicate-slug check instead of listing the upstream tree."
+        ),
+    )
     p.add_argument(
         "--github-dry-run",
         action="store_true",
         help="Validate GitHub path (auth/fork/clone/render) without push, commit, or PR creation.",
     )
+    p.add_argument(
+        "--no-clone",
+        action="store_true",
+        help=(
+            "With --github-dry-run, skip the clone: check auth, fork and the base branch with "
+            "ls-remote, read only the meta.json blobs and print the planned files and diff."
+        ),
+    )
+    p.add_argument(
+        "--verify-links",
+        action="store_true",
+        help=(
+            "Check every URL in the repo, demo, presentation and extra link fields before any GitHub "
+            "step (concurrently, cached under --cache-dir) and reject the submission if one is broken. "
+            "With --manifest, rows with broken links are marked invalid."
+        ),
+    )
     p.add_argument(
         "--render-only-dir",
         help="Render docs into this local directory and skip all GitHub actions.",
     )
+    p.add_argument(
+        "--timings-json",
+        help="Write per-phase and per-command timing spans (wall time, command, output bytes) as JSON.",
+    )
+    p.add_argument(
+        "--command-timeout",
+        type=float,
+        help=(
+            "Kill any git/gh command that runs longer than this many seconds "
+            f"(default: none, {DEFAULT_BATCH_COMMAND_TIMEOUT_SECONDS}s with --manifest)."
+        ),
+    )
+    p.add_argument(
+        "--deadline",
+        type=float,
+        help="Overall time budget in seconds; commands still running when it expires are killed.",
+    )
+    p.add_argument(
+        "--progress",
+        action="store_true",
+        help="Stream git clone/fetch/push progress to stderr while commands run.",
+    )
+    p.add_argument(
+        "--timings-summary",
+        action="store_true",
+        help="Print a timing summary table to stderr at exit.",
+    )
+    p.add_argument(
+        "--manifest",
+        help=(
+            "Submit every row of a JSONL or CSV manifest (keys match the submission flags, "
+            "e.g. team_name). All rows are rendered and validated before any GitHub step."
+        ),
+    )
+    p.add_argument(
+        "--single-pr",
+        action="store_true",
+        help=(
+            "With --manifest, import every valid row into one commit (written with git fast-import, "
+            "meta.json navigation merged) and open a single PR. --github-dry-run stops before the push."
+        ),
+    )
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_BATCH_WORKERS,
+        help="Number of submissions pushed/opened in parallel in --manifest mode.",
+    )
+    p.add_argument(
+        "--report",
+        help="Per-row JSON result report for --manifest mode (default: <manifest>.report.json).",
+    )
     return p
 
 
+@timed_phase("ls-remote")
+def remote_branch_head(repo: str, branch: str) -> str:
+    """Return the commit a branch points to, straight from the git server (no clone)."""
+    output = run(["git", "ls-remote", f"https://github.com/{repo}.git", f"refs/heads/{branch}"])
+    if not output:
+        raise RuntimeError(f"Branch not found: {repo}@{branch}")
+    return output.split()[0]
+
+
+@dataclass
+class PlannedFile:
+    path: str
+    status: str
+    diff: str = ""
+
+
+def unified_text_diff(old: str, new: str, fromfile: str, tofile: str) -> str:
+    """``git diff``-style text diff, including its marker for a missing final newline."""
+    lines = difflib.unified_diff(old.splitlines(keepends=True), new.splitlines(keepends=True), fromfile, tofile)
+    return "".join(line if line.endswith("\n") else f"{line}\n\\ No newline at end of file\n" for line in lines)
+
+
+def plan_remote_submission(
+    fields: Mapping[str, str],
+    *,
+    update_existing: bool,
+    target_repo: str,
+    base_branch: str,
+    client: Optional[GitHubClient] = None,
+    mirror: Optional[Path] = None,
+    assets: Sequence[StoredAsset] = (),
+) -> List[PlannedFile]:
+    """Plan a submission against the base branch in memory: file statuses and text diffs.
+
+    Needs one tree listing of the submission folder and the navigation ``meta.json`` blobs;
+    nothing is cloned or written.
+    """
+    team_slug = slugify(fields["team_name"])
+    project_slug = slugify(fields["project_name"])
+    doc_dir = submission_doc_dir(team_slug, project_slug)
+    meta_paths = [
+        meta_path
+        for meta_path, _, _ in submission_meta_entries(
+            team_name=fields["team_name"],
+            project_name=fields["project_name"],
+            team_slug=team_slug,
+            project_slug=project_slug,
+        )
+    ]
+
+    def read(path: str) -> Optional[str]:
+        return read_remote_file(target_repo, base_branch, path, client=client, mirror=mirror)
+
+    steps: Dict[str, Callable[[], Any]] = {path: functools.partial(read, path) for path in meta_paths}
+    steps["tree"] = lambda: remote_tree_blobs(target_repo, base_branch, doc_dir, client=client, mirror=mirror)
+    fetched = run_concurrently(steps)
+    remote_blobs: Dict[str, str] = fetched.pop("tree")
+    remote_text: Dict[str, Optional[str]] = fetched
+
+    def read_file(path: str) -> Optional[str]:
+        if path not in remote_text:
+            remote_text[path] = read(path) if path in remote_blobs else None
+        return remote_text[path]
+
+    files = build_submission_files(read_file, update_existing=update_existing, assets=assets, **fields)
+    asset_shas = {f"{doc_dir}/assets/{asset.path}": asset.git_sha for asset in assets}
+    planned: List[PlannedFile] = []
+    for path in sorted(files):
+        content = files[path]
+        new_sha = asset_shas[path] if isinstance(content, Path) else git_blob_sha(content)
+        old_sha = remote_blobs.get(path)
+        if old_sha is None and path in meta_paths and remote_text.get(path) is not None:
+            old_sha = git_blob_sha(str(remote_text[path]))
+        if old_sha == new_sha:
+            planned.append(PlannedFile(path, "unchanged"))
+            continue
+        status = "modified" if old_sha else "added"
+        diff = ""
+        if isinstance(content, str):
+            old_text = read_file(path) if old_sha else ""
+            diff = unified_text_diff(old_text or "", content, f"a/{path}" if old_sha else "/dev/null", f"b/{path}")
+        planned.append(PlannedFile(path, status, diff))
+    return planned
+
+
+def run_light_github_dry_run(
+    args: argparse.Namespace,
+    *,
+    target_repo: str,
+    team_slug: str,
+    project_slug: str,
+) -> int:
+    """Dry-run without a clone: check auth, fork and base branch, then plan the files in memory."""
+    mirror_cache = open_mirror_cache(args)
+    client = open_github_client(args)
+    github_cache = open_github_metadata_cache(args, client)
+    login: Optional[str] = None
+    branch_name = create_branch_name(team_slug, project_slug)
+    try:
+        fields = submission_fields_from_args(args)
+        assets = assets_from_args(args)
+        mirror = mirror_cache.acquire(target_repo, args.base_branch) if mirror_cache else None
+        precheck_remote_slugs(
+            fields,
+            update_existing=args.update,
+            target_repo=target_repo,
+            base_branch=args.base_branch,
+            client=client,
+            mirror=mirror,
+            cache_dir=Path(args.cache_dir).expanduser(),
+            catalog=catalog_from_args(args),
+        )
+
+        def github_step() -> str:
+            nonlocal login
+            login = resolve_login(client, github_cache)
+            ensure_repo_exists(target_repo, client, github_cache)
+            fork_repo = ensure_fork(target_repo, login, create_if_missing=False, client=client, cache=github_cache)
+            # The fork must also be reachable over git, which is what the push will use.
+            run(["git", "ls-remote", f"https://github.com/{fork_repo}.git", "HEAD"])
+            return fork_repo
+
+        preflight = run_concurrently(
+            {
+                "github": github_step,
+                "base": lambda: remote_branch_head(target_repo, args.base_branch),
+                "plan": lambda: plan_remote_submission(
+                    fields,
+                    update_existing=args.update,
+                    target_repo=target_repo,
+                    base_branch=args.base_branch,
+                    client=client,
+                    mirror=mirror,
+                    assets=assets,
+                ),
+            }
+        )
+        fork_repo: str = preflight["github"]
+        planned: List[PlannedFile] = preflight["plan"]
+        changed = [item for item in planned if item.status != "unchanged"]
+        compare_url = build_compare_url(target_repo, args.base_branch, login, branch_name)
+
+        print("[OK] GitHub dry-run completed without a clone.")
+        print("[OK] No commit/push/PR was created.")
+        print(f"[OK] Authenticated as: {login}")
+        print(f"[OK] Fork repository: https://github.com/{fork_repo}")
+        print(f"[OK] Base branch: {target_repo}@{args.base_branch} ({preflight['base'][:12]})")
+        print(f"[OK] Planned branch: {branch_name}")
+        for item in planned:
+            print(f"[OK] {item.status:>9} {item.path}")
+        print(f"[OK] Changed files in dry-run: {len(changed)}")
+        print(f"[OK] Manual compare URL preview: {compare_url}")
+        # Navigation changes and edits to existing files are shown in full; new files are listed above.
+        for item in changed:
+            if item.diff and (item.status == "modified" or item.path.endswith("meta.json")):
+                print(item.diff, end="")
+        return 0
+    except Exception as error:
+        print(f"[ERROR] {error}", file=sys.stderr)
+        forget_github_metadata(github_cache)
+        if login:
+            compare_url = build_compare_url(target_repo, args.base_branch, login, branch_name)
+            print(f"[FALLBACK] Compare URL preview: {compare_url}", file=sys.stderr)
+        return 1
+    finally:
+        if client:
+            client.close()
+        if mirror_cache:
+            mirror_cache.release()
+
+
 def run_github_dry_run(
     args: argparse.Namespace,
     *,
@@ -486,50 +4273,65 @@ def run_github_dry_run(
     project_slug: str,
 ) -> int:
     temp_dir = Path(tempfile.mkdtemp(prefix="hackathon-submission-gh-dry-run-"))
+    mirror_cache = open_mirror_cache(args)
+    client = open_github_client(args)
+    github_cache = open_github_metadata_cache(args, client)
     login: Optional[str] = None
     branch_name: Optional[str] = None
     try:
-        ensure_gh_cli_and_auth()
-        login = run(["gh", "api", "user", "--jq", ".login"])
-        run(["gh", "repo", "view", target_repo])
-        fork_repo = ensure_fork(target_repo, login, create_if_missing=False)
-
         branch_name = create_branch_name(team_slug, project_slug)
-        repo_path = prepare_git_checkout(
-            temp_root=temp_dir,
+        fields = submission_fields_from_args(args)
+        assets = assets_from_args(args)
+        mirror = mirror_cache.acquire(target_repo, args.base_branch) if mirror_cache else None
+        precheck_remote_slugs(
+            fields,
+            update_existing=args.update,
             target_repo=target_repo,
             base_branch=args.base_branch,
-            fork_repo=fork_repo,
-            branch_name=branch_name,
+            client=client,
+            mirror=mirror,
+            cache_dir=Path(args.cache_dir).expanduser(),
+            catalog=catalog_from_args(args),
+        )
+
+        def github_step() -> str:
+            nonlocal login
+            login = resolve_login(client, github_cache)
+            ensure_repo_exists(target_repo, client, github_cache)
+            return ensure_fork(target_repo, login, create_if_missing=False, client=client, cache=github_cache)
+
+        def checkout_step() -> Path:
+            return prepare_git_checkout(
+                temp_root=temp_dir,
+                target_repo=target_repo,
+                base_branch=args.base_branch,
+                branch_name=branch_name,
+                fast=args.fast_checkout,
+                mirror=mirror,
+            )
+
+        preflight = run_concurrently(
+            {
+                "github": github_step,
+                "checkout": checkout_step,
+                "render": lambda: render_submission(**fields),
+            }
         )
+        fork_repo: str = preflight["github"]
+        repo_path: Path = preflight["checkout"]
+        attach_fork_remote(repo_path, fork_repo)
 
         created_doc = create_submission_artifacts(
             repo_path,
-            team_name=args.team_name,
-            project_name=args.project_name,
-            repo_url=args.repo_url,
-            demo_url_or_run_method=args.demo_url_or_run_method,
-            problem_definition=args.problem_definition,
-            one_liner=args.one_liner,
-            team_roles=args.team_roles,
-            solution=args.solution,
-            tech_stack=args.tech_stack,
-            run_verify=args.run_verify,
-            demo_summary=args.demo_summary,
-            license_sources=args.license_sources,
-            ai_used=args.ai_used,
-            ai_validation_notes=args.ai_validation_notes,
-            presentation_url=args.presentation_url,
-            extra_links=args.extra_links,
+            **fields,
             update_existing=args.update,
+            assets=assets,
+            document=preflight["render"],
         )
 
         staged_preview = run(["git", "status", "--short"], cwd=repo_path, check=False)
         changed_count = len([line for line in staged_preview.splitlines() if line.strip()])
-        compare_url = (
-            f"https://github.com/{target_repo}/compare/"
-            f"{args.base_branch}...{login}:{branch_name}?expand=1"
-        )
+        compare_url = build_compare_url(target_repo, args.base_branch, login, branch_name)
 
         print("[OK] GitHub dry-run completed.")
         print("[OK] No commit/push/PR was created.")
@@ -542,23 +4344,154 @@ def run_github_dry_run(
         return 0
     except Exception as error:
         print(f"[ERROR] {error}", file=sys.stderr)
+        forget_github_metadata(github_cache)
         if login and branch_name:
-            compare_url = (
-                f"https://github.com/{target_repo}/compare/"
-                f"{args.base_branch}...{login}:{branch_name}?expand=1"
-            )
+            compare_url = build_compare_url(target_repo, args.base_branch, login, branch_name)
             print(f"[FALLBACK] Compare URL preview: {compare_url}", file=sys.stderr)
         return 1
     finally:
+        if client:
+            client.close()
+        if mirror_cache:
+            mirror_cache.release()
         if args.keep_temp:
             print(f"[INFO] Temporary directory kept: {temp_dir}")
         else:
             shutil.rmtree(temp_dir, ignore_errors=True)
 
 
-def main() -> int:
-    args = parser().parse_args()
+class SubmissionCheckpoint:
+    """Completed stages of one submission run, saved after each stage so --resume can skip them.
+
+    Lives in ``<cache-dir>/checkpoints/<team>__<project>.json`` and only applies to a rerun
+    with the same inputs. A failed run that already committed (or ran with --resume) keeps its
+    checkout so the commit can be pushed again without cloning and rendering.
+    """
+
+    STAGES = ("fork", "checkout", "render", "commit", "push", "pr")
+
+    def __init__(self, path: Path, inputs: str, state: Optional[Mapping[str, Any]] = None) -> None:
+        self.path = path
+        self.inputs = inputs
+        self.branch = str((state or {}).get("branch", ""))
+        self.stages: Dict[str, Dict[str, str]] = dict((state or {}).get("stages", {}))
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(
+        cls, cache_dir: Path, team_slug: str, project_slug: str, *, inputs: str, resume: bool
+    ) -> "SubmissionCheckpoint":
+        path = cache_dir / "checkpoints" / f"{team_slug}__{project_slug}.json"
+        try:
+            state = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            state = None
+        if resume and state and state.get("inputs") == inputs:
+            checkpoint = cls(path, inputs, state)
+            print(f"[INFO] Resuming from checkpoint; completed: {', '.join(checkpoint.stages) or 'none'}.")
+            return checkpoint
+        if resume:
+            reason = "the inputs changed since it was saved" if state else "none was found"
+            print(f"[INFO] Not resuming ({reason}); starting from the beginning.")
+        if state:
+            stale_dir = state.get("stages", {}).get("checkout", {}).get("temp_dir")
+            if stale_dir:
+                shutil.rmtree(stale_dir, ignore_errors=True)
+        return cls(path, inputs)
+
+    def done(self, stage: str) -> Optional[Dict[str, str]]:
+        return self.stages.get(stage)
+
+    def record(self, stage: str, **values: str) -> None:
+        with self._lock:
+            self.stages[stage] = dict(values)
+            self._save()
+
+    def reset_from(self, stage: str) -> None:
+        """Forget ``stage`` and every later stage."""
+        with self._lock:
+            for name in self.STAGES[self.STAGES.index(stage) :]:
+                self.stages.pop(name, None)
+            self._save()
+
+    def next_stage(self) -> str:
+        return next((stage for stage in self.STAGES if stage not in self.stages), "pr")
+
+    def work_dir(self) -> Optional[Path]:
+        checkout = self.stages.get("checkout")
+        return Path(checkout["temp_dir"]) if checkout else None
+
+    def clear(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+    def _save(self) -> None:
+        write_json(
+            self.path,
+            {
+                "version": 1,
+                "inputs": self.inputs,
+                "branch": self.branch,
+                "stages": self.stages,
+                "updated_at": dt.datetime.now(dt.timezone.utc).isoformat(timespec="seconds"),
+            },
+        )
+
+
+def checkpoint_inputs(args: argparse.Namespace, fields: Mapping[str, str], assets: Sequence[StoredAsset]) -> str:
+    payload = {
+        "fields": dict(fields),
+        "assets": [[asset.path, asset.sha256] for asset in assets],
+        "base_branch": args.base_branch,
+        "update": args.update,
+        "fast_checkout": args.fast_checkout,
+        "plumbing_commit": args.plumbing_commit,
+    }
+    return hashlib.sha256(json.dumps(payload, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    arg_parser = parser()
+    args = arg_parser.parse_args(argv)
+    recorder = enable_timings() if args.timings_json or args.timings_summary else None
+    command_timeout = args.command_timeout
+    if command_timeout is None and args.manifest:
+        command_timeout = DEFAULT_BATCH_COMMAND_TIMEOUT_SECONDS
+    configure_run_limits(command_timeout=command_timeout, overall_timeout=args.deadline, progress=args.progress)
+    try:
+        return run_cli(args, arg_parser)
+    finally:
+        if recorder is not None:
+            if args.timings_json:
+                timings = recorder.to_json()
+                timings["github_calls"] = _GITHUB_SCHEDULER.summary()
+                write_json(Path(args.timings_json).resolve(), timings)
+                print(f"[INFO] Timings written: {args.timings_json}")
+            if args.timings_summary:
+                print(recorder.format_summary(), file=sys.stderr)
+                if _GITHUB_SCHEDULER.summary():
+                    print(_GITHUB_SCHEDULER.format_summary(), file=sys.stderr)
+
+
+def run_cli(args: argparse.Namespace, arg_parser: argparse.ArgumentParser) -> int:
     target_repo = DEFAULT_TARGET_REPO
+
+    if args.single_pr and not args.manifest:
+        print("[ERROR] --single-pr is only supported with --manifest.", file=sys.stderr)
+        return 1
+    if args.manifest:
+        if args.single_pr and not args.render_only_dir:
+            return run_import(args, target_repo=target_repo)
+        if args.github_dry_run:
+            print("[ERROR] --manifest and --github-dry-run cannot be used together.", file=sys.stderr)
+            return 1
+        return run_batch(args, target_repo=target_repo)
+
+    missing = [
+        f"--{name.replace('_', '-')}" for name in REQUIRED_SUBMISSION_FIELDS if getattr(args, name) is None
+    ]
+    if missing:
+        arg_parser.error(f"the following arguments are required: {', '.join(missing)}")
+
     try:
         team_slug = slugify(args.team_name)
         project_slug = slugify(args.project_name)
@@ -570,6 +4503,30 @@ def main() -> int:
         print("[ERROR] --render-only-dir and --github-dry-run cannot be used together.", file=sys.stderr)
         return 1
 
+    if args.no_clone and not args.github_dry_run:
+        print("[ERROR] --no-clone is only supported with --github-dry-run.", file=sys.stderr)
+        return 1
+
+    if args.verify_links:
+        checker = open_link_checker(args)
+        try:
+            broken = broken_submission_links(checker, [submission_fields_from_args(args)])[0]
+        finally:
+            checker.close()
+        if broken:
+            for result in broken:
+                print(f"[ERROR] Broken link: {result.url} ({result.describe()})", file=sys.stderr)
+            return 1
+        print("[OK] Links verified.")
+
+    if args.github_dry_run and args.no_clone:
+        return run_light_github_dry_run(
+            args,
+            target_repo=target_repo,
+            team_slug=team_slug,
+            project_slug=project_slug,
+        )
+
     if args.github_dry_run:
         return run_github_dry_run(
             args,
@@ -581,89 +4538,198 @@ def main() -> int:
     if args.render_only_dir:
         try:
             output_root = Path(args.render_only_dir).resolve()
+            assets = assets_from_args(args)
             created_doc = create_submission_artifacts(
                 output_root,
-                team_name=args.team_name,
-                project_name=args.project_name,
-                repo_url=args.repo_url,
-                demo_url_or_run_method=args.demo_url_or_run_method,
-                problem_definition=args.problem_definition,
-                one_liner=args.one_liner,
-                team_roles=args.team_roles,
-                solution=args.solution,
-                tech_stack=args.tech_stack,
-                run_verify=args.run_verify,
-                demo_summary=args.demo_summary,
-                license_sources=args.license_sources,
-                ai_used=args.ai_used,
-                ai_validation_notes=args.ai_validation_notes,
-                presentation_url=args.presentation_url,
-                extra_links=args.extra_links,
+                **submission_fields_from_args(args),
                 update_existing=args.update,
+                assets=assets,
             )
             print("[OK] Render-only mode completed.")
             print(f"[OK] Document path: {created_doc}")
+            if assets:
+                print(f"[OK] Assets ingested: {len(assets)} file(s), {sum(asset.size for asset in assets)} bytes")
             return 0
         except Exception as error:
             print(f"[ERROR] {error}", file=sys.stderr)
             return 1
 
     temp_dir = Path(tempfile.mkdtemp(prefix="hackathon-submission-"))
+    mirror_cache = open_mirror_cache(args)
+    client = open_github_client(args)
+    github_cache = open_github_metadata_cache(args, client)
+    checkpoint: Optional[SubmissionCheckpoint] = None
+    mirror: Optional[Path] = None
     repo_path: Optional[Path] = None
     branch_name: Optional[str] = None
     login: Optional[str] = None
     commit_sha: Optional[str] = None
+    succeeded = False
     try:
-        ensure_gh_cli_and_auth()
-        login = run(["gh", "api", "user", "--jq", ".login"])
-        fork_repo = ensure_fork(target_repo, login, create_if_missing=True)
-        branch_name = create_branch_name(team_slug, project_slug)
-        repo_path = prepare_git_checkout(
-            temp_root=temp_dir,
+        fields = submission_fields_from_args(args)
+        # Size limits are checked and files hashed into the store before any GitHub step.
+        assets = assets_from_args(args)
+        checkpoint = SubmissionCheckpoint.open(
+            Path(args.cache_dir).expanduser(),
+            team_slug,
+            project_slug,
+            inputs=checkpoint_inputs(args, fields, assets),
+            resume=args.resume,
+        )
+        if mirror_cache:
+            mirror = mirror_cache.acquire(target_repo, args.base_branch)
+        # Duplicates and no-op resubmissions are decided from the upstream tree, in
+        # milliseconds, before paying for a clone, commit, push and PR.
+        slug_index = precheck_remote_slugs(
+            fields,
+            update_existing=args.update,
             target_repo=target_repo,
             base_branch=args.base_branch,
-            fork_repo=fork_repo,
-            branch_name=branch_name,
+            client=client,
+            mirror=mirror,
+            cache_dir=Path(args.cache_dir).expanduser(),
+            catalog=catalog_from_args(args),
         )
-        ensure_git_identity(repo_path)
+        # The document is rendered once: here for the change check, otherwise during preflight.
+        document: Optional[str] = None
+        if args.update:
+            document = render_submission(**fields)
+            unchanged, fingerprint = submission_unchanged_upstream(
+                fields,
+                target_repo=target_repo,
+                base_branch=args.base_branch,
+                client=client,
+                mirror=mirror,
+                assets=assets,
+                document=document,
+                remote=slug_index.doc_blobs(submission_doc_dir(team_slug, project_slug)) if slug_index else None,
+            )
+            if unchanged:
+                checkpoint.clear()
+                succeeded = True
+                print(f"[OK] No changes: the submission already matches {target_repo}@{args.base_branch}.")
+                print(f"[OK] Fingerprint: {fingerprint}")
+                return 0
+        if not checkpoint.branch:
+            checkpoint.branch = create_branch_name(team_slug, project_slug)
+        branch_name = checkpoint.branch
 
-        created_doc = create_submission_artifacts(
-            repo_path,
-            team_name=args.team_name,
-            project_name=args.project_name,
-            repo_url=args.repo_url,
-            demo_url_or_run_method=args.demo_url_or_run_method,
-            problem_definition=args.problem_definition,
-            one_liner=args.one_liner,
-            team_roles=args.team_roles,
-            solution=args.solution,
-            tech_stack=args.tech_stack,
-            run_verify=args.run_verify,
-            demo_summary=args.demo_summary,
-            license_sources=args.license_sources,
-            ai_used=args.ai_used,
-            ai_validation_notes=args.ai_validation_notes,
-            presentation_url=args.presentation_url,
-            extra_links=args.extra_links,
-            update_existing=args.update,
-        )
+        # A resumed checkout is only reused while it (and the commit recorded in it) still exists.
+        saved_checkout = checkpoint.done("checkout")
+        if saved_checkout and not checkpoint.done("push"):
+            if not Path(saved_checkout["repo_path"]).exists():
+                checkpoint.reset_from("checkout")
+            elif checkpoint.done("commit") and not run(
+                ["git", "rev-parse", "--verify", "--quiet", f"{checkpoint.stages['commit']['commit_sha']}^{{commit}}"],
+                cwd=Path(saved_checkout["repo_path"]),
+                check=False,
+            ):
+                checkpoint.reset_from("render")
 
-        commit_sha = commit_changes(
-            repo_path,
-            team_slug=team_slug,
-            project_slug=project_slug,
-            project_name=args.project_name,
-            team_name=args.team_name,
+        def github_step() -> str:
+            nonlocal login
+            saved = checkpoint.done("fork")
+            if saved:
+                login = saved["login"]
+                return saved["fork_repo"]
+            login = resolve_login(client, github_cache)
+            fork_repo = ensure_fork(target_repo, login, create_if_missing=True, client=client, cache=github_cache)
+            checkpoint.record("fork", login=login, fork_repo=fork_repo)
+            return fork_repo
+
+        def checkout_step() -> Optional[Path]:
+            nonlocal repo_path
+            if checkpoint.done("push"):
+                return None
+            saved = checkpoint.done("checkout")
+            if saved:
+                repo_path = Path(saved["repo_path"])
+                return repo_path
+            if args.plumbing_commit:
+                repo_path = prepare_bare_repo(
+                    temp_root=temp_dir,
+                    target_repo=target_repo,
+                    base_branch=args.base_branch,
+                    mirror=mirror,
+                )
+            else:
+                repo_path = prepare_git_checkout(
+                    temp_root=temp_dir,
+                    target_repo=target_repo,
+                    base_branch=args.base_branch,
+                    branch_name=branch_name,
+                    fast=args.fast_checkout,
+                    mirror=mirror,
+                )
+            ensure_git_identity(repo_path)
+            return repo_path
+
+        # Auth/fork lookup, the upstream checkout and rendering are independent, so they
+        # overlap; a failure in any of them cancels the others.
+        preflight = run_concurrently(
+            {
+                "github": github_step,
+                "checkout": checkout_step,
+                "render": lambda: document or render_submission(**fields),
+            }
         )
-        pr_url = create_or_get_pr(
-            repo_path=repo_path,
+        document = preflight["render"]
+        fork_repo: str = preflight["github"]
+        repo_path = preflight["checkout"]
+        if repo_path is not None and not checkpoint.done("checkout"):
+            attach_fork_remote(repo_path, fork_repo)
+            checkpoint.record("checkout", repo_path=str(repo_path), temp_dir=str(temp_dir))
+
+        saved_commit = checkpoint.done("commit")
+        if saved_commit:
+            created_doc: Union[str, Path] = saved_commit["document_path"]
+            commit_sha = saved_commit["commit_sha"]
+        elif args.plumbing_commit:
+            created_doc, commit_sha = commit_submission_without_checkout(
+                repo_path,
+                base_branch=args.base_branch,
+                branch_name=branch_name,
+                update_existing=args.update,
+                fields=fields,
+                assets=assets,
+                document=document,
+            )
+        else:
+            saved_render = checkpoint.done("render")
+            if saved_render:
+                created_doc = Path(saved_render["document_path"])
+            else:
+                created_doc = create_submission_artifacts(
+                    repo_path,
+                    **fields,
+                    update_existing=args.update,
+                    assets=assets,
+                    document=document,
+                )
+                checkpoint.record("render", document_path=str(created_doc))
+
+            commit_sha = commit_changes(
+                repo_path,
+                team_slug=team_slug,
+                project_slug=project_slug,
+                project_name=args.project_name,
+                team_name=args.team_name,
+            )
+        if not saved_commit:
+            checkpoint.record("commit", commit_sha=commit_sha, document_path=str(created_doc))
+        if not checkpoint.done("push"):
+            push_branch(repo_path, branch_name)
+            checkpoint.record("push", branch=branch_name)
+        pr_url = open_pull_request(
             target_repo=target_repo,
             base_branch=args.base_branch,
-            login=login,
-            branch_name=branch_name,
+            head=f"{login}:{branch_name}",
             project_name=args.project_name,
             team_name=args.team_name,
+            client=client,
         )
+        checkpoint.clear()
+        succeeded = True
 
         print("[OK] Submission document generated and PR created.")
         print(f"[OK] Document path: {created_doc}")
@@ -671,17 +4737,21 @@ def main() -> int:
         print(f"[OK] Branch: {branch_name}")
         print(f"[OK] PR URL: {pr_url}")
         return 0
+    except NoChangesError:
+        if checkpoint:
+            checkpoint.clear()
+        succeeded = True
+        print(f"[OK] No changes: the submission already matches {target_repo}@{args.base_branch}.")
+        return 0
     except Exception as error:
         print(f"[ERROR] {error}", file=sys.stderr)
+        forget_github_metadata(github_cache)
         if login and branch_name:
-            compare_url = (
-                f"https://github.com/{target_repo}/compare/"
-                f"{args.base_branch}...{login}:{branch_name}?expand=1"
-            )
+            compare_url = build_compare_url(target_repo, args.base_branch, login, branch_name)
             if repo_path and repo_path.exists():
                 if not commit_sha:
                     commit_sha = run(
-                        ["git", "rev-parse", "HEAD"],
+                        ["git", "rev-parse", "--verify", "--quiet", "HEAD"],
                         cwd=repo_path,
                         check=False,
                     )
@@ -690,12 +4760,28 @@ def main() -> int:
                 print(f"[FALLBACK] Commit SHA: {commit_sha}", file=sys.stderr)
             print(f"[FALLBACK] Branch: {branch_name}", file=sys.stderr)
             print(f"[FALLBACK] Manual PR URL: {compare_url}", file=sys.stderr)
+        if checkpoint and checkpoint.stages:
+            print(
+                f"[INFO] Progress saved; rerun with --resume to continue from the {checkpoint.next_stage()} step.",
+                file=sys.stderr,
+            )
         return 1
     finally:
-        if args.keep_temp:
-            print(f"[INFO] Temporary directory kept: {temp_dir}")
-        else:
-            shutil.rmtree(temp_dir, ignore_errors=True)
+        if client:
+            client.close()
+        if mirror_cache:
+            mirror_cache.release()
+        # A failed run keeps the checkout its checkpoint points at once there is a commit to
+        # push again (or when resuming); earlier stages are cheap to redo, so it is removed.
+        work_dir = checkpoint.work_dir() if checkpoint else None
+        keep_work_dir = not succeeded and checkpoint is not None and (args.resume or checkpoint.done("commit"))
+        for directory in {temp_dir, work_dir} - {None}:
+            if args.keep_temp:
+                print(f"[INFO] Temporary directory kept: {directory}")
+            elif directory == work_dir and keep_work_dir:
+                print(f"[INFO] Checkout kept for --resume: {directory}", file=sys.stderr)
+            else:
+                shutil.rmtree(directory, ignore_errors=True)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""Validate every submission document under contents/docs of a local checkout.
+
+Documents are checked with the same rules as create_submission_pr.py, across worker
+processes. Results are cached in ``<cache-dir>/lint-cache.json`` by path: a document whose
+mtime and size are unchanged is not re-read, one whose hash is unchanged is not re-checked,
+and the cache is dropped whenever the rules change.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import create_submission_pr as submission
+
+LINT_CACHE_VERSION = 2
+
+
+def lint_rules_fingerprint() -> str:
+    """Hash of the validation rules, so a rules change invalidates cached lint results."""
+    rules = [
+        str(LINT_CACHE_VERSION),
+        *sorted(submission.ALLOWED_FRONTMATTER_KEYS),
+        "|",
+        *sorted(submission.REQUIRED_FRONTMATTER_KEYS),
+        "|",
+        *submission.REQUIRED_SECTION_HEADERS,
+    ]
+    return hashlib.sha256("\n".join(rules).encode("utf-8")).hexdigest()
+
+
+def lint_document(path: str, known_sha256: str = "") -> Tuple[str, Optional[List[Tuple[int, str]]]]:
+    """Return (sha256, issues) for one document; issues is None when the hash is unchanged."""
+    data = Path(path).read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    if digest == known_sha256:
+        return digest, None
+    try:
+        issues = submission.document_issues(data.decode("utf-8"))
+    except UnicodeDecodeError as error:
+        issues = [submission.DocumentIssue(0, f"Document is not valid UTF-8: {error}")]
+    return digest, [(issue.line, issue.message) for issue in issues]
+
+
+class LintCache:
+    """On-disk lint results keyed by absolute path, validated by mtime/size then sha256."""
+
+    def __init__(self, path: Optional[Path]) -> None:
+        self.path = path
+        self.rules = lint_rules_fingerprint()
+        self.entries: Dict[str, Dict[str, object]] = {}
+        if path is None:
+            return
+        try:
+            payload = submission.load_json(path)
+        except (OSError, ValueError):
+            payload = {}
+        if payload.get("rules") == self.rules and isinstance(payload.get("entries"), dict):
+            self.entries = payload["entries"]  # type: ignore[assignment]
+
+    def lookup(self, path: Path, stat: os.stat_result) -> Tuple[Optional[List[Tuple[int, str]]], str]:
+        """Return (issues, sha256); issues is set only when mtime and size still match."""
+        entry = self.entries.get(str(path))
+        if not entry:
+            return None, ""
+        if entry.get("mtime_ns") == stat.st_mtime_ns and entry.get("size") == stat.st_size:
+            return [tuple(issue) for issue in entry["issues"]], str(entry["sha256"])  # type: ignore[misc]
+        return None, str(entry.get("sha256", ""))
+
+    def store(self, path: Path, stat: os.stat_result, sha256: str, issues: List[Tuple[int, str]]) -> None:
+        self.entries[str(path)] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": sha256,
+            "issues": [list(issue) for issue in issues],
+        }
+
+    def cached_issues(self, path: Path) -> List[Tuple[int, str]]:
+        return [tuple(issue) for issue in self.entries[str(path)]["issues"]]  # type: ignore[misc]
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        submission.write_json(self.path, {"rules": self.rules, "entries": self.entries})
+
+
+def parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        description="Validate every submission document under contents/docs of a local checkout."
+    )
+    p.add_argument(
+        "root",
+        nargs="?",
+        default=".",
+        help="Repository checkout (or a contents/docs directory) to lint. Defaults to the current directory.",
+    )
+    p.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Validation processes.")
+    p.add_argument("--cache-dir", default=str(submission.default_cache_dir()))
+    p.add_argument("--no-cache", action="store_true", help="Re-check every document and do not write the cache.")
+    p.add_argument("--json", dest="json_report", help="Write a JSON report to this path ('-' for stdout).")
+    return p
+
+
+def run_lint(args: argparse.Namespace) -> int:
+    root = Path(args.root).expanduser().resolve()
+    docs_root = root / "contents" / "docs"
+    if not docs_root.is_dir() and root.name == "docs":
+        docs_root, root = root, root.parents[1]
+    if not docs_root.is_dir():
+        print(f"[ERROR] contents/docs not found under {root}", file=sys.stderr)
+        return 1
+    if args.workers < 1:
+        print("[ERROR] --workers must be at least 1.", file=sys.stderr)
+        return 1
+
+    started = time.perf_counter()
+    cache = LintCache(None if args.no_cache else Path(args.cache_dir).expanduser() / "lint-cache.json")
+    with submission.phase("lint-walk"):
+        documents = submission.find_submission_documents(docs_root)
+
+    issues_by_path: Dict[Path, List[Tuple[int, str]]] = {}
+    pending: List[Tuple[Path, os.stat_result, str]] = []
+    for document in documents:
+        stat = document.stat()
+        cached, known_sha256 = cache.lookup(document, stat)
+        if cached is None:
+            pending.append((document, stat, known_sha256))
+        else:
+            issues_by_path[document] = cached
+
+    with submission.phase("lint-validate", documents=len(pending)):
+        paths = [str(document) for document, _, _ in pending]
+        hashes = [known_sha256 for _, _, known_sha256 in pending]
+        if args.workers > 1 and len(pending) > 1:
+            chunksize = max(1, len(pending) // (args.workers * 4))
+            with ProcessPoolExecutor(max_workers=min(args.workers, len(pending))) as pool:
+                outcomes = list(pool.map(lint_document, paths, hashes, chunksize=chunksize))
+        else:
+            outcomes = [lint_document(path, known) for path, known in zip(paths, hashes)]
+    for (document, stat, _), (sha256, issues) in zip(pending, outcomes):
+        if issues is None:
+            issues = cache.cached_issues(document)
+        cache.store(document, stat, sha256, issues)
+        issues_by_path[document] = issues
+
+    if not args.no_cache:
+        seen = {str(document) for document in documents}
+        docs_prefix = f"{docs_root}{os.sep}"
+        for stale in [key for key in cache.entries if key.startswith(docs_prefix) and key not in seen]:
+            del cache.entries[stale]
+        cache.save()
+
+    failing = 0
+    report_documents: List[Dict[str, object]] = []
+    for document in documents:
+        relative = document.relative_to(root).as_posix()
+        issues = issues_by_path[document]
+        if issues:
+            failing += 1
+        report_documents.append(
+            {"path": relative, "issues": [{"line": line, "message": message} for line, message in issues]}
+        )
+        if args.json_report != "-":
+            for line, message in issues:
+                location = f"{relative}:{line}" if line else relative
+                print(f"[ERROR] {location}: {message}", file=sys.stderr)
+
+    elapsed = time.perf_counter() - started
+    if args.json_report:
+        payload = {
+            "root": str(root),
+            "documents": len(documents),
+            "checked": len(pending),
+            "cached": len(documents) - len(pending),
+            "failing": failing,
+            "elapsed_seconds": round(elapsed, 3),
+            "results": report_documents,
+        }
+        if args.json_report == "-":
+            print(submission.dump_json(payload), end="")
+        else:
+            submission.write_json(Path(args.json_report).resolve(), payload)
+            print(f"[OK] Lint report: {args.json_report}")
+    if args.json_report != "-":
+        label = "OK" if not failing else "ERROR"
+        print(
+            f"[{label}] Linted {len(documents)} document(s) in {elapsed:.2f}s: "
+            f"{failing} with issues, {len(documents) - len(pending)} from cache.",
+            file=sys.stdout if not failing else sys.stderr,
+        )
+    return 0 if not failing else 1
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    return run_lint(parser().parse_args(argv))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Rebuild the contents/docs/vibe-coding meta.json navigation from the documents on disk.
+
+Team and project titles come from the header of each submission document; entries whose
+page no longer exists are pruned. Writes go through the same MetaTree as a submission, so
+only meta.json files whose content changes are rewritten.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import create_submission_pr as submission
+
+SUBMISSION_NAME_PATTERN = re.compile(r"^- (팀명|프로젝트명): (.+)$", re.MULTILINE)
+SUBMISSION_HEADER_BYTES = 4096
+
+
+def read_submission_names(doc_file: Path) -> Dict[str, str]:
+    """Return the team/project names from the header of a rendered submission document."""
+    with doc_file.open("rb") as file:
+        head = file.read(SUBMISSION_HEADER_BYTES).decode("utf-8", errors="ignore")
+    return {label: value.strip() for label, value in SUBMISSION_NAME_PATTERN.findall(head)}
+
+
+def is_navigation_entry(page: str, directory: Path) -> bool:
+    """Keep fumadocs special entries (separators, links, rest) and pages that exist on disk."""
+    if page.startswith(("...", "z...", "---", "[", "!")):
+        return True
+    return (directory / page).is_dir() or any(
+        (directory / f"{page}{suffix}").is_file() for suffix in (".mdx", ".md")
+    )
+
+
+def reindex_meta_tree(repo_root: Path) -> submission.MetaTree:
+    """Rebuild the vibe-coding navigation from the submission documents on disk, in one walk."""
+    tree = submission.MetaTree.on_disk(repo_root)
+    vibe_root = repo_root / "contents" / "docs" / "vibe-coding"
+    if not vibe_root.is_dir():
+        return tree
+    meta_dirs: List[Path] = [vibe_root]
+    with os.scandir(vibe_root) as team_entries:
+        team_dirs = sorted(entry.path for entry in team_entries if entry.is_dir() and not entry.name.startswith("."))
+    for team_dir in map(Path, team_dirs):
+        meta_dirs.append(team_dir)
+        with os.scandir(team_dir) as project_entries:
+            project_dirs = sorted(
+                entry.path for entry in project_entries if entry.is_dir() and not entry.name.startswith(".")
+            )
+        for project_dir in map(Path, project_dirs):
+            doc_file = project_dir / submission.DEFAULT_DOC_FILENAME
+            if not doc_file.is_file():
+                continue
+            meta_dirs.append(project_dir)
+            names = read_submission_names(doc_file)
+            tree.add_submission(
+                team_name=names.get("팀명", team_dir.name),
+                project_name=names.get("프로젝트명", project_dir.name),
+                team_slug=team_dir.name,
+                project_slug=project_dir.name,
+            )
+    for directory in meta_dirs:
+        meta_path = (directory / "meta.json").relative_to(repo_root).as_posix()
+        if (directory / "meta.json").exists() or directory == vibe_root:
+            tree.prune_pages(meta_path, directory.name, lambda page: is_navigation_entry(page, directory))
+    return tree
+
+
+def parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        description="Rebuild contents/docs/vibe-coding meta.json navigation from the submission documents."
+    )
+    p.add_argument("root", nargs="?", default=".", help="Repository checkout. Defaults to the current directory.")
+    p.add_argument("--check", action="store_true", help="Only report meta.json files that are out of date.")
+    return p
+
+
+def run_reindex(args: argparse.Namespace) -> int:
+    repo_root = Path(args.root).expanduser().resolve()
+    if not (repo_root / "contents" / "docs").is_dir():
+        print(f"[ERROR] contents/docs not found under {repo_root}", file=sys.stderr)
+        return 1
+    try:
+        tree = reindex_meta_tree(repo_root)
+    except (OSError, ValueError) as error:
+        print(f"[ERROR] {error}", file=sys.stderr)
+        return 1
+    if args.check:
+        stale = sorted(tree.dirty_files())
+        for meta_path in stale:
+            print(f"[ERROR] Out of date: {meta_path}", file=sys.stderr)
+        if not stale:
+            print("[OK] Navigation metadata is up to date.")
+        return 1 if stale else 0
+    written = tree.flush(repo_root)
+    for meta_path in written:
+        print(f"[OK] Updated: {meta_path}")
+    print(f"[OK] Reindex finished: {len(written)} meta.json file(s) updated.")
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    return run_reindex(parser().parse_args(argv))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+"""Keep a local SQLite catalog of the cohort's submissions for instant queries.
+
+The catalog covers ``contents/docs/vibe-coding`` (submission documents, the ``meta.json``
+titles of every team and project folder, asset files) and the team pages under
+``contents/team``. Tables:
+
+- ``documents``: one row per submission document or team page, with its slugs and title
+- ``frontmatter``: every frontmatter key of those documents
+- ``sections``: the ``## `` sections of submission documents (heading without ``## ``, raw body)
+- ``folders``: ``team`` and ``team/project`` folder slugs with their ``meta.json`` title
+- ``assets``: every file under a submission's ``assets/`` folder, with its category and size
+- ``files``: mtime, size and sha256 of every parsed file, for incremental updates
+
+Team pages only contribute frontmatter, so only their header bytes are read. Updates are
+incremental: a file whose mtime and size are unchanged is skipped, and a changed file whose
+hash is unchanged only has its stat refreshed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import create_submission_pr as submission
+
+CATALOG_VERSION = 2
+HEADER_CHUNK_BYTES = 4096
+MAX_HEADER_BYTES = 64 * 1024
+VIBE_CODING_DIR = "contents/docs/vibe-coding"
+TEAM_PAGES_DIR = "contents/team"
+SCHEMA = """
+CREATE TABLE catalog (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE files (path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, sha256 TEXT NOT NULL);
+CREATE TABLE documents (
+    path TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    team_slug TEXT NOT NULL,
+    project_slug TEXT,
+    title TEXT NOT NULL
+);
+CREATE INDEX documents_slugs ON documents (team_slug, project_slug);
+CREATE TABLE frontmatter (path TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, PRIMARY KEY (path, key));
+CREATE TABLE sections (
+    path TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    heading TEXT NOT NULL,
+    body TEXT NOT NULL,
+    PRIMARY KEY (path, position)
+);
+CREATE TABLE folders (slug TEXT PRIMARY KEY, title TEXT);
+CREATE TABLE assets (
+    path TEXT PRIMARY KEY,
+    team_slug TEXT NOT NULL,
+    project_slug TEXT NOT NULL,
+    category TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+"""
+
+
+def default_catalog_path(cache_dir: Path, repo_root: Path) -> Path:
+    return cache_dir / "catalog" / f"{hashlib.sha256(str(repo_root).encode('utf-8')).hexdigest()[:16]}.sqlite"
+
+
+def read_frontmatter_header(path: Path) -> bytes:
+    """Return the frontmatter block of ``path`` through its closing ``---``, reading no further.
+
+    Returns ``b""`` when the file does not start with a complete frontmatter block.
+    """
+    opening = (submission.FRONTMATTER_DELIMITER + "\n").encode("utf-8")
+    closing = ("\n" + submission.FRONTMATTER_DELIMITER + "\n").encode("utf-8")
+    with path.open("rb") as handle:
+        header = handle.read(HEADER_CHUNK_BYTES)
+        if not header.startswith(opening):
+            return b""
+        while True:
+            end = header.find(closing, len(opening))
+            if end >= 0:
+                return header[: end + len(closing)]
+            chunk = handle.read(HEADER_CHUNK_BYTES) if len(header) < MAX_HEADER_BYTES else b""
+            if not chunk:
+                return b""
+            header += chunk
+
+
+def clean_frontmatter(content: str) -> Dict[str, str]:
+    index = submission.DocumentIndex()
+    submission.scan_frontmatter(content, index)
+    return {key: value.strip().strip("\"'") for key, value in index.frontmatter.items()}
+
+
+def document_sections(content: str) -> List[Tuple[str, str]]:
+    """Return (heading, body) for every ``## `` section; headings inside code fences are ignored."""
+    lines = content.split("\n")
+    boundaries = submission.scan_document(content).heading_lines
+    sections = []
+    for position, (line, heading) in enumerate(boundaries):
+        end = boundaries[position + 1][0] - 1 if position + 1 < len(boundaries) else len(lines)
+        sections.append((heading[3:].strip(), "\n".join(lines[line:end]).strip()))
+    return sections
+
+
+class Tree:
+    """Files of a checkout that the catalog tracks, found with one scandir walk."""
+
+    def __init__(self, repo_root: Path) -> None:
+        self.submissions: Dict[str, os.stat_result] = {}
+        self.team_pages: Dict[str, os.stat_result] = {}
+        self.metas: Dict[str, os.stat_result] = {}
+        self.assets: Dict[str, os.stat_result] = {}
+        self.folders: List[str] = []
+        vibe_root = repo_root / VIBE_CODING_DIR
+        if vibe_root.is_dir():
+            self._walk(vibe_root, VIBE_CODING_DIR, ())
+        team_root = repo_root / TEAM_PAGES_DIR
+        if team_root.is_dir():
+            with os.scandir(team_root) as entries:
+                for entry in entries:
+                    if entry.name.endswith((".md", ".mdx")) and entry.is_file():
+                        self.team_pages[f"{TEAM_PAGES_DIR}/{entry.name}"] = entry.stat()
+
+    def _walk(self, directory: Path, relative: str, parts: Tuple[str, ...]) -> None:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                path = f"{relative}/{entry.name}"
+                if entry.is_dir(follow_symlinks=False):
+                    if len(parts) < 2:
+                        self.folders.append("/".join(parts + (entry.name,)))
+                    self._walk(Path(entry.path), path, parts + (entry.name,))
+                elif not entry.is_file():
+                    continue
+                elif len(parts) >= 3 and parts[2] == "assets":
+                    self.assets[path] = entry.stat()
+                elif entry.name == "meta.json" and 1 <= len(parts) <= 2:
+                    self.metas[path] = entry.stat()
+                elif entry.name == submission.DEFAULT_DOC_FILENAME and len(parts) == 2:
+                    self.submissions[path] = entry.stat()
+
+
+class Catalog:
+    """The SQLite catalog database; ``update`` brings it in line with a checkout."""
+
+    def __init__(self, path: Path, *, full: bool = False) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if full:
+            path.unlink(missing_ok=True)
+        self.connection = sqlite3.connect(str(path))
+        try:
+            row = self.connection.execute("SELECT value FROM catalog WHERE key = 'version'").fetchone()
+        except sqlite3.Error:
+            row = None
+        if row is None or row[0] != str(CATALOG_VERSION):
+            self._create()
+
+    def _create(self) -> None:
+        with self.connection:
+            tables = [row[0] for row in self.connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+            for table in tables:
+                self.connection.execute(f'DROP TABLE "{table}"')
+            self.connection.executescript(SCHEMA)
+            self.connection.execute("INSERT INTO catalog VALUES ('version', ?)", (str(CATALOG_VERSION),))
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def update(self, repo_root: Path) -> Dict[str, int]:
+        """Re-parse changed files under ``repo_root`` and drop removed ones, in one transaction."""
+        tree = Tree(repo_root)
+        rows = self.connection.execute("SELECT path, mtime_ns, size, sha256 FROM files")
+        known = {path: (mtime_ns, size, sha256) for path, mtime_ns, size, sha256 in rows}
+        stats = {"parsed": 0, "touched": 0, "removed": 0, "assets_changed": 0}
+        tracked = [
+            *((path, stat, self._parse_submission) for path, stat in tree.submissions.items()),
+            *((path, stat, self._parse_team_page) for path, stat in tree.team_pages.items()),
+            *((path, stat, self._parse_meta) for path, stat in tree.metas.items()),
+        ]
+        with self.connection:
+            folders = set(tree.folders)
+            stale_folders = {slug for (slug,) in self.connection.execute("SELECT slug FROM folders")} - folders
+            self.connection.executemany("DELETE FROM folders WHERE slug = ?", [(slug,) for slug in stale_folders])
+            self.connection.executemany("INSERT OR IGNORE INTO folders VALUES (?, NULL)", [(slug,) for slug in folders])
+
+            for path, stat, parse in tracked:
+                previous = known.pop(path, None)
+                if previous and previous[:2] == (stat.st_mtime_ns, stat.st_size):
+                    continue
+                sha256 = parse(repo_root / path, path, previous[2] if previous else "")
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)", (path, stat.st_mtime_ns, stat.st_size, sha256)
+                )
+                stats["parsed" if not previous or previous[2] != sha256 else "touched"] += 1
+            for path in known:
+                self._forget(path)
+                if path.endswith("/meta.json"):
+                    self.connection.execute(
+                        "UPDATE folders SET title = NULL WHERE slug = ?", (meta_folder_slug(path),)
+                    )
+                stats["removed"] += 1
+
+            stats["assets_changed"] = self._update_assets(tree.assets)
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO catalog VALUES (?, ?)",
+                [("root", str(repo_root)), ("built_at", str(time.time()))],
+            )
+        return stats
+
+    def _forget(self, path: str) -> None:
+        for table in ("files", "documents", "frontmatter", "sections"):
+            self.connection.execute(f"DELETE FROM {table} WHERE path = ?", (path,))
+
+    def _parse_submission(self, file_path: Path, path: str, previous_sha256: str) -> str:
+        raw = file_path.read_bytes()
+        sha256 = hashlib.sha256(raw).hexdigest()
+        if sha256 == previous_sha256:
+            return sha256
+        content = raw.decode("utf-8", errors="replace")
+        team_slug, project_slug = path[len(VIBE_CODING_DIR) + 1 :].split("/")[:2]
+        frontmatter = clean_frontmatter(content)
+        self._forget(path)
+        self._store_document(path, "submission", team_slug, project_slug, frontmatter.get("title", ""), frontmatter)
+        self.connection.executemany(
+            "INSERT INTO sections VALUES (?, ?, ?, ?)",
+            [(path, position, heading, body) for position, (heading, body) in enumerate(document_sections(content))],
+        )
+        return sha256
+
+    def _parse_team_page(self, file_path: Path, path: str, previous_sha256: str) -> str:
+        # Only the frontmatter is cataloged, so its bytes are all that is read and hashed.
+        header = read_frontmatter_header(file_path)
+        sha256 = hashlib.sha256(header).hexdigest()
+        if sha256 == previous_sha256:
+            return sha256
+        frontmatter = clean_frontmatter(header.decode("utf-8", errors="replace"))
+        self._forget(path)
+        title = frontmatter.get("name") or frontmatter.get("title", "")
+        self._store_document(path, "team", Path(path).stem, None, title, frontmatter)
+        return sha256
+
+    def _parse_meta(self, file_path: Path, path: str, previous_sha256: str) -> str:
+        raw = file_path.read_bytes()
+        sha256 = hashlib.sha256(raw).hexdigest()
+        if sha256 == previous_sha256:
+            return sha256
+        try:
+            payload = json.loads(raw)
+        except ValueError:
+            payload = {}
+        title = str(payload.get("title", "")).strip() if isinstance(payload, dict) else ""
+        self.connection.execute(
+            "UPDATE folders SET title = ? WHERE slug = ?", (title or None, meta_folder_slug(path))
+        )
+        return sha256
+
+    def _store_document(
+        self,
+        path: str,
+        kind: str,
+        team_slug: str,
+        project_slug: Optional[str],
+        title: str,
+        frontmatter: Dict[str, str],
+    ) -> None:
+        self.connection.execute(
+            "INSERT INTO documents VALUES (?, ?, ?, ?, ?)", (path, kind, team_slug, project_slug, title)
+        )
+        self.connection.executemany(
+            "INSERT INTO frontmatter VALUES (?, ?, ?)", [(path, key, value) for key, value in frontmatter.items()]
+        )
+
+    def _update_assets(self, assets: Dict[str, os.stat_result]) -> int:
+        known = {
+            path: (size, mtime_ns)
+            for path, size, mtime_ns in self.connection.execute("SELECT path, size, mtime_ns FROM assets")
+        }
+        removed = [(path,) for path in known.keys() - assets.keys()]
+        changed = []
+        for path, stat in assets.items():
+            if known.get(path) == (stat.st_size, stat.st_mtime_ns):
+                continue
+            team_slug, project_slug, _, category = path[len(VIBE_CODING_DIR) + 1 :].split("/")[:4]
+            if category == Path(path).name:
+                category = ""
+            changed.append((path, team_slug, project_slug, category, stat.st_size, stat.st_mtime_ns))
+        self.connection.executemany("DELETE FROM assets WHERE path = ?", removed)
+        self.connection.executemany("INSERT OR REPLACE INTO assets VALUES (?, ?, ?, ?, ?, ?)", changed)
+        return len(removed) + len(changed)
+
+
+def meta_folder_slug(path: str) -> str:
+    return path[len(VIBE_CODING_DIR) + 1 : -len("/meta.json")]
+
+
+def open_readonly(path: Path) -> sqlite3.Connection:
+    return sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+
+
+QUERIES = {
+    "submissions": (
+        "SELECT d.team_slug, d.project_slug, d.title, COALESCE(t.title, ''), COALESCE(p.title, '') "
+        "FROM documents d LEFT JOIN folders t ON t.slug = d.team_slug "
+        "LEFT JOIN folders p ON p.slug = d.team_slug || '/' || d.project_slug "
+        "WHERE d.kind = 'submission' AND (:team = '' OR d.team_slug = :team) ORDER BY d.team_slug, d.project_slug",
+        ("team_slug", "project_slug", "title", "team", "project"),
+    ),
+    "slugs": (
+        "SELECT slug, COALESCE(title, '') FROM folders ORDER BY slug",
+        ("slug", "title"),
+    ),
+    "teams": (
+        "SELECT d.team_slug, d.title, COALESCE(f.value, '') FROM documents d "
+        "LEFT JOIN frontmatter f ON f.path = d.path AND f.key = 'projectName' "
+        "WHERE d.kind = 'team' ORDER BY d.team_slug",
+        ("slug", "name", "project_name"),
+    ),
+    "search": (
+        "SELECT d.team_slug, d.project_slug, s.heading, s.body FROM sections s JOIN documents d ON d.path = s.path "
+        "WHERE instr(lower(s.body), lower(:text)) > 0 AND instr(s.heading, :section) > 0 "
+        "ORDER BY d.team_slug, d.project_slug, s.position",
+        ("team_slug", "project_slug", "heading", "body"),
+    ),
+    "assets": (
+        "SELECT team_slug, project_slug, COUNT(*), SUM(size) FROM assets "
+        "WHERE category != '' GROUP BY team_slug, project_slug HAVING SUM(size) >= :min_bytes "
+        "ORDER BY SUM(size) DESC, team_slug, project_slug",
+        ("team_slug", "project_slug", "files", "bytes"),
+    ),
+}
+
+
+def run_query(connection: sqlite3.Connection, name: str, **params: object) -> Tuple[Sequence[str], List[tuple]]:
+    sql, columns = QUERIES[name]
+    return columns, connection.execute(sql, params).fetchall()
+
+
+def print_rows(columns: Sequence[str], rows: List[tuple], *, as_json: bool) -> None:
+    if as_json:
+        print(json.dumps([dict(zip(columns, row)) for row in rows], ensure_ascii=False, indent=2))
+        return
+    for row in rows:
+        print("\t".join("" if value is None else " ".join(str(value).split()) for value in row))
+
+
+def iter_query_args(args: argparse.Namespace) -> Iterator[Tuple[str, object]]:
+    for key in ("team", "text", "section"):
+        if hasattr(args, key):
+            yield key, getattr(args, key) or ""
+    if hasattr(args, "min_mib"):
+        yield "min_bytes", int(args.min_mib * 1024 * 1024)
+
+
+def parser() -> argparse.ArgumentParser:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--root", default=".", help="Repository checkout. Defaults to the current directory.")
+    common.add_argument("--db", help="Catalog database (default: a file per checkout under --cache-dir/catalog).")
+    common.add_argument("--cache-dir", default=str(submission.default_cache_dir()))
+    query = argparse.ArgumentParser(add_help=False, parents=[common])
+    query.add_argument("--json", action="store_true", help="Print rows as JSON objects.")
+
+    p = argparse.ArgumentParser(description="Build and query the SQLite catalog of hackathon submissions.")
+    commands = p.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", parents=[common], help="Create or incrementally update the catalog.")
+    build.add_argument("--full", action="store_true", help="Discard the catalog and parse every file again.")
+
+    listing = commands.add_parser("submissions", parents=[query], help="List submitted projects.")
+    listing.add_argument("--team", help="Only this team slug.")
+    commands.add_parser("slugs", parents=[query], help="List team and team/project folder slugs with titles.")
+    commands.add_parser("teams", parents=[query], help="List the team pages under contents/team.")
+    search = commands.add_parser("search", parents=[query], help="Find submission sections containing TEXT.")
+    search.add_argument("text")
+    search.add_argument("--section", help="Only sections whose heading contains this, e.g. '기술 스택'.")
+    assets = commands.add_parser("assets", parents=[query], help="Asset file counts and bytes per submission.")
+    assets.add_argument("--min-mib", type=float, default=0.0, help="Only submissions with at least this many MiB.")
+    sql = commands.add_parser("sql", parents=[query], help="Run a read-only SQL query.")
+    sql.add_argument("query")
+    return p
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parser().parse_args(argv)
+    repo_root = Path(args.root).expanduser().resolve()
+    db_path = (
+        Path(args.db).expanduser()
+        if args.db
+        else default_catalog_path(Path(args.cache_dir).expanduser(), repo_root)
+    )
+    if args.command == "build":
+        if not (repo_root / VIBE_CODING_DIR).is_dir() and not (repo_root / TEAM_PAGES_DIR).is_dir():
+            print(f"[ERROR] Neither {VIBE_CODING_DIR} nor {TEAM_PAGES_DIR} found under {repo_root}", file=sys.stderr)
+            return 1
+        started = time.perf_counter()
+        try:
+            catalog = Catalog(db_path, full=args.full)
+            try:
+                stats = catalog.update(repo_root)
+            finally:
+                catalog.close()
+        except (OSError, sqlite3.Error) as error:
+            print(f"[ERROR] {error}", file=sys.stderr)
+            return 1
+        print(
+            f"[OK] Catalog {db_path} updated in {time.perf_counter() - started:.3f}s: {stats['parsed']} parsed, "
+            f"{stats['touched']} unchanged after hashing, {stats['removed']} removed, "
+            f"{stats['assets_changed']} asset change(s)"
+        )
+        return 0
+
+    if not db_path.is_file():
+        print(f"[ERROR] No catalog at {db_path}; run the build command first.", file=sys.stderr)
+        return 1
+    try:
+        connection = open_readonly(db_path)
+        try:
+            if args.command == "sql":
+                cursor = connection.execute(args.query)
+                columns: Sequence[str] = [column[0] for column in cursor.description or ()]
+                rows = cursor.fetchall()
+            else:
+                columns, rows = run_query(connection, args.command, **dict(iter_query_args(args)))
+        finally:
+            connection.close()
+    except sqlite3.Error as error:
+        print(f"[ERROR] {error}", file=sys.stderr)
+        return 1
+    print_rows(columns, rows, as_json=args.json)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+"""Resident submission service: queue render/validate/submit jobs and run them on warm workers."""
+
+from __future__ import annotations
+
+import argparse
+import hmac
+import json
+import os
+import queue
+import secrets
+import shutil
+import signal
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Tuple
+
+import create_submission_pr as submission
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_WORKERS = 4
+DEFAULT_QUEUE_SIZE = 64
+DEFAULT_COMMAND_TIMEOUT_SECONDS = 600
+MIRROR_REFRESH_SECONDS = 30
+RETRY_AFTER_SECONDS = 5
+MAX_REQUEST_BYTES = 1024 * 1024
+FINISHED_JOBS_KEPT = 1000
+LATENCY_SAMPLES_KEPT = 1000
+JOB_KINDS = ("render", "validate", "submit")
+# Failures that mean the cached login or fork no longer work (revoked token, deleted fork).
+AUTH_ERROR_MARKERS = (
+    "(401)",
+    "(403)",
+    "HTTP 401",
+    "HTTP 403",
+    "Bad credentials",
+    "Authentication failed",
+    "could not read Username",
+    "Permission to",
+    "Repository not found",
+    "does not appear to be a git repository",
+)
+
+
+@dataclass
+class Job:
+    id: str
+    kind: str
+    payload: Dict[str, object]
+    status: str = "queued"
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Dict[str, object] = field(default_factory=dict)
+    error: str = ""
+
+    def to_json(self) -> Dict[str, object]:
+        data = asdict(self)
+        del data["payload"]
+        return data
+
+
+class LatencyWindow:
+    """Recent queue-wait and run durations for one job kind."""
+
+    def __init__(self) -> None:
+        self.wait: Deque[float] = deque(maxlen=LATENCY_SAMPLES_KEPT)
+        self.run: Deque[float] = deque(maxlen=LATENCY_SAMPLES_KEPT)
+
+    @staticmethod
+    def percentiles(samples: Deque[float]) -> Dict[str, float]:
+        if not samples:
+            return {"count": 0}
+        ordered = sorted(samples)
+        pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))]  # noqa: E731
+        return {
+            "count": len(ordered),
+            "p50_seconds": round(pick(0.50), 4),
+            "p95_seconds": round(pick(0.95), 4),
+            "max_seconds": round(ordered[-1], 4),
+        }
+
+    def summary(self) -> Dict[str, object]:
+        return {"queue_wait": self.percentiles(self.wait), "run": self.percentiles(self.run)}
+
+
+class GitHubSession:
+    """Warm GitHub state shared by submit jobs: REST client, login, fork and upstream mirror."""
+
+    def __init__(self, args: argparse.Namespace) -> None:
+        self.args = args
+        self.target_repo = submission.DEFAULT_TARGET_REPO
+        self.client = submission.open_github_client(args)
+        self.mirror_cache = (
+            submission.MirrorCache(Path(args.cache_dir).expanduser()) if not args.no_mirror else None
+        )
+        self.login = ""
+        self.fork_repo = ""
+        self.mirror: Optional[Path] = None
+        self._mirror_refreshed_at = 0.0
+        self._lock = threading.Lock()
+
+    def identity(self) -> Tuple[str, str]:
+        with self._lock:
+            if not self.fork_repo:
+                login = submission.resolve_login(self.client)
+                self.fork_repo = submission.ensure_fork(
+                    self.target_repo, login, create_if_missing=True, client=self.client
+                )
+                self.login = login
+            return self.login, self.fork_repo
+
+    def forget_identity(self) -> None:
+        """Drop the cached login and fork so the next submit job looks them up again."""
+        with self._lock:
+            self.login = ""
+            self.fork_repo = ""
+
+    def fresh_mirror(self) -> Optional[Path]:
+        """Return the upstream mirror, fetching new base-branch commits at most every few seconds.
+
+        The fetch runs under the mirror's exclusive lock, so it waits for every job that still
+        borrows the mirror's objects (see borrow_mirror) and no job starts a clone during it.
+        """
+        if self.mirror_cache is None:
+            return None
+        with self._lock:
+            if self.mirror is None or time.monotonic() - self._mirror_refreshed_at > MIRROR_REFRESH_SECONDS:
+                self.mirror = self.mirror_cache.acquire(self.target_repo, self.args.base_branch)
+                self._mirror_refreshed_at = time.monotonic()
+            return self.mirror
+
+    @staticmethod
+    def borrow_mirror(mirror: Optional[Path]) -> Optional[submission.FileLock]:
+        """Take a shared lock on ``mirror`` for one job's clone through push."""
+        return submission.MirrorCache.borrow(mirror) if mirror is not None else None
+
+    def close(self) -> None:
+        if self.client:
+            self.client.close()
+        if self.mirror_cache:
+            self.mirror_cache.release()
+
+
+class SubmissionService:
+    def __init__(self, args: argparse.Namespace) -> None:
+        self.args = args
+        self.queue: "queue.Queue[Optional[Job]]" = queue.Queue(maxsize=args.queue_size)
+        self.jobs: Dict[str, Job] = {}
+        self.finished: Deque[str] = deque()
+        self.latency: Dict[str, LatencyWindow] = {kind: LatencyWindow() for kind in JOB_KINDS}
+        self.counters: Dict[str, int] = {"accepted": 0, "rejected": 0, "succeeded": 0, "failed": 0}
+        self.busy = 0
+        self.started_at = time.time()
+        self.temp_root = Path(tempfile.mkdtemp(prefix="hackathon-submission-service-"))
+        self.github: Optional[GitHubSession] = None
+        self._lock = threading.Lock()
+        self._workers = [
+            threading.Thread(target=self._work, name=f"submission-worker-{index}", daemon=True)
+            for index in range(args.workers)
+        ]
+        # Compile the template up front so the first request does not pay for it.
+        submission.load_compiled_template(Path(submission.__file__).resolve().parents[1])
+
+    def start(self) -> None:
+        for worker in self._workers:
+            worker.start()
+
+    def stop(self) -> None:
+        for _ in self._workers:
+            self.queue.put(None)
+        for worker in self._workers:
+            worker.join()
+        if self.github:
+            self.github.close()
+        shutil.rmtree(self.temp_root, ignore_errors=True)
+
+    def submit(self, kind: str, payload: Dict[str, object]) -> Optional[Job]:
+        """Queue a job, or return None when the queue is full (the caller answers 503)."""
+        job = Job(id=secrets.token_hex(8), kind=kind, payload=payload)
+        with self._lock:
+            try:
+                self.queue.put_nowait(job)
+            except queue.Full:
+                self.counters["rejected"] += 1
+                return None
+            self.jobs[job.id] = job
+            self.counters["accepted"] += 1
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self.jobs.get(job_id)
+
+    def metrics(self) -> Dict[str, object]:
+        with self._lock:
+            statuses: Dict[str, int] = {}
+            for job in self.jobs.values():
+                statuses[job.status] = statuses.get(job.status, 0) + 1
+            return {
+                "uptime_seconds": round(time.time() - self.started_at, 1),
+                "queue_depth": self.queue.qsize(),
+                "queue_capacity": self.args.queue_size,
+                "workers": len(self._workers),
+                "busy_workers": self.busy,
+                "jobs": statuses,
+                "counters": dict(self.counters),
+                "latency": {kind: window.summary() for kind, window in self.latency.items()},
+            }
+
+    def _work(self) -> None:
+        while True:
+            job = self.queue.get()
+            if job is None:
+                return
+            with self._lock:
+                self.busy += 1
+                job.status = "running"
+                job.started_at = time.time()
+            try:
+                job.result = self._run(job)
+                status = "failed" if job.result.get("status") in {"failed", "invalid"} else "succeeded"
+                job.error = str(job.result.get("error", ""))
+            except Exception as error:
+                status, job.error = "failed", str(error)
+            with self._lock:
+                self.busy -= 1
+                job.status = status
+                job.finished_at = time.time()
+                self.counters[status] += 1
+                window = self.latency[job.kind]
+                window.wait.append(job.started_at - job.created_at)
+                window.run.append(job.finished_at - job.started_at)
+                self.finished.append(job.id)
+                while len(self.finished) > FINISHED_JOBS_KEPT:
+                    self.jobs.pop(self.finished.popleft(), None)
+
+    def _run(self, job: Job) -> Dict[str, object]:
+        if job.kind == "validate":
+            issues = submission.document_issues(str(job.payload.get("document", "")))
+            return {"valid": not issues, "issues": [asdict(issue) for issue in issues]}
+
+        fields = submission.manifest_row_fields(
+            submission.normalize_manifest_row(job.payload.get("fields") or {})  # type: ignore[arg-type]
+        )
+        if job.kind == "render":
+            team_slug = submission.slugify(fields["team_name"])
+            project_slug = submission.slugify(fields["project_name"])
+            return {
+                "document_path": (
+                    f"{submission.submission_doc_dir(team_slug, project_slug)}/{submission.DEFAULT_DOC_FILENAME}"
+                ),
+                "document": submission.render_submission(**fields),
+            }
+        return self._submit(job, fields)
+
+    def _submit(self, job: Job, fields: Dict[str, str]) -> Dict[str, object]:
+        with self._lock:
+            if self.github is None:
+                self.github = GitHubSession(self.args)
+        github = self.github
+        update_existing = submission.parse_bool(job.payload.get("update", False))
+        result = submission.BatchResult(
+            row=0,
+            team_name=fields["team_name"],
+            project_name=fields["project_name"],
+            team_slug=submission.slugify(fields["team_name"]),
+            project_slug=submission.slugify(fields["project_name"]),
+        )
+        login, fork_repo = github.identity()
+        # Refresh (exclusive lock) before borrowing (shared lock): the other order would make
+        # this job wait on its own lock.
+        mirror = github.fresh_mirror()
+        mirror_lock = github.borrow_mirror(mirror)
+        job_root = self.temp_root / job.id
+        try:
+            submission.precheck_remote_slugs(
+                fields,
+                update_existing=update_existing,
+                target_repo=github.target_repo,
+                base_branch=self.args.base_branch,
+                client=github.client,
+                mirror=mirror,
+                cache_dir=Path(self.args.cache_dir).expanduser(),
+            )
+            submission.submit_batch_row(
+                result,
+                fields,
+                update_existing=update_existing,
+                temp_root=job_root,
+                target_repo=github.target_repo,
+                base_branch=self.args.base_branch,
+                login=login,
+                fork_repo=fork_repo,
+                fast_checkout=mirror is None,
+                mirror=mirror,
+                client=github.client,
+            )
+        finally:
+            if mirror_lock is not None:
+                mirror_lock.release()
+            shutil.rmtree(job_root, ignore_errors=True)
+        if result.status == "failed" and is_auth_error(result.error):
+            github.forget_identity()
+        return asdict(result)
+
+
+def is_auth_error(message: str) -> bool:
+    return any(marker in message for marker in AUTH_ERROR_MARKERS)
+
+
+class ServiceHandler(BaseHTTPRequestHandler):
+    server_version = "hackathon-submission-service"
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def service(self) -> SubmissionService:
+        return self.server.service  # type: ignore[attr-defined]
+
+    def log_message(self, format: str, *args: object) -> None:
+        if self.service.args.verbose:
+            sys.stderr.write(f"[INFO] {self.command} {self.path} {format % args}\n")
+
+    def send_json(
+        self, status: int, payload: object, headers: Optional[Dict[str, str]] = None, *, close: bool = False
+    ) -> None:
+        """Send a JSON response; ``close`` ends the connection, e.g. when the request body was left unread."""
+        raw = (json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(raw)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        if close:
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def authorized(self, *, close: bool = False) -> bool:
+        token = self.service.args.auth_token
+        if not token:
+            return True
+        supplied = self.headers.get("Authorization", "")
+        if hmac.compare_digest(supplied.encode("utf-8"), f"Bearer {token}".encode("utf-8")):
+            return True
+        self.send_json(401, {"error": "Missing or invalid bearer token."}, close=close)
+        return False
+
+    def do_GET(self) -> None:
+        if self.path == "/healthz":
+            self.send_json(200, {"status": "ok"})
+            return
+        if not self.authorized():
+            return
+        if self.path == "/metrics":
+            self.send_json(200, self.service.metrics())
+            return
+        if self.path.startswith("/jobs/"):
+            job = self.service.get(self.path[len("/jobs/") :])
+            if job is None:
+                self.send_json(404, {"error": "Unknown job."})
+            else:
+                self.send_json(200, job.to_json())
+            return
+        self.send_json(404, {"error": "Not found."})
+
+    def do_POST(self) -> None:
+        # Until the body is read, an error response must close the connection: on keep-alive the
+        # unread body bytes would otherwise be parsed as the next request.
+        if not self.authorized(close=True):
+            return
+        if self.path != "/jobs":
+            self.send_json(404, {"error": "Not found."}, close=True)
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.send_json(400, {"error": "Invalid Content-Length."}, close=True)
+            return
+        if length > MAX_REQUEST_BYTES:
+            self.send_json(413, {"error": f"Request body exceeds {MAX_REQUEST_BYTES} bytes."}, close=True)
+            return
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self.send_json(400, {"error": "Request body must be JSON."})
+            return
+        kind = payload.get("kind") if isinstance(payload, dict) else None
+        if kind not in JOB_KINDS:
+            self.send_json(400, {"error": f"kind must be one of: {', '.join(JOB_KINDS)}"})
+            return
+        job = self.service.submit(kind, payload)
+        if job is None:
+            self.send_json(
+                503,
+                {"error": "Job queue is full, retry later."},
+                headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+            )
+            return
+        self.send_json(202, {"id": job.id, "status": job.status}, headers={"Location": f"/jobs/{job.id}"})
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):  # type: ignore[no-untyped-def]
+        request, _ = super().get_request()
+        # BaseHTTPRequestHandler expects an (address, port) pair.
+        return request, ("unix", 0)
+
+
+def parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description="Serve render/validate/submit jobs for hackathon submissions.")
+    p.add_argument("--host", default=DEFAULT_HOST)
+    p.add_argument("--port", type=int, default=DEFAULT_PORT)
+    p.add_argument("--unix-socket", help="Listen on this Unix socket instead of TCP.")
+    p.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    p.add_argument("--queue-size", type=int, default=DEFAULT_QUEUE_SIZE)
+    p.add_argument("--auth-token", default=os.environ.get("SUBMISSION_SERVICE_TOKEN", ""))
+    p.add_argument("--base-branch", default=submission.DEFAULT_BASE_BRANCH)
+    p.add_argument("--cache-dir", default=str(submission.default_cache_dir()))
+    p.add_argument("--no-mirror", action="store_true", help="Use shallow fetches instead of a warm upstream mirror.")
+    p.add_argument("--github-api-url", default=os.environ.get("GITHUB_API_URL", submission.DEFAULT_GITHUB_API_URL))
+    p.add_argument("--use-gh-cli", action="store_true")
+    p.add_argument("--command-timeout", type=float, default=DEFAULT_COMMAND_TIMEOUT_SECONDS)
+    p.add_argument("--verbose", action="store_true", help="Log every request to stderr.")
+    return p
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parser().parse_args(argv)
+    if args.workers < 1 or args.queue_size < 1:
+        print("[ERROR] --workers and --queue-size must be at least 1.", file=sys.stderr)
+        return 1
+    submission.configure_run_limits(command_timeout=args.command_timeout)
+    service = SubmissionService(args)
+    if args.unix_socket:
+        socket_path = Path(args.unix_socket)
+        socket_path.unlink(missing_ok=True)
+        server: socketserver.BaseServer = UnixHTTPServer(str(socket_path), ServiceHandler)
+        address = f"unix:{socket_path}"
+    else:
+        server = ThreadingHTTPServer((args.host, args.port), ServiceHandler)
+        address = f"http://{args.host}:{server.server_address[1]}"  # type: ignore[attr-defined]
+    server.service = service  # type: ignore[attr-defined]
+
+    def shut_down(signum: int, frame: object) -> None:
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, shut_down)
+    signal.signal(signal.SIGINT, shut_down)
+    service.start()
+    print(f"[OK] Submission service listening on {address} ({args.workers} workers).", flush=True)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        service.stop()
+        if args.unix_socket:
+            Path(args.unix_socket).unlink(missing_ok=True)
+        print("[OK] Submission service stopped.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())